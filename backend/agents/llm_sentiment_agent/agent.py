@@ -4,7 +4,7 @@ LLM Sentiment Agent - Main agent implementation.
 
 import logging
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 from core.interfaces.base_agent import BaseAgent
 
 # Import components
@@ -15,6 +15,10 @@ from .interfaces import SentimentScore
 
 logger = logging.getLogger(__name__)
 
+# Naive UTC epoch, matching datetime.utcnow()
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
 
 class LLMSentimentAgent(BaseAgent):
     """
@@ -209,7 +213,8 @@ class LLMSentimentAgent(BaseAgent):
                 "confidence": float (0.0 to 1.0),
                 "reasoning": str,
                 "cached": bool,
-                "processed_at": str
+                "processed_at": str,
+                "processed_at_ts": int (nanoseconds since the epoch)
             }
         
         Example:
@@ -218,6 +223,11 @@ class LLMSentimentAgent(BaseAgent):
         """
         article_id = article.get("id", f"article_{hash(article.get('title', ''))}")
         
+        # Timestamp emitted both as ISO string and as epoch nanoseconds, so
+        # the Sentiment Aggregator can weight by age without parsing strings
+        processed_at = datetime.utcnow()
+        processed_at_ts = (processed_at - _EPOCH) // _ONE_MICROSECOND * 1000
+        
         # Step 1: Check cache
         if use_cache and self.cache_manager:
             cached_result = self.cache_manager.get_cached_sentiment(article, symbol)
@@ -231,7 +241,8 @@ class LLMSentimentAgent(BaseAgent):
                     "confidence": cached_result.get("confidence", 0.7),
                     "reasoning": cached_result.get("reasoning", "Cached from similar article"),
                     "cached": True,
-                    "processed_at": datetime.utcnow().isoformat() + "Z"
+                    "processed_at": processed_at.isoformat() + "Z",
+                    "processed_at_ts": processed_at_ts
                 }
         
         # Step 2: Cache miss - analyze with GPT-4
@@ -255,7 +266,8 @@ class LLMSentimentAgent(BaseAgent):
             "confidence": llm_result.get("confidence", 0.7),
             "reasoning": llm_result.get("reasoning", ""),
             "cached": False,
-            "processed_at": datetime.utcnow().isoformat() + "Z"
+            "processed_at": processed_at.isoformat() + "Z",
+            "processed_at_ts": processed_at_ts
         }
     
     def batch_analyze(self, articles: List[Dict[str, Any]], symbol: str) -> List[Dict[str, Any]]:
@@ -3,6 +3,7 @@ Public interfaces for the LLM Sentiment Agent.
 """
 
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -14,5 +15,6 @@ class SentimentScore(BaseModel):
     sentiment_label: str  # positive, neutral, negative
     confidence: float  # 0.0 to 1.0
     processed_at: datetime
+    processed_at_ts: Optional[int] = None  # processed_at in nanoseconds since the epoch
     cached: bool  # Whether result was from cache
 
@@ -0,0 +1,182 @@
+"""
+Unit Tests for News Fetch Agent Utilities
+
+This module contains tests for shared utilities:
+- retry_with_backoff / retry_with_backoff_async
+- DateRangeCalculator
+
+Test Coverage:
+- Delay schedule
+- Retry on failure
+- Max retries
+- Horizon windows and expansion
+- API date formatting
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from ..utils import DateRangeCalculator, retry_with_backoff, retry_with_backoff_async
+from ..utils.retry import _delay_schedule
+
+
+class TestRetry:
+    """
+    Test suite for retry utilities.
+    """
+
+    def test_delay_schedule(self):
+        """Delays grow by backoff_factor and are capped at max_delay."""
+        delays = _delay_schedule(4, initial_delay=1.0, backoff_factor=2.0, max_delay=5.0)
+
+        assert delays == [1.0, 2.0, 4.0, 5.0]
+
+    def test_retry_success_first_attempt(self):
+        """Successful function is called once."""
+        call_count = [0]
+
+        @retry_with_backoff(max_retries=3)
+        def successful_func():
+            call_count[0] += 1
+            return "success"
+
+        assert successful_func() == "success"
+        assert call_count[0] == 1
+
+    def test_retry_on_failure(self):
+        """Failed calls are retried and the callback sees each attempt."""
+        call_count = [0]
+        retries = []
+
+        @retry_with_backoff(
+            max_retries=3,
+            initial_delay=0.01,
+            on_retry=lambda e, attempt: retries.append(attempt)
+        )
+        def flaky_func():
+            call_count[0] += 1
+            if call_count[0] < 3:
+                raise ConnectionError("Temporary failure")
+            return "success"
+
+        assert flaky_func() == "success"
+        assert call_count[0] == 3
+        assert retries == [1, 2]
+
+    def test_retry_unlisted_exception_not_retried(self):
+        """Exceptions outside `exceptions` propagate immediately."""
+        call_count = [0]
+
+        @retry_with_backoff(max_retries=3, initial_delay=0.01, exceptions=(ConnectionError,))
+        def bad_func():
+            call_count[0] += 1
+            raise KeyError("bad")
+
+        with pytest.raises(KeyError):
+            bad_func()
+
+        assert call_count[0] == 1
+
+    def test_retry_max_attempts(self):
+        """Retry stops after max_retries + 1 attempts."""
+        call_count = [0]
+
+        @retry_with_backoff(max_retries=2, initial_delay=0.01)
+        def always_failing_func():
+            call_count[0] += 1
+            raise ValueError("Always fails")
+
+        with pytest.raises(ValueError, match="Always fails"):
+            always_failing_func()
+
+        assert call_count[0] == 3
+
+    def test_async_retry_on_failure(self):
+        """Async variant retries the coroutine until it succeeds."""
+        call_count = [0]
+        retries = []
+
+        @retry_with_backoff_async(
+            max_retries=2,
+            initial_delay=0.01,
+            on_retry=lambda e, attempt: retries.append(attempt)
+        )
+        async def flaky_func():
+            call_count[0] += 1
+            if call_count[0] < 2:
+                raise ConnectionError("Temporary failure")
+            return "success"
+
+        assert asyncio.run(flaky_func()) == "success"
+        assert call_count[0] == 2
+        assert retries == [1]
+
+    def test_async_retry_max_attempts(self):
+        """Async variant re-raises after the last attempt."""
+        call_count = [0]
+
+        @retry_with_backoff_async(max_retries=1, initial_delay=0.01)
+        async def always_failing_func():
+            call_count[0] += 1
+            raise ValueError("Always fails")
+
+        with pytest.raises(ValueError, match="Always fails"):
+            asyncio.run(always_failing_func())
+
+        assert call_count[0] == 2
+
+
+class TestDateRangeCalculator:
+    """
+    Test suite for DateRangeCalculator.
+    """
+
+    FROM_DATE = datetime(2024, 1, 5, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    TO_DATE = datetime(2024, 1, 8, 13, 4, 5, tzinfo=timezone.utc)
+
+    def test_calculate_window(self):
+        """Each horizon maps to its configured window ending at current_time."""
+        from_date, to_date = DateRangeCalculator.calculate("1d", current_time=self.TO_DATE)
+
+        assert to_date == self.TO_DATE
+        assert to_date - from_date == timedelta(days=3)
+
+    def test_calculate_normalizes_horizon(self):
+        """Horizons are matched case- and whitespace-insensitively."""
+        from_date, to_date = DateRangeCalculator.calculate(" 1H ", current_time=self.TO_DATE)
+
+        assert to_date - from_date == timedelta(hours=6)
+
+    def test_calculate_unsupported_horizon(self):
+        """Unknown horizons raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported time_horizon"):
+            DateRangeCalculator.calculate("2d", current_time=self.TO_DATE)
+
+    def test_expand_window(self):
+        """The window grows by the multiplier and keeps to_date."""
+        from_date = self.TO_DATE - timedelta(minutes=15)
+
+        expanded_from, to_date = DateRangeCalculator.expand_window("1m", from_date, self.TO_DATE)
+
+        assert to_date == self.TO_DATE
+        assert to_date - expanded_from == timedelta(minutes=22, seconds=30)
+
+    def test_format_for_api_finnhub(self):
+        """Finnhub gets plain YYYY-MM-DD dates."""
+        dates = DateRangeCalculator.format_for_api(self.FROM_DATE, self.TO_DATE, "finnhub")
+
+        assert dates == {"from": "2024-01-05", "to": "2024-01-08"}
+
+    def test_format_for_api_newsapi(self):
+        """NewsAPI gets second precision without a UTC offset."""
+        dates = DateRangeCalculator.format_for_api(self.FROM_DATE, self.TO_DATE, "newsapi")
+
+        assert dates == {"from": "2024-01-05T03:04:05", "to": "2024-01-08T13:04:05"}
+
+    def test_format_for_api_iso_default(self):
+        """Unknown formats fall back to full ISO 8601."""
+        dates = DateRangeCalculator.format_for_api(self.FROM_DATE, self.TO_DATE, "other")
+
+        assert dates["from"] == self.FROM_DATE.isoformat()
+        assert dates["to"] == self.TO_DATE.isoformat()
@@ -17,7 +17,7 @@ from .sector_mapper import SectorMapper
 from .date_range_calculator import DateRangeCalculator
 
 from .logger import get_logger
-from .retry import retry_with_backoff, retry_api_request
+from .retry import retry_with_backoff, retry_with_backoff_async, retry_api_request
 
 __all__ = [
     "DataNormalizer",
@@ -25,6 +25,7 @@ __all__ = [
     "DateRangeCalculator",
     "get_logger",
     "retry_with_backoff",
+    "retry_with_backoff_async",
     "retry_api_request",
 ]
 
@@ -15,6 +15,34 @@ from typing import Tuple, Dict, Any
 from datetime import datetime, timedelta, timezone
 
 
+def _format_date(value: datetime) -> str:
+    """YYYY-MM-DD (Finnhub). Plain field formatting avoids strftime."""
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def _format_seconds(value: datetime) -> str:
+    """YYYY-MM-DDTHH:MM:SS without offset (NewsAPI)."""
+    return value.replace(tzinfo=None).isoformat(timespec="seconds")
+
+
+def _window_delta(window_config: Dict[str, Any]) -> timedelta:
+    """Convert a HORIZON_WINDOWS entry to its timedelta (default: 1 day)."""
+    if "window_minutes" in window_config:
+        return timedelta(minutes=window_config["window_minutes"])
+    if "window_hours" in window_config:
+        return timedelta(hours=window_config["window_hours"])
+    if "window_days" in window_config:
+        return timedelta(days=window_config["window_days"])
+    return timedelta(days=1)
+
+
+# api_format -> date formatter; anything else falls back to datetime.isoformat
+_API_FORMATTERS = {
+    "finnhub": _format_date,
+    "newsapi": _format_seconds,
+}
+
+
 class DateRangeCalculator:
     """
     Calculator for date ranges based on time horizons.
@@ -60,6 +88,11 @@ class DateRangeCalculator:
         }
     }
     
+    # Window length per horizon, built once from HORIZON_WINDOWS
+    _HORIZON_DELTA: Dict[str, timedelta] = {
+        horizon: _window_delta(config) for horizon, config in HORIZON_WINDOWS.items()
+    }
+    
     @classmethod
     def calculate(cls, time_horizon: str, symbol: str = None, current_time: datetime = None, min_articles: int = None) -> Tuple[datetime, datetime]:
         """
@@ -86,38 +119,22 @@ class DateRangeCalculator:
         elif current_time.tzinfo is None:
             current_time = current_time.replace(tzinfo=timezone.utc)
         
-        # Normalize time horizon
-        time_horizon = time_horizon.lower().strip()
-        
-        if time_horizon not in cls.HORIZON_WINDOWS:
-            raise ValueError(
-                f"Unsupported time_horizon: {time_horizon}. "
-                f"Supported: {list(cls.HORIZON_WINDOWS.keys())}"
-            )
-        
-        window_config = cls.HORIZON_WINDOWS[time_horizon]
-        to_date = current_time
-        
-        # Calculate from_date based on window type
-        if "window_minutes" in window_config:
-            base_window = window_config["window_minutes"]
-            from_date = current_time - timedelta(minutes=base_window)
-        elif "window_hours" in window_config:
-            base_window = window_config["window_hours"]
-            from_date = current_time - timedelta(hours=base_window)
-        elif "window_days" in window_config:
-            base_window = window_config["window_days"]
-            from_date = current_time - timedelta(days=base_window)
-        else:
-            # Default to 1 day if config is missing
-            base_window = 1
-            from_date = current_time - timedelta(days=base_window)
+        # Already-normalized horizons skip the lower()/strip() pass
+        window = cls._HORIZON_DELTA.get(time_horizon)
+        if window is None:
+            time_horizon = time_horizon.lower().strip()
+            window = cls._HORIZON_DELTA.get(time_horizon)
+            if window is None:
+                raise ValueError(
+                    f"Unsupported time_horizon: {time_horizon}. "
+                    f"Supported: {list(cls.HORIZON_WINDOWS.keys())}"
+                )
         
         # Dynamic window adjustment: If min_articles is specified and we might need more news,
         # we'll expand the window. This is handled by the caller after initial fetch.
         # For now, return the base window. The caller can expand if needed.
         
-        return from_date, to_date
+        return current_time - window, current_time
     
     @classmethod
     def get_window_description(cls, time_horizon: str) -> str:
@@ -160,29 +177,8 @@ class DateRangeCalculator:
             expanded_from, to = DateRangeCalculator.expand_window("1d", from_date, to_date)
             # Expands 3-day window to 4.5 days
         """
-        time_horizon = time_horizon.lower().strip()
-        window_config = cls.HORIZON_WINDOWS.get(time_horizon, {})
-        
-        # Calculate original window size
-        if "window_minutes" in window_config:
-            window_size = (to_date - from_date).total_seconds() / 60  # minutes
-            expanded_size = window_size * multiplier
-            expanded_from = to_date - timedelta(minutes=expanded_size)
-        elif "window_hours" in window_config:
-            window_size = (to_date - from_date).total_seconds() / 3600  # hours
-            expanded_size = window_size * multiplier
-            expanded_from = to_date - timedelta(hours=expanded_size)
-        elif "window_days" in window_config:
-            window_size = (to_date - from_date).total_seconds() / 86400  # days
-            expanded_size = window_size * multiplier
-            expanded_from = to_date - timedelta(days=expanded_size)
-        else:
-            # Default: expand by multiplier
-            window_size = (to_date - from_date).total_seconds() / 86400
-            expanded_size = window_size * multiplier
-            expanded_from = to_date - timedelta(days=expanded_size)
-        
-        return expanded_from, to_date
+        # The window unit doesn't matter: timedelta scales directly
+        return to_date - (to_date - from_date) * multiplier, to_date
     
     @classmethod
     def format_for_api(cls, from_date: datetime, to_date: datetime, api_format: str = "iso") -> Dict[str, str]:
@@ -206,22 +202,8 @@ class DateRangeCalculator:
             dates = DateRangeCalculator.format_for_api(from_date, to_date, "finnhub")
             # Returns: {"from": "2024-01-15", "to": "2024-01-18"}
         """
-        if api_format == "finnhub":
-            # Finnhub expects YYYY-MM-DD format
-            return {
-                "from": from_date.strftime("%Y-%m-%d"),
-                "to": to_date.strftime("%Y-%m-%d")
-            }
-        elif api_format == "newsapi":
-            # NewsAPI accepts ISO format or YYYY-MM-DD
-            return {
-                "from": from_date.strftime("%Y-%m-%dT%H:%M:%S"),
-                "to": to_date.strftime("%Y-%m-%dT%H:%M:%S")
-            }
-        else:
-            # Default: ISO format
-            return {
-                "from": from_date.isoformat(),
-                "to": to_date.isoformat()
-            }
-
+        formatter = _API_FORMATTERS.get(api_format, datetime.isoformat)
+        return {
+            "from": formatter(from_date),
+            "to": formatter(to_date)
+        }
@@ -2,13 +2,24 @@
 Logging utility for News Fetch Agent.
 
 Provides centralized logging configuration for all components.
+
+Callers should pass arguments lazily (logger.debug("x=%s", x)) rather
+than pre-formatting f-strings, so records dropped by level cost nothing.
 """
 
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
+# Our formatter never prints thread/process fields, so skip collecting
+# them for every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
+@lru_cache(maxsize=256)
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get a logger instance for a component.
@@ -5,14 +5,32 @@ Provides retry logic for handling transient API failures.
 """
 
 import time
+import asyncio
 import logging
-from typing import Callable, TypeVar, Optional, List
+from typing import Awaitable, Callable, TypeVar, Optional, List
 from functools import wraps
 
 T = TypeVar('T')
 logger = logging.getLogger(__name__)
 
 
+def _delay_schedule(
+    max_retries: int,
+    initial_delay: float,
+    backoff_factor: float,
+    max_delay: float
+) -> List[float]:
+    """
+    Precompute the wait before each retry.
+    
+    Entry i is the delay after failed attempt i + 1, capped at max_delay.
+    """
+    return [
+        min(initial_delay * backoff_factor ** attempt, max_delay)
+        for attempt in range(max_retries)
+    ]
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
@@ -43,49 +61,104 @@ def retry_with_backoff(
             return response.json()
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Delay schedule is fixed per decoration, not recomputed per call
+        delays = _delay_schedule(max_retries, initial_delay, backoff_factor, max_delay)
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            delay = initial_delay
-            last_exception = None
+            # Fast path: most calls succeed first time, so no retry loop
+            # is set up until something fails
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
             
-            for attempt in range(max_retries + 1):
+            for attempt, current_delay in enumerate(delays, start=1):
+                # Log retry attempt
+                logger.warning(
+                    f"{func.__name__} failed (attempt {attempt}/{max_retries + 1}): {str(last_exception)}. "
+                    f"Retrying in {current_delay:.2f} seconds..."
+                )
+                
+                # Call optional retry callback
+                if on_retry:
+                    try:
+                        on_retry(last_exception, attempt)
+                    except Exception:
+                        pass  # Don't fail on callback errors
+                
+                # Wait before retry
+                time.sleep(current_delay)
+                
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    
-                    if attempt < max_retries:
-                        # Calculate delay with exponential backoff
-                        current_delay = min(delay, max_delay)
-                        
-                        # Log retry attempt
-                        logger.warning(
-                            f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {str(e)}. "
-                            f"Retrying in {current_delay:.2f} seconds..."
-                        )
-                        
-                        # Call optional retry callback
-                        if on_retry:
-                            try:
-                                on_retry(e, attempt + 1)
-                            except Exception:
-                                pass  # Don't fail on callback errors
-                        
-                        # Wait before retry
-                        time.sleep(current_delay)
-                        
-                        # Increase delay for next retry
-                        delay *= backoff_factor
-                    else:
-                        # Final attempt failed
-                        logger.error(
-                            f"{func.__name__} failed after {max_retries + 1} attempts: {str(e)}"
-                        )
-                        raise
             
-            # Should never reach here, but just in case
-            if last_exception:
-                raise last_exception
+            # Final attempt failed
+            logger.error(
+                f"{func.__name__} failed after {max_retries + 1} attempts: {str(last_exception)}"
+            )
+            raise last_exception
+        
+        return wrapper
+    return decorator
+
+
+def retry_with_backoff_async(
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    max_delay: float = 60.0,
+    exceptions: tuple = (Exception,),
+    on_retry: Optional[Callable[[Exception, int], None]] = None
+) -> Callable:
+    """
+    Async variant of retry_with_backoff for coroutine functions.
+    
+    Waits with asyncio.sleep, so other requests on the event loop keep
+    running while this one backs off. Arguments match retry_with_backoff.
+    
+    Example:
+        @retry_with_backoff_async(max_retries=3, initial_delay=1.0)
+        async def fetch_news():
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        delays = _delay_schedule(max_retries, initial_delay, backoff_factor, max_delay)
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                last_exception = e
+            
+            for attempt, current_delay in enumerate(delays, start=1):
+                logger.warning(
+                    f"{func.__name__} failed (attempt {attempt}/{max_retries + 1}): {str(last_exception)}. "
+                    f"Retrying in {current_delay:.2f} seconds..."
+                )
+                
+                if on_retry:
+                    try:
+                        on_retry(last_exception, attempt)
+                    except Exception:
+                        pass  # Don't fail on callback errors
+                
+                await asyncio.sleep(current_delay)
+                
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+            
+            logger.error(
+                f"{func.__name__} failed after {max_retries + 1} attempts: {str(last_exception)}"
+            )
+            raise last_exception
         
         return wrapper
     return decorator
@@ -122,23 +195,22 @@ def retry_api_request(
             max_retries=3
         )
     """
-    delay = initial_delay
+    delays = _delay_schedule(max_retries, initial_delay, backoff_factor, max_delay)
     last_exception = None
     
     for attempt in range(max_retries + 1):
         try:
             return func()
-        except (ConnectionError, TimeoutError, Exception) as e:
+        except Exception as e:
             last_exception = e
             
             if attempt < max_retries:
-                current_delay = min(delay, max_delay)
+                current_delay = delays[attempt]
                 logger.warning(
                     f"API request failed (attempt {attempt + 1}/{max_retries + 1}): {str(e)}. "
                     f"Retrying in {current_delay:.2f} seconds..."
                 )
                 time.sleep(current_delay)
-                delay *= backoff_factor
             else:
                 logger.error(f"API request failed after {max_retries + 1} attempts: {str(e)}")
                 raise
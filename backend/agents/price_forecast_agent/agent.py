@@ -65,6 +65,11 @@ class PriceForecastAgent(BaseAgent):
             self._registry = ModelRegistry()
             self._trainer = ForecastTrainer(registry=self._registry)
 
+            # Load (and warm up) LSTM models for symbols expected to be hot,
+            # so their first forecast does not pay for graph tracing
+            for symbol in self.config.get("preload_symbols", []):
+                self._load_lstm(symbol)
+
             self.initialized = True
             logger.info(f"PriceForecastAgent v{self.version} initialized")
             return True
@@ -200,10 +205,7 @@ class PriceForecastAgent(BaseAgent):
         # Get or load model
         if symbol not in self._lstm_models:
             # Try to load from registry
-            result = self._registry.load_model("lstm", symbol, LSTMModel)
-            if result.get("success"):
-                self._lstm_models[symbol] = result["model"]
-            else:
+            if not self._load_lstm(symbol):
                 # Train new model
                 logger.info(f"Training new LSTM model for {symbol}")
                 model = LSTMModel()
@@ -215,6 +217,16 @@ class PriceForecastAgent(BaseAgent):
         model = self._lstm_models[symbol]
         return model.predict(df, horizons=horizons)
 
+    def _load_lstm(self, symbol: str) -> bool:
+        """Load the latest registered LSTM model for a symbol into the cache."""
+        from .models import LSTMModel
+
+        result = self._registry.load_model("lstm", symbol, LSTMModel)
+        if result.get("success"):
+            self._lstm_models[symbol] = result["model"]
+            return True
+        return False
+
     def _predict_ensemble(
         self,
         symbol: str,
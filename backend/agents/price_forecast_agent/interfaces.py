@@ -4,11 +4,13 @@ Public interfaces for the Price Forecast Agent.
 
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PriceForecast(BaseModel):
     """Price forecast for a specific horizon."""
+    model_config = ConfigDict(frozen=True)
+
     horizon: str  # 1h, 4h, 1d, 1w
     predicted_price: float
     confidence: float  # 0.0 to 1.0
@@ -19,6 +21,8 @@ class PriceForecast(BaseModel):
 
 class ForecastResponse(BaseModel):
     """Response containing price forecasts."""
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     current_price: float
     predictions: List[PriceForecast]
@@ -5,14 +5,17 @@ This module provides:
 - ProphetModel: Facebook Prophet for baseline forecasting
 - LSTMModel: Deep learning model for primary forecasting
 - ModelRegistry: Model versioning and deployment
+- LSTMBatchRunner: Micro-batching of concurrent LSTM predictions
 """
 
 from .prophet_model import ProphetModel
 from .lstm_model import LSTMModel
 from .model_registry import ModelRegistry
+from .batch_runner import LSTMBatchRunner
 
 __all__ = [
     "ProphetModel",
     "LSTMModel",
     "ModelRegistry",
+    "LSTMBatchRunner",
 ]
@@ -0,0 +1,155 @@
+"""
+Request batching for LSTM inference.
+
+Concurrent callers submit single normalized sequences; the runner gathers
+them for up to ``max_wait_ms`` or until ``max_batch_size`` are pending and
+runs one batched forward pass, then hands each caller its own prediction.
+This amortizes graph dispatch and weight loads across requests. The forward
+pass runs in the loop's default executor, so the event loop is never blocked.
+
+Models are trained per symbol, so one runner serves one LSTMModel.
+"""
+
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class LSTMBatchRunner:
+    """
+    Micro-batching front end for an LSTMModel.
+
+    Usage:
+        runner = LSTMBatchRunner(model, max_batch_size=32, max_wait_ms=5)
+        prediction = await runner.submit(sequence)
+        ...
+        await runner.close()
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            model: Trained LSTMModel
+            max_batch_size: Maximum sequences per forward pass
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Requests dequeued by the worker but not yet resolved
+        self._batch: List[Tuple[np.ndarray, bool, asyncio.Future]] = []
+        self._closed = False
+
+    async def submit(self, sequence: np.ndarray, training: bool = False) -> float:
+        """
+        Queue one normalized sequence and wait for its prediction.
+
+        Args:
+            sequence: Normalized sequence of shape (sequence_length, num_features)
+            training: Keep dropout active (Monte Carlo Dropout sampling)
+
+        Returns:
+            Denormalized prediction
+
+        Raises:
+            RuntimeError: If the runner has been closed
+        """
+        if self._closed:
+            raise RuntimeError("LSTMBatchRunner is closed")
+
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sequence, bool(training), future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the background worker and fail every unresolved request.
+
+        Requests still queued or in the batch being run get a RuntimeError,
+        and later submit() calls are rejected.
+        """
+        self._closed = True
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        pending = self._batch
+        self._batch = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._queue = None
+
+        for _, _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("LSTMBatchRunner is closed"))
+
+    async def _collect(self) -> None:
+        """Wait for the first request, then gather more until full or timed out."""
+        batch = self._batch
+        batch.append(await self._queue.get())
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _flush(self, batch: List[Tuple[np.ndarray, bool, asyncio.Future]]) -> None:
+        """Run one forward pass per training mode and resolve the futures."""
+        loop = asyncio.get_running_loop()
+        for training in (False, True):
+            items = [item for item in batch if item[1] == training]
+            if not items:
+                continue
+
+            # Inference is synchronous, so it runs in the default executor to
+            # keep the event loop serving other coroutines meanwhile
+            try:
+                stacked = np.stack([item[0] for item in items]).astype(np.float32, copy=False)
+                predictions = await loop.run_in_executor(
+                    None, self.model.predict_batch, stacked, training
+                )
+            except Exception as e:
+                logger.error(f"Batched LSTM inference failed: {e}")
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, _, future), prediction in zip(items, predictions):
+                if not future.done():
+                    future.set_result(float(prediction))
+
+    async def _run(self) -> None:
+        """Background loop: collect a batch, run it, repeat."""
+        while True:
+            await self._collect()
+            await self._flush(self._batch)
+            self._batch = []
@@ -27,6 +27,10 @@ try:
     from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
     from tensorflow.keras.optimizers import Adam
     TF_AVAILABLE = True
+
+    # TF32 matmuls for the LSTM gate projections on Ampere+ GPUs
+    # (no-op on CPU)
+    tf.config.experimental.enable_tensor_float_32_execution(True)
 except ImportError:
     # Create placeholder classes for type hints when TF not available
     Sequential = None
@@ -61,6 +65,10 @@ class LSTMModel:
         "epochs": 100,              # Max epochs
         "patience": 10,             # Early stopping patience
         "mc_samples": 50,           # Monte Carlo samples for confidence
+        "jit_compile": False,       # XLA-compile the inference graph
+        "precision": "float32",     # "float32", "mixed_float16" or "mixed_bfloat16"
+        "quantize_on_save": False,  # Also export an INT8 TFLite model on save
+        "warmup": True,             # Trace inference graphs once the model is ready
     }
 
     # Horizon configurations (horizon name -> steps ahead)
@@ -96,6 +104,10 @@ class LSTMModel:
         # Data frequency (detected during training)
         self.data_frequency: str = "1h"  # Default hourly
 
+        # Compiled inference graphs by stage (built lazily, reset when the
+        # model changes)
+        self._infer_fns: Dict[str, Any] = {}
+
     def _build_model(self, input_shape: Tuple[int, int]) -> Any:
         """
         Build LSTM model architecture.
@@ -109,32 +121,46 @@ class LSTMModel:
         if not TF_AVAILABLE:
             raise RuntimeError("TensorFlow not installed")
 
+        # Mixed precision runs the LSTM/Dense matmuls in float16/bfloat16 on
+        # tensor cores while keeping variables and the output in float32
+        precision = self.config.get("precision", "float32")
+
+        # LSTM layers keep the default tanh/sigmoid activations, no
+        # recurrent dropout and no unrolling so TensorFlow can run them
+        # with the fused cuDNN kernel on GPU
         model = Sequential([
             # First LSTM layer
             LSTM(
                 self.config["lstm_units"][0],
                 return_sequences=True,
-                input_shape=input_shape
+                input_shape=input_shape,
+                dtype=precision
             ),
-            BatchNormalization(),
-            Dropout(self.config["dropout_rate"]),
+            BatchNormalization(dtype=precision),
+            Dropout(self.config["dropout_rate"], dtype=precision),
 
             # Second LSTM layer
             LSTM(
                 self.config["lstm_units"][1],
-                return_sequences=False
+                return_sequences=False,
+                dtype=precision
             ),
-            BatchNormalization(),
-            Dropout(self.config["dropout_rate"]),
+            BatchNormalization(dtype=precision),
+            Dropout(self.config["dropout_rate"], dtype=precision),
 
             # Dense layers
-            Dense(32, activation="relu"),
-            Dropout(self.config["dropout_rate"]),
-            Dense(1)  # Single output: predicted price
+            Dense(32, activation="relu", dtype=precision),
+            Dropout(self.config["dropout_rate"], dtype=precision),
+            Dense(1, dtype="float32")  # Single output: predicted price
         ])
 
+        optimizer = Adam(learning_rate=self.config["learning_rate"])
+        if precision == "mixed_float16":
+            # float16 gradients need loss scaling to avoid underflow
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
+
         model.compile(
-            optimizer=Adam(learning_rate=self.config["learning_rate"]),
+            optimizer=optimizer,
             loss="mse",
             metrics=["mae"]
         )
@@ -200,13 +226,48 @@ class LSTMModel:
         Returns:
             X (sequences) and y (targets)
         """
-        X, y = [], []
+        n_sequences = max(len(features) - sequence_length, 0)
+        features = np.ascontiguousarray(features)
+
+        # Window i is rows [i, i + sequence_length): a read-only strided
+        # (n, seq_len, n_features) view that already has the output layout,
+        # so the single copy below walks memory in order
+        row_stride, col_stride = features.strides
+        windows = np.lib.stride_tricks.as_strided(
+            features,
+            shape=(n_sequences, sequence_length, features.shape[1]),
+            strides=(row_stride, row_stride, col_stride),
+            writeable=False
+        )
+        X = np.ascontiguousarray(windows)
+        y = np.ascontiguousarray(target[sequence_length:sequence_length + n_sequences])
 
-        for i in range(len(features) - sequence_length):
-            X.append(features[i:i + sequence_length])
-            y.append(target[i + sequence_length])
+        return X, y
 
-        return np.array(X), np.array(y)
+    def _create_sequences_on_device(
+        self,
+        features: np.ndarray,
+        target: np.ndarray,
+        sequence_length: int
+    ) -> Tuple[Any, Any]:
+        """
+        Device-side counterpart of _create_sequences.
+
+        Only the (n_samples, n_features) matrix is copied to the default
+        device; the sliding windows are framed there with tf.signal.frame.
+
+        Returns:
+            X (sequences) and y (targets) as tensors
+        """
+        n_sequences = max(len(features) - sequence_length, 0)
+
+        features_t = tf.convert_to_tensor(features, dtype=tf.float32)
+        X = tf.signal.frame(features_t, sequence_length, 1, axis=0)[:n_sequences]
+        y = tf.convert_to_tensor(
+            target[sequence_length:sequence_length + n_sequences], dtype=tf.float32
+        )
+
+        return X, y
 
     def _normalize_features(
         self,
@@ -236,8 +297,12 @@ class LSTMModel:
         if self.feature_means is None or self.feature_stds is None:
             raise ValueError("Normalization parameters not set")
 
-        normalized = (features - self.feature_means) / self.feature_stds
-        return np.nan_to_num(normalized, nan=0.0)
+        # Single float32 working copy, scaled in place (avoids the
+        # subtract/divide/nan_to_num temporaries)
+        normalized = np.array(features, dtype=np.float32)
+        np.subtract(normalized, self.feature_means, out=normalized, casting="unsafe")
+        np.divide(normalized, self.feature_stds, out=normalized, casting="unsafe")
+        return np.nan_to_num(normalized, copy=False, nan=0.0)
 
     def _normalize_target(
         self,
@@ -254,7 +319,10 @@ class LSTMModel:
         if self.target_mean is None or self.target_std is None:
             raise ValueError("Target normalization parameters not set")
 
-        return (target - self.target_mean) / self.target_std
+        normalized = np.array(target, dtype=np.float32)
+        normalized -= self.target_mean
+        normalized *= 1.0 / self.target_std
+        return normalized
 
     def _denormalize_target(self, normalized: np.ndarray) -> np.ndarray:
         """Denormalize target back to original scale."""
@@ -336,8 +404,14 @@ class LSTMModel:
             features_norm = self._normalize_features(features, fit=True)
             target_norm = self._normalize_target(target, fit=True)
 
-            # Create sequences
-            X, y = self._create_sequences(
+            # Create sequences (framed on the GPU when one is visible, so the
+            # sequence_length-times larger windowed copy skips host memory)
+            if tf.config.list_physical_devices("GPU"):
+                create_sequences = self._create_sequences_on_device
+            else:
+                create_sequences = self._create_sequences
+
+            X, y = create_sequences(
                 features_norm,
                 target_norm,
                 self.config["sequence_length"]
@@ -353,6 +427,7 @@ class LSTMModel:
             # Build model
             input_shape = (X.shape[1], X.shape[2])
             self.model = self._build_model(input_shape)
+            self._infer_fns = {}
 
             # Callbacks
             callbacks = [
@@ -369,13 +444,34 @@ class LSTMModel:
                 )
             ]
 
+            # Materialize the split once as tensors so every epoch (and the
+            # validation pass) reuses them instead of re-converting numpy
+            X_train_t = tf.convert_to_tensor(X_train, dtype=tf.float32)
+            y_train_t = tf.convert_to_tensor(y_train, dtype=tf.float32)
+            X_val_t = tf.convert_to_tensor(X_val, dtype=tf.float32)
+            y_val_t = tf.convert_to_tensor(y_val, dtype=tf.float32)
+
+            # Input pipeline: batches are prefetched so the next one is staged
+            # while the current step runs (fit's numpy path shuffles too)
+            batch_size = self.config["batch_size"]
+            train_ds = (
+                tf.data.Dataset.from_tensor_slices((X_train_t, y_train_t))
+                .shuffle(len(X_train), reshuffle_each_iteration=True)
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE)
+            )
+            val_ds = (
+                tf.data.Dataset.from_tensor_slices((X_val_t, y_val_t))
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE)
+            )
+
             # Train
             logger.info("Training LSTM model...")
             history = self.model.fit(
-                X_train, y_train,
-                validation_data=(X_val, y_val),
+                train_ds,
+                validation_data=val_ds,
                 epochs=self.config["epochs"],
-                batch_size=self.config["batch_size"],
                 callbacks=callbacks,
                 verbose=0
             )
@@ -383,10 +479,9 @@ class LSTMModel:
             self.is_trained = True
             self.last_train_date = datetime.now()
 
-            # Calculate metrics on validation set
-            val_pred_norm = self.model.predict(X_val, verbose=0).flatten()
-            val_pred = self._denormalize_target(val_pred_norm)
-            val_actual = self._denormalize_target(y_val)
+            # Calculate metrics on validation set (single forward pass)
+            val_pred = self.predict_batch(X_val_t)
+            val_actual = self._denormalize_target(np.asarray(y_val))
 
             mape = np.mean(np.abs((val_actual - val_pred) / val_actual)) * 100
             rmse = np.sqrt(np.mean((val_actual - val_pred) ** 2))
@@ -407,6 +502,9 @@ class LSTMModel:
                 "epochs_trained": len(history.history["loss"]),
             }
 
+            if self.config.get("warmup", True):
+                self.warmup()
+
             return {
                 "success": True,
                 "model_type": "lstm",
@@ -470,14 +568,43 @@ class LSTMModel:
                     "error": f"Need at least {self.config['sequence_length']} data points"
                 }
 
-            # Use last sequence
-            features_norm = self._normalize_features(features, fit=False)
-            last_sequence = features_norm[-self.config["sequence_length"]:]
+            # Use last sequence (only that window is normalized; the Keras
+            # LSTM layers zero-initialize their states themselves)
+            last_sequence = self._normalize_features(
+                features[-self.config["sequence_length"]:], fit=False
+            )
             last_sequence = last_sequence.reshape(1, *last_sequence.shape)
 
             # Current price (last close)
             current_price = float(df["close"].iloc[-1])
 
+            # The model predicts the next step only, so the base prediction is
+            # shared by every horizon and computed once up front
+            if use_mc_dropout:
+                # Monte Carlo Dropout: the dropout-free front of the network is
+                # encoded once, then all samples run in one batched pass
+                encoded = self.encode(last_sequence)
+                mc_batch = tf.repeat(encoded, self.config["mc_samples"], axis=0)
+                mc_predictions = self.decode(mc_batch, training=True)
+                base_value = float(np.mean(mc_predictions))
+                base_std = float(np.std(mc_predictions))
+
+                # Confidence based on prediction spread
+                coefficient_of_variation = base_std / abs(base_value) if base_value != 0 else 1
+                base_confidence = max(0.3, min(0.95, 1 - coefficient_of_variation))
+
+            else:
+                # Single prediction
+                base_value = float(self.predict_batch(last_sequence)[0])
+
+                # Estimate uncertainty from training metrics
+                if "rmse" in self.training_metrics:
+                    base_std = self.training_metrics["rmse"]
+                else:
+                    base_std = abs(base_value) * 0.05
+
+                base_confidence = 0.7
+
             predictions = {}
 
             for horizon in horizons:
@@ -486,41 +613,12 @@ class LSTMModel:
 
                 steps = self._get_steps_for_horizon(horizon)
 
-                if use_mc_dropout:
-                    # Monte Carlo Dropout for uncertainty estimation
-                    mc_predictions = []
-                    for _ in range(self.config["mc_samples"]):
-                        # Training=True enables dropout during inference
-                        pred_norm = self.model(last_sequence, training=True).numpy().flatten()[0]
-                        pred = self._denormalize_target(np.array([pred_norm]))[0]
-                        mc_predictions.append(pred)
+                predicted_value = base_value
+                confidence = base_confidence
 
-                    mc_predictions = np.array(mc_predictions)
-                    predicted_value = float(np.mean(mc_predictions))
-                    std = float(np.std(mc_predictions))
-
-                    # Confidence intervals (95%)
-                    price_lower = predicted_value - 1.96 * std
-                    price_upper = predicted_value + 1.96 * std
-
-                    # Confidence based on prediction spread
-                    coefficient_of_variation = std / abs(predicted_value) if predicted_value != 0 else 1
-                    confidence = max(0.3, min(0.95, 1 - coefficient_of_variation))
-
-                else:
-                    # Single prediction
-                    pred_norm = self.model.predict(last_sequence, verbose=0).flatten()[0]
-                    predicted_value = float(self._denormalize_target(np.array([pred_norm]))[0])
-
-                    # Estimate uncertainty from training metrics
-                    if "rmse" in self.training_metrics:
-                        std = self.training_metrics["rmse"]
-                    else:
-                        std = abs(predicted_value) * 0.05
-
-                    price_lower = predicted_value - 1.96 * std
-                    price_upper = predicted_value + 1.96 * std
-                    confidence = 0.7
+                # Confidence intervals (95%)
+                price_lower = predicted_value - 1.96 * base_std
+                price_upper = predicted_value + 1.96 * base_std
 
                 # Direction
                 direction = "UP" if predicted_value > current_price else "DOWN" if predicted_value < current_price else "NEUTRAL"
@@ -563,6 +661,187 @@ class LSTMModel:
                 "error": str(e)
             }
 
+    def predict_batch(self, sequences: np.ndarray, training: bool = False) -> np.ndarray:
+        """
+        Run one forward pass over a batch of normalized sequences.
+
+        Args:
+            sequences: Array or tensor of shape (batch, sequence_length, num_features)
+            training: Keep dropout active (Monte Carlo Dropout sampling)
+
+        Returns:
+            Denormalized predictions, one per sequence
+        """
+        if not self.is_trained or self.model is None:
+            raise ValueError("Model not trained")
+
+        if not TF_AVAILABLE:
+            raise RuntimeError("TensorFlow not installed")
+
+        if not tf.is_tensor(sequences):
+            sequences = tf.convert_to_tensor(
+                np.ascontiguousarray(sequences, dtype=np.float32)
+            )
+        pred_norm = self._get_infer_fn()(sequences, training).numpy().ravel()
+        return self._denormalize_target(pred_norm)
+
+    def encode(self, sequences: np.ndarray) -> Any:
+        """
+        Run the deterministic front of the network over normalized sequences.
+
+        The first LSTM layer and its normalization have no dropout, so their
+        output is the same for every Monte Carlo sample and can be computed
+        once and shared by all samples (see ``decode``).
+
+        Args:
+            sequences: Array or tensor of shape (batch, sequence_length, num_features)
+
+        Returns:
+            Encoded sequence tensor
+        """
+        if not self.is_trained or self.model is None:
+            raise ValueError("Model not trained")
+
+        if not TF_AVAILABLE:
+            raise RuntimeError("TensorFlow not installed")
+
+        if not tf.is_tensor(sequences):
+            sequences = tf.convert_to_tensor(
+                np.ascontiguousarray(sequences, dtype=np.float32)
+            )
+        return self._get_infer_fn("encode")(sequences, False)
+
+    def decode(self, encoded: Any, training: bool = False) -> np.ndarray:
+        """
+        Run the rest of the network over the output of ``encode``.
+
+        Args:
+            encoded: Tensor returned by ``encode`` (may be repeated along batch)
+            training: Keep dropout active (Monte Carlo Dropout sampling)
+
+        Returns:
+            Denormalized predictions, one per encoded sequence
+        """
+        if not self.is_trained or self.model is None:
+            raise ValueError("Model not trained")
+
+        if not TF_AVAILABLE:
+            raise RuntimeError("TensorFlow not installed")
+
+        pred_norm = self._get_infer_fn("decode")(encoded, training).numpy().ravel()
+        return self._denormalize_target(pred_norm)
+
+    def warmup(self) -> None:
+        """
+        Trace the inference graphs with the shapes used by ``predict``.
+
+        Graph tracing (and XLA compilation when ``jit_compile`` is set)
+        happens on the first call for each input shape. Running it here moves
+        that one-time cost off the first forecast request.
+        """
+        if not self.is_trained or self.model is None or not TF_AVAILABLE:
+            return
+
+        try:
+            sequence = np.zeros(
+                (1, self.config["sequence_length"], len(self.feature_columns)),
+                dtype=np.float32
+            )
+
+            # Single prediction
+            self.predict_batch(sequence)
+
+            # Monte Carlo Dropout
+            encoded = self.encode(sequence)
+            self.decode(tf.repeat(encoded, self.config["mc_samples"], axis=0), training=True)
+
+        except Exception as e:
+            logger.warning(f"LSTM warmup failed: {e}")
+
+    def _get_infer_fn(self, stage: str = "full") -> Any:
+        """
+        Get the compiled inference function for the current model.
+
+        The forward pass is traced once per ``training`` flag into a graph
+        function, so repeated predictions skip eager op dispatch. The
+        traced graph is forward-only; no gradient state is kept. With
+        ``jit_compile`` enabled XLA additionally fuses the LSTM and dense
+        ops into compiled kernels.
+
+        Args:
+            stage: "full" for the whole model, "encode" for the layers before
+                the first dropout, "decode" for the remaining layers
+        """
+        if stage in self._infer_fns:
+            return self._infer_fns[stage]
+
+        model = self.model
+
+        # The model is Sequential, so each stage is a run of its layers
+        if stage == "full":
+            layers = list(model.layers)
+        else:
+            split = next(
+                (i for i, layer in enumerate(model.layers) if isinstance(layer, Dropout)),
+                len(model.layers)
+            )
+            layers = model.layers[:split] if stage == "encode" else model.layers[split:]
+
+        # With training=True only dropout should be sampled; BatchNormalization
+        # is always called in inference mode so it keeps its moving statistics
+        # and the samples in the batch are not normalized against each other.
+        # Passing the flag per layer (rather than toggling layer.trainable)
+        # leaves the shared model untouched, so concurrent traces are safe.
+        layer_training = [
+            (layer, not isinstance(layer, BatchNormalization)) for layer in layers
+        ]
+
+        def forward(batch, training):
+            for layer, uses_training in layer_training:
+                batch = layer(batch, training=training and uses_training)
+            return batch
+
+        run = tf.function(
+            forward,
+            reduce_retracing=True,
+            jit_compile=self.config.get("jit_compile", False)
+        )
+
+        self._infer_fns[stage] = run
+        return run
+
+    def quantize_for_cpu(self) -> bytes:
+        """
+        Export the trained model as a dynamic-range INT8 TFLite flatbuffer.
+
+        Weights of the LSTM and dense layers are stored as int8 and
+        activations are quantized on the fly, giving a ~4x smaller model
+        and int8 matmul kernels for CPU serving. The graph is traced with a
+        fixed batch of one sequence so the converter can emit the fused
+        TFLite LSTM op.
+
+        Returns:
+            Serialized TFLite model
+        """
+        if not self.is_trained or self.model is None:
+            raise ValueError("Model not trained")
+
+        if not TF_AVAILABLE:
+            raise RuntimeError("TensorFlow not installed")
+
+        model = self.model
+        input_spec = tf.TensorSpec(
+            [1, self.config["sequence_length"], len(self.feature_columns)],
+            tf.float32
+        )
+        concrete_fn = tf.function(
+            lambda batch: model(batch, training=False)
+        ).get_concrete_function(input_spec)
+
+        converter = tf.lite.TFLiteConverter.from_concrete_functions([concrete_fn], model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        return converter.convert()
+
     def _get_steps_for_horizon(self, horizon: str) -> int:
         """Get number of steps for horizon based on data frequency."""
         base_steps = self.HORIZON_CONFIG.get(horizon, 1)
@@ -606,13 +885,24 @@ class LSTMModel:
             }
             joblib.dump(metadata, filepath + ".meta")
 
-            logger.info(f"LSTM model saved to {filepath}")
-            return True
-
         except Exception as e:
             logger.error(f"Failed to save model: {e}")
             return False
 
+        logger.info(f"LSTM model saved to {filepath}")
+
+        # Save INT8 model for CPU inference alongside the Keras model. The
+        # export is optional: the saved model above stays valid if it fails
+        if self.config.get("quantize_on_save", False):
+            try:
+                int8_model = self.quantize_for_cpu()
+                with open(filepath + ".int8.tflite", "wb") as f:
+                    f.write(int8_model)
+            except Exception as e:
+                logger.warning(f"INT8 TFLite export failed, saved Keras model only: {e}")
+
+        return True
+
     def load(self, filepath: str) -> bool:
         """Load model and normalization params from file."""
         try:
@@ -621,6 +911,7 @@ class LSTMModel:
             # Load Keras model
             model_path = filepath + ".keras"
             self.model = load_model(model_path)
+            self._infer_fns = {}
 
             # Load metadata
             metadata = joblib.load(filepath + ".meta")
@@ -635,6 +926,9 @@ class LSTMModel:
             self.training_metrics = metadata.get("training_metrics", {})
             self.data_frequency = metadata.get("data_frequency", "1d")
 
+            if self.config.get("warmup", True):
+                self.warmup()
+
             logger.info(f"LSTM model loaded from {filepath}")
             return True
 
@@ -0,0 +1,135 @@
+"""
+Unit Tests for LSTMBatchRunner
+
+Tests for:
+- Flushing on max_batch_size and on max_wait_ms
+- Grouping by training mode
+- Error propagation
+- Closing with pending requests
+
+A stub model stands in for LSTMModel, so TensorFlow is not needed.
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from ..models.batch_runner import LSTMBatchRunner
+
+
+class StubModel:
+    """Records each predict_batch call; predicts sum(sequence) (+100 with dropout)."""
+
+    def __init__(self, error=None, release=None):
+        self.calls = []
+        self.error = error
+        self.release = release
+
+    def predict_batch(self, sequences, training=False):
+        self.calls.append((len(sequences), training))
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return sequences.sum(axis=(1, 2)) + (100.0 if training else 0.0)
+
+
+def _sequence(value):
+    return np.full((3, 2), value / 6, dtype=np.float32)
+
+
+class TestLSTMBatchRunner:
+    """
+    Test suite for LSTMBatchRunner.
+    """
+
+    def test_flush_at_max_batch_size(self):
+        """A full batch runs without waiting for max_wait_ms."""
+        model = StubModel()
+
+        async def run():
+            runner = LSTMBatchRunner(model, max_batch_size=4, max_wait_ms=60_000)
+            results = await asyncio.wait_for(
+                asyncio.gather(*(runner.submit(_sequence(i)) for i in range(4))), 5
+            )
+            await runner.close()
+            return results
+
+        assert asyncio.run(run()) == pytest.approx([0.0, 1.0, 2.0, 3.0])
+        assert model.calls == [(4, False)]
+
+    def test_flush_at_max_wait(self):
+        """A partial batch runs once max_wait_ms has passed."""
+        model = StubModel()
+
+        async def run():
+            runner = LSTMBatchRunner(model, max_batch_size=32, max_wait_ms=20)
+            results = await asyncio.wait_for(
+                asyncio.gather(*(runner.submit(_sequence(i)) for i in range(3))), 5
+            )
+            await runner.close()
+            return results
+
+        assert asyncio.run(run()) == pytest.approx([0.0, 1.0, 2.0])
+        assert model.calls == [(3, False)]
+
+    def test_mixed_training_flags(self):
+        """Each training mode gets its own pass; truthy non-bool flags count."""
+        model = StubModel()
+        flags = [False, True, 1, np.True_, 0]
+
+        async def run():
+            runner = LSTMBatchRunner(model, max_batch_size=len(flags), max_wait_ms=60_000)
+            results = await asyncio.wait_for(
+                asyncio.gather(*(runner.submit(_sequence(1), training=f) for f in flags)), 5
+            )
+            await runner.close()
+            return results
+
+        assert asyncio.run(run()) == pytest.approx([1.0, 101.0, 101.0, 101.0, 1.0])
+        assert model.calls == [(2, False), (3, True)]
+
+    def test_error_reaches_every_request(self):
+        """An inference error is raised to every caller in the batch."""
+        model = StubModel(error=ValueError("Model not trained"))
+
+        async def run():
+            runner = LSTMBatchRunner(model, max_batch_size=3, max_wait_ms=60_000)
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(runner.submit(_sequence(i)) for i in range(3)), return_exceptions=True
+                ),
+                5
+            )
+            await runner.close()
+            return results
+
+        results = asyncio.run(run())
+        assert len(results) == 3
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_close_fails_pending_requests(self):
+        """close() fails in-flight and queued requests and rejects new ones."""
+        release = threading.Event()
+        model = StubModel(release=release)
+
+        async def run():
+            runner = LSTMBatchRunner(model, max_batch_size=1, max_wait_ms=0)
+            tasks = [asyncio.create_task(runner.submit(_sequence(i))) for i in range(3)]
+
+            # Inference runs off the event loop, so the loop keeps going while
+            # the first request is blocked inside predict_batch
+            while not model.calls:
+                await asyncio.sleep(0.01)
+            await runner.close()
+            results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 5)
+
+            with pytest.raises(RuntimeError):
+                await runner.submit(_sequence(0))
+            release.set()
+            return results
+
+        results = asyncio.run(run())
+        assert len(results) == 3
+        assert all(isinstance(r, RuntimeError) for r in results)
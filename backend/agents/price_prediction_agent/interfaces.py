@@ -4,11 +4,13 @@ Public interfaces for the Price Prediction Agent.
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PricePrediction(BaseModel):
     """Price prediction for a specific horizon."""
+    model_config = ConfigDict(frozen=True)
+
     horizon: str  # e.g., "1d", "7d", "30d"
     predicted_price: float
     confidence: float  # 0.0 to 1.0
@@ -18,6 +20,8 @@ class PricePrediction(BaseModel):
 
 class TechnicalIndicators(BaseModel):
     """Technical indicators for a symbol."""
+    model_config = ConfigDict(frozen=True)
+
     rsi: Optional[float] = None
     macd: Optional[float] = None
     moving_average_50: Optional[float] = None
@@ -27,6 +31,8 @@ class TechnicalIndicators(BaseModel):
 
 class PredictionResponse(BaseModel):
     """Response containing price predictions."""
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     current_price: float
     predictions: List[PricePrediction]
@@ -3,16 +3,49 @@ Sentiment Aggregator - Main agent implementation.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import numpy as np
 from core.interfaces.base_agent import BaseAgent
 
 # Import aggregation components
 from .aggregation import TimeWeightedAggregator, ImpactScorer
-from .interfaces import AggregatedSentiment
 
 logger = logging.getLogger(__name__)
 
+# Horizon -> (min_confidence, min_articles). Short-term predictions require
+# higher confidence and fewer articles; long-term ones are more lenient.
+_HORIZON_THRESHOLDS: Dict[str, Tuple[float, int]] = {
+    "1s": (0.8, 3),   # Very strict for 1-second predictions
+    "1m": (0.75, 5),  # Strict for 1-minute predictions
+    "1h": (0.7, 8),   # Moderate for hourly predictions
+    "1d": (0.65, 10), # Moderate for daily predictions
+    "1w": (0.6, 15),  # Lenient for weekly predictions
+    "1mo": (0.55, 20), # More lenient for monthly predictions
+    "1y": (0.5, 25)   # Most lenient for yearly predictions
+}
+_DEFAULT_THRESHOLDS: Tuple[float, int] = _HORIZON_THRESHOLDS["1d"]
+
+# (sentiment_score, confidence) record layout for vectorized averaging
+_SCORE_DTYPE = np.dtype([("sentiment", np.float64), ("confidence", np.float64)])
+
+# Error response shared by every failure path; symbol, time_horizon,
+# aggregated_at and message are filled in per call. Keys follow the success
+# response order so both serialize with the same shape.
+_ERROR_RESPONSE: Dict[str, Any] = {
+    "symbol": None,
+    "aggregated_sentiment": 0.0,
+    "sentiment_label": "neutral",
+    "confidence": 0.0,
+    "impact": "Low",
+    "news_count": 0,
+    "time_weighted": False,
+    "time_horizon": None,
+    "aggregated_at": None,
+    "status": "error",
+    "message": None
+}
+
 
 class SentimentAggregator(BaseAgent):
     """
@@ -39,6 +72,7 @@ class SentimentAggregator(BaseAgent):
         
         # Initialize components (will be set in initialize())
         self.time_aggregator: Optional[TimeWeightedAggregator] = None
+        self._time_config: Dict[str, Any] = {}
         self.impact_scorer: Optional[ImpactScorer] = None
     
     def initialize(self) -> bool:
@@ -52,13 +86,14 @@ class SentimentAggregator(BaseAgent):
         try:
             # Initialize time-weighted aggregator
             if self.use_time_weighting:
-                self.time_aggregator = TimeWeightedAggregator(config={
+                self._time_config = {
                     "decay_type": self.config.get("decay_type", "exponential"),
                     "half_life_hours": self.config.get("half_life_hours", 24),
                     "max_age_hours": self.config.get("max_age_hours", 168)
-                })
+                }
             else:
-                self.time_aggregator = TimeWeightedAggregator()
+                self._time_config = {}
+            self.time_aggregator = TimeWeightedAggregator.get(**self._time_config)
             
             # Initialize impact scorer
             if self.enable_impact_scoring:
@@ -118,6 +153,9 @@ class SentimentAggregator(BaseAgent):
                 "message": "Agent not initialized. Call initialize() first."
             }
         
+        # One timestamp per call, shared by every return path
+        aggregated_at = datetime.utcnow().isoformat() + "Z"
+        
         params = params or {}
         sentiment_scores = params.get("sentiment_scores", [])
         time_weighted = params.get("time_weighted", self.use_time_weighting)
@@ -128,52 +166,71 @@ class SentimentAggregator(BaseAgent):
         
         # Filter sentiment scores by confidence threshold
         if min_confidence > 0:
-            original_count = len(sentiment_scores)
-            sentiment_scores = [
-                score for score in sentiment_scores
-                if score.get("confidence", 0.5) >= min_confidence
-            ]
-            filtered_count = original_count - len(sentiment_scores)
-            if filtered_count > 0:
-                logger.info(f"Filtered out {filtered_count} low-confidence articles (threshold: {min_confidence:.2f})")
+            # Find the first score below threshold; when every score passes
+            # (the common case) the input list is kept without copying.
+            first_rejected = next(
+                (i for i, score in enumerate(sentiment_scores)
+                 if not score.get("confidence", 0.5) >= min_confidence),
+                None
+            )
+            if first_rejected is not None:
+                original_count = len(sentiment_scores)
+                sentiment_scores = sentiment_scores[:first_rejected] + [
+                    score for score in sentiment_scores[first_rejected + 1:]
+                    if score.get("confidence", 0.5) >= min_confidence
+                ]
+                filtered_count = original_count - len(sentiment_scores)
+                logger.info(
+                    "Filtered out %d low-confidence articles (threshold: %.2f)",
+                    filtered_count, min_confidence
+                )
         
         # Check minimum articles requirement
         if len(sentiment_scores) < min_articles:
-            logger.warning(f"Only {len(sentiment_scores)} articles (minimum: {min_articles} for {time_horizon})")
+            logger.warning(
+                "Only %d articles (minimum: %d for %s)",
+                len(sentiment_scores), min_articles, time_horizon
+            )
         
         if not sentiment_scores:
-            return {
-                "symbol": symbol,
-                "status": "error",
-                "message": "No sentiment scores provided",
-                "aggregated_sentiment": 0.0,
-                "sentiment_label": "neutral",
-                "confidence": 0.0,
-                "impact": "Low",
-                "news_count": 0,
-                "time_weighted": False,
-                "aggregated_at": datetime.utcnow().isoformat() + "Z"
-            }
+            error = _ERROR_RESPONSE.copy()
+            error["symbol"] = symbol
+            error["time_horizon"] = time_horizon
+            error["aggregated_at"] = aggregated_at
+            error["message"] = "No sentiment scores provided"
+            return error
+        
+        # Components are read once per call
+        time_aggregator = self.time_aggregator
+        impact_scorer = self.impact_scorer
         
         try:
-            # Step 1: Update time aggregator with time_horizon if provided
-            if time_weighted and self.time_aggregator and time_horizon:
-                # Adjust aggregator for this horizon
-                self.time_aggregator._adjust_for_horizon(time_horizon)
+            # Step 1: Use the (cached) time aggregator for this horizon
+            if time_weighted and time_aggregator and time_horizon:
+                time_aggregator = TimeWeightedAggregator.get(
+                    **self._time_config, time_horizon=time_horizon
+                )
             
             # Step 2: Aggregate sentiment scores
-            if time_weighted and self.time_aggregator:
-                aggregated = self.time_aggregator.aggregate(sentiment_scores, symbol)
+            if time_weighted and time_aggregator:
+                aggregated = time_aggregator.aggregate(sentiment_scores, symbol)
             else:
                 # Simple aggregation without time weighting
-                if self.time_aggregator:
-                    aggregated = self.time_aggregator.aggregate_simple(sentiment_scores, symbol)
+                if time_aggregator:
+                    aggregated = time_aggregator.aggregate_simple(sentiment_scores, symbol)
                 else:
-                    # Fallback: simple average
-                    sentiments = [s.get("sentiment_score", 0.0) for s in sentiment_scores]
-                    confidences = [s.get("confidence", 0.7) for s in sentiment_scores]
-                    avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0.0
-                    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.7
+                    # Fallback: simple average (one pass into a structured
+                    # array, means computed in NumPy)
+                    values = np.fromiter(
+                        (
+                            (s.get("sentiment_score", 0.0), s.get("confidence", 0.7))
+                            for s in sentiment_scores
+                        ),
+                        dtype=_SCORE_DTYPE,
+                        count=len(sentiment_scores)
+                    )
+                    avg_sentiment = float(values["sentiment"].mean())
+                    avg_confidence = float(values["confidence"].mean())
                     
                     aggregated = {
                         "aggregated_sentiment": avg_sentiment,
@@ -185,14 +242,15 @@ class SentimentAggregator(BaseAgent):
             
             # Step 2: Calculate impact score
             impact = "Low"
-            if self.enable_impact_scoring and self.impact_scorer:
-                # Get recency from weights if available
-                weights = aggregated.get("weights_applied", [])
+            if self.enable_impact_scoring and impact_scorer:
+                # Recency is the mean time weight, available from the total
+                # without per-article weights
+                total_weight = aggregated.get("total_weight")
                 recency = None
-                if weights:
-                    recency = self.impact_scorer.calculate_recency_score(weights)
+                if total_weight is not None and aggregated["news_count"]:
+                    recency = total_weight / aggregated["news_count"]
                 
-                impact = self.impact_scorer.calculate_impact(
+                impact = impact_scorer.calculate_impact(
                     aggregated_sentiment=aggregated["aggregated_sentiment"],
                     news_count=aggregated["news_count"],
                     recency=recency,
@@ -200,13 +258,14 @@ class SentimentAggregator(BaseAgent):
                 )
             else:
                 # Simple impact calculation
-                if self.impact_scorer:
-                    impact = self.impact_scorer.calculate_impact_simple(
+                if impact_scorer:
+                    impact = impact_scorer.calculate_impact_simple(
                         aggregated["aggregated_sentiment"],
                         aggregated["news_count"]
                     )
             
-            # Step 3: Return aggregated result
+            # Step 3: Return aggregated result (a dict literal is the
+            # cheapest way to build it; callers index and extend the dict)
             return {
                 "symbol": symbol,
                 "aggregated_sentiment": aggregated["aggregated_sentiment"],
@@ -216,23 +275,18 @@ class SentimentAggregator(BaseAgent):
                 "news_count": aggregated["news_count"],
                 "time_weighted": aggregated.get("time_weighted", False),
                 "time_horizon": time_horizon,
-                "aggregated_at": datetime.utcnow().isoformat() + "Z",
+                "aggregated_at": aggregated_at,
                 "status": "success"
             }
             
-        except Exception as e:
-            return {
-                "symbol": symbol,
-                "status": "error",
-                "message": f"Error aggregating sentiment: {str(e)}",
-                "aggregated_sentiment": 0.0,
-                "sentiment_label": "neutral",
-                "confidence": 0.0,
-                "impact": "Low",
-                "news_count": 0,
-                "time_weighted": False,
-                "aggregated_at": datetime.utcnow().isoformat() + "Z"
-            }
+        except Exception:
+            logger.exception("Error aggregating sentiment for %s", symbol)
+            error = _ERROR_RESPONSE.copy()
+            error["symbol"] = symbol
+            error["time_horizon"] = time_horizon
+            error["aggregated_at"] = aggregated_at
+            error["message"] = "Error aggregating sentiment"
+            return error
     
     def aggregate(self, sentiment_scores: List[Dict[str, Any]], symbol: str, time_weighted: bool = True) -> Dict[str, Any]:
         """
@@ -296,20 +350,14 @@ class SentimentAggregator(BaseAgent):
         Returns:
             Tuple of (min_confidence, min_articles)
         """
-        time_horizon = time_horizon.lower().strip()
-        
-        # Horizon-specific thresholds
-        thresholds = {
-            "1s": (0.8, 3),   # Very strict for 1-second predictions
-            "1m": (0.75, 5),  # Strict for 1-minute predictions
-            "1h": (0.7, 8),   # Moderate for hourly predictions
-            "1d": (0.65, 10), # Moderate for daily predictions
-            "1w": (0.6, 15),  # Lenient for weekly predictions
-            "1mo": (0.55, 20), # More lenient for monthly predictions
-            "1y": (0.5, 25)   # Most lenient for yearly predictions
-        }
-        
-        return thresholds.get(time_horizon, (0.65, 10))  # Default to daily thresholds
+        thresholds = _HORIZON_THRESHOLDS.get(time_horizon)
+        if thresholds is None:
+            # Normalize only when the horizon isn't already canonical;
+            # unknown horizons default to daily thresholds
+            thresholds = _HORIZON_THRESHOLDS.get(
+                time_horizon.lower().strip(), _DEFAULT_THRESHOLDS
+            )
+        return thresholds
     
     def health_check(self) -> Dict[str, Any]:
         """Check Sentiment Aggregator health."""
@@ -3,6 +3,7 @@ Aggregation Module Package
 
 This package contains sentiment aggregation logic:
 - Time-weighted aggregation (recent news weighted more)
+- Streaming time-weighted aggregation (O(1) updates per article)
 - Impact scoring (High/Medium/Low based on sentiment strength, volume, recency)
 
 Why this package exists:
@@ -12,11 +13,12 @@ Why this package exists:
 - Easy to add new aggregation methods
 """
 
-from .time_weighted import TimeWeightedAggregator
+from .time_weighted import TimeWeightedAggregator, StreamingTimeWeightedAggregator
 from .impact_scorer import ImpactScorer
 
 __all__ = [
     "TimeWeightedAggregator",
+    "StreamingTimeWeightedAggregator",
     "ImpactScorer",
 ]
 
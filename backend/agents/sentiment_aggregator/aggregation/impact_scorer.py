@@ -13,7 +13,12 @@ Why Impact Scoring?
 - Filters out noise from low-impact sentiment
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Union
+import numpy as np
+
+
+# Impact labels indexed by level (0 = Low, 1 = Medium, 2 = High)
+_IMPACT_LABELS = np.array(["Low", "Medium", "High"])
 
 
 class ImpactScorer:
@@ -31,6 +36,19 @@ class ImpactScorer:
         # Returns: "High"
     """
     
+    # Impact score weights (sum to 1.0)
+    SENTIMENT_WEIGHT = 0.4
+    VOLUME_WEIGHT = 0.3
+    RECENCY_WEIGHT = 0.2
+    CONFIDENCE_WEIGHT = 0.1
+    
+    # News volume saturates at this many articles
+    VOLUME_CAP = 20.0
+    
+    # Contributions used when recency/confidence are not provided
+    DEFAULT_RECENCY_TERM = 0.15     # Assume recent
+    DEFAULT_CONFIDENCE_TERM = 0.05  # Assume medium confidence
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize impact scorer.
@@ -78,33 +96,23 @@ class ImpactScorer:
             impact = scorer.calculate_impact(0.75, 15, recency=0.9, confidence=0.85)
             # Returns: "High"
         """
-        # Calculate sentiment strength (absolute value)
-        sentiment_strength = abs(aggregated_sentiment)
-        
-        # Base impact score (0.0 to 1.0)
-        impact_score = 0.0
-        
-        # Factor 1: Sentiment strength (40% weight)
-        impact_score += sentiment_strength * 0.4
-        
-        # Factor 2: News volume (30% weight)
-        # More news = higher impact (up to a point)
-        volume_score = min(news_count / 20.0, 1.0)  # Cap at 20 articles
-        impact_score += volume_score * 0.3
-        
-        # Factor 3: Recency (20% weight, if provided)
-        if recency is not None:
-            impact_score += recency * 0.2
-        else:
-            # Assume recent if not provided
-            impact_score += 0.15  # Default recency contribution
-        
-        # Factor 4: Confidence (10% weight, if provided)
-        if confidence is not None:
-            impact_score += confidence * 0.1
-        else:
-            # Assume medium confidence if not provided
-            impact_score += 0.05  # Default confidence contribution
+        # Recency (20%) and confidence (10%) fall back to fixed defaults
+        recency_term = (
+            recency * self.RECENCY_WEIGHT if recency is not None
+            else self.DEFAULT_RECENCY_TERM
+        )
+        confidence_term = (
+            confidence * self.CONFIDENCE_WEIGHT if confidence is not None
+            else self.DEFAULT_CONFIDENCE_TERM
+        )
+        
+        # Sentiment strength (40%) + news volume (30%, capped) + recency + confidence
+        impact_score = (
+            abs(aggregated_sentiment) * self.SENTIMENT_WEIGHT
+            + min(news_count / self.VOLUME_CAP, 1.0) * self.VOLUME_WEIGHT
+            + recency_term
+            + confidence_term
+        )
         
         # Determine impact level
         if impact_score >= self.high_threshold and news_count >= self.min_news_high:
@@ -114,6 +122,64 @@ class ImpactScorer:
         else:
             return "Low"
     
+    def calculate_impact_batch(
+        self,
+        aggregated_sentiments: np.ndarray,
+        news_counts: np.ndarray,
+        recency: Optional[np.ndarray] = None,
+        confidence: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate impact levels for many symbols at once.
+        
+        Vectorized equivalent of calling calculate_impact per symbol.
+        
+        Args:
+            aggregated_sentiments: Aggregated sentiment per symbol (-1.0 to +1.0)
+            news_counts: Number of news articles per symbol
+            recency: Recency score per symbol (optional, default contribution if omitted)
+            confidence: Confidence per symbol (optional, default contribution if omitted)
+        
+        Returns:
+            Array of impact levels ("High", "Medium", "Low"), one per symbol
+        
+        Example:
+            impacts = scorer.calculate_impact_batch(
+                np.array([0.75, 0.1]), np.array([15, 2]), recency=np.array([0.9, 0.5])
+            )
+            # Returns: array(["High", "Low"])
+        """
+        sentiments = np.asarray(aggregated_sentiments, dtype=np.float64)
+        counts = np.asarray(news_counts)
+        
+        recency_term = (
+            np.asarray(recency, dtype=np.float64) * self.RECENCY_WEIGHT if recency is not None
+            else self.DEFAULT_RECENCY_TERM
+        )
+        confidence_term = (
+            np.asarray(confidence, dtype=np.float64) * self.CONFIDENCE_WEIGHT if confidence is not None
+            else self.DEFAULT_CONFIDENCE_TERM
+        )
+        
+        impact_score = (
+            np.abs(sentiments) * self.SENTIMENT_WEIGHT
+            + np.minimum(counts / self.VOLUME_CAP, 1.0) * self.VOLUME_WEIGHT
+            + recency_term
+            + confidence_term
+        )
+        
+        # 0 = Low, 1 = Medium, 2 = High
+        level = np.where(
+            (impact_score >= self.high_threshold) & (counts >= self.min_news_high),
+            2,
+            np.where(
+                (impact_score >= self.medium_threshold) & (counts >= self.min_news_medium),
+                1,
+                0
+            )
+        )
+        return _IMPACT_LABELS[level]
+    
     def calculate_impact_simple(self, aggregated_sentiment: float, news_count: int) -> str:
         """
         Simple impact calculation (without recency/confidence).
@@ -142,12 +208,15 @@ class ImpactScorer:
         # Low impact: everything else
         return "Low"
     
-    def calculate_recency_score(self, weights: list[float]) -> float:
+    # Below this many weights a plain sum() beats the NumPy call overhead
+    VECTORIZE_MIN_WEIGHTS = 32
+    
+    def calculate_recency_score(self, weights: Union[Sequence[float], np.ndarray]) -> float:
         """
         Calculate recency score from time weights.
         
         Args:
-            weights: List of time weights (0.0 to 1.0)
+            weights: List or array of time weights (0.0 to 1.0)
         
         Returns:
             Recency score (0.0 to 1.0)
@@ -158,8 +227,12 @@ class ImpactScorer:
             recency = scorer.calculate_recency_score([0.9, 0.8, 0.7])
             # Returns: 0.8 (average weight)
         """
-        if not weights:
+        n = len(weights)
+        if n == 0:
             return 0.0
         
-        return sum(weights) / len(weights)
+        if n < self.VECTORIZE_MIN_WEIGHTS and not isinstance(weights, np.ndarray):
+            return sum(weights) / n
+        
+        return float(np.mean(weights))
 
@@ -3,11 +3,13 @@ Public interfaces for the Sentiment Aggregator.
 """
 
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AggregatedSentiment(BaseModel):
     """Aggregated sentiment result."""
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     aggregated_sentiment: float  # -1.0 to +1.0
     sentiment_label: str  # positive, neutral, negative
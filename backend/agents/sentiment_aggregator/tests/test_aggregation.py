@@ -0,0 +1,299 @@
+"""
+Unit Tests for Aggregation Components
+
+Tests for:
+- ImpactScorer (impact levels, batch scoring, recency score)
+- TimeWeightedAggregator (decay weights, loop/vectorized equivalence)
+- StreamingTimeWeightedAggregator (matches batch exponential decay)
+- SentimentAggregator confidence filtering
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from ..agent import SentimentAggregator
+from ..aggregation import ImpactScorer, StreamingTimeWeightedAggregator, TimeWeightedAggregator
+
+
+class TestImpactScorer:
+    """
+    Test suite for ImpactScorer.
+    """
+
+    def test_calculate_impact_levels(self):
+        """Strong, well-covered sentiment is High; weak or sparse sentiment is Low."""
+        scorer = ImpactScorer()
+
+        assert scorer.calculate_impact(0.9, 20, recency=1.0, confidence=0.9) == "High"
+        assert scorer.calculate_impact(0.5, 8, recency=0.5, confidence=0.5) == "Medium"
+        assert scorer.calculate_impact(0.9, 2, recency=1.0, confidence=0.9) == "Low"
+        assert scorer.calculate_impact(0.0, 0) == "Low"
+
+    def test_calculate_impact_batch_matches_scalar(self):
+        """Batch scoring gives the same levels as per-symbol scoring."""
+        scorer = ImpactScorer()
+        rng = np.random.default_rng(0)
+        sentiments = rng.uniform(-1.0, 1.0, 500)
+        counts = rng.integers(0, 30, 500)
+        recency = rng.uniform(0.0, 1.0, 500)
+        confidence = rng.uniform(0.0, 1.0, 500)
+
+        batch = scorer.calculate_impact_batch(sentiments, counts, recency, confidence)
+        scalar = [
+            scorer.calculate_impact(float(s), int(c), float(r), float(f))
+            for s, c, r, f in zip(sentiments, counts, recency, confidence)
+        ]
+        assert batch.tolist() == scalar
+
+        batch_defaults = scorer.calculate_impact_batch(sentiments, counts)
+        scalar_defaults = [
+            scorer.calculate_impact(float(s), int(c))
+            for s, c in zip(sentiments, counts)
+        ]
+        assert batch_defaults.tolist() == scalar_defaults
+
+    def test_calculate_recency_score(self):
+        """Recency is the mean weight for lists and arrays of any length."""
+        scorer = ImpactScorer()
+
+        assert scorer.calculate_recency_score([]) == 0.0
+        assert abs(scorer.calculate_recency_score([0.9, 0.8, 0.7]) - 0.8) < 1e-9
+        assert abs(scorer.calculate_recency_score([0.25] * 100) - 0.25) < 1e-9
+        assert abs(scorer.calculate_recency_score(np.array([0.5, 1.0])) - 0.75) < 1e-9
+
+
+class TestTimeWeightedAggregator:
+    """
+    Test suite for TimeWeightedAggregator.
+    """
+
+    NOW = datetime(2024, 1, 8, 12, 0, 0, tzinfo=timezone.utc)
+
+    def _score(self, sentiment, hours_ago=None, confidence=0.8):
+        score = {"sentiment_score": sentiment, "confidence": confidence}
+        if hours_ago is not None:
+            score["processed_at"] = (
+                (self.NOW - timedelta(hours=hours_ago)).replace(tzinfo=None).isoformat() + "Z"
+            )
+        return score
+
+    def test_exponential_decay_weights(self):
+        """Weights halve every half-life and drop to zero beyond max age."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1d", "return_weights": True})
+        scores = [self._score(0.5, 0), self._score(0.5, 24), self._score(0.5, 100), self._score(0.5)]
+
+        result = aggregator.aggregate(scores, "AAPL", current_time=self.NOW)
+
+        assert np.allclose(result["weights_applied"], [1.0, 0.5, 0.0, 1.0])
+        assert abs(result["total_weight"] - 2.5) < 1e-9
+
+    def test_weights_applied_is_opt_in(self):
+        """Per-article weights are only returned when return_weights is set."""
+        scores = [self._score(0.5, 0), self._score(0.5, 24)]
+
+        result = TimeWeightedAggregator().aggregate(scores, "AAPL", current_time=self.NOW)
+        assert "weights_applied" not in result
+        assert "weights_applied" not in TimeWeightedAggregator().aggregate([], "AAPL")
+
+        aggregator = TimeWeightedAggregator(config={"return_weights": True})
+        large = aggregator.aggregate(scores * 50, "AAPL", current_time=self.NOW)
+        assert isinstance(large["weights_applied"], list) and len(large["weights_applied"]) == 100
+
+    def test_weighted_average(self):
+        """Recent articles dominate the aggregated sentiment."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1d"})
+        scores = [self._score(0.9, 0, confidence=1.0), self._score(-0.9, 24, confidence=0.4)]
+
+        result = aggregator.aggregate(scores, "AAPL", current_time=self.NOW)
+
+        assert abs(result["aggregated_sentiment"] - 0.3) < 1e-9
+        assert abs(result["confidence"] - 0.8) < 1e-9
+        assert result["sentiment_label"] == "neutral"
+
+    def test_all_expired_falls_back_to_simple_average(self):
+        """With zero total weight the plain average is used."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1h"})
+        scores = [self._score(0.6, 10), self._score(0.2, 20)]
+
+        result = aggregator.aggregate(scores, "AAPL", current_time=self.NOW)
+
+        assert result["total_weight"] == 0.0
+        assert abs(result["aggregated_sentiment"] - 0.4) < 1e-9
+
+    def test_single_article(self):
+        """One article aggregates to its own scores with its own weight."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1d", "return_weights": True})
+
+        for hours_ago, weight in ((24, 0.5), (100, 0.0), (None, 1.0)):
+            result = aggregator.aggregate(
+                [self._score(-0.6, hours_ago, confidence=0.9)], "AAPL", current_time=self.NOW
+            )
+            assert result["aggregated_sentiment"] == -0.6
+            assert result["confidence"] == 0.9
+            assert result["sentiment_label"] == "negative"
+            assert abs(result["total_weight"] - weight) < 1e-9
+            assert np.allclose(result["weights_applied"], [weight])
+
+    def test_get_returns_cached_instances(self):
+        """get() shares one instance per configuration."""
+        hourly = TimeWeightedAggregator.get(time_horizon="1h")
+
+        assert TimeWeightedAggregator.get(time_horizon="1h") is hourly
+        assert hourly.half_life_hours == 2 and hourly.max_age_hours == 6
+
+        weekly = TimeWeightedAggregator.get(time_horizon="1w", decay_type="linear")
+        assert weekly is not hourly
+        assert weekly.decay_type == "linear" and weekly.max_age_hours == 168
+
+    def test_parse_datetime(self):
+        """ISO strings parse to UTC-aware datetimes; bad strings fall back to now."""
+        aggregator = TimeWeightedAggregator()
+
+        assert aggregator._parse_datetime("2024-01-08T12:00:00Z") == self.NOW
+        assert aggregator._parse_datetime("2024-01-08T12:00:00") == self.NOW
+        assert aggregator._parse_datetime("2024-01-08T14:00:00+02:00") == self.NOW
+        assert aggregator._parse_datetime("2024-01-08T07:00:00-05:00") == self.NOW
+
+        # The fallback is not cached: each call returns the current time
+        first = aggregator._parse_datetime("not a date")
+        second = aggregator._parse_datetime("not a date")
+        assert first.tzinfo is not None
+        assert second >= first
+
+    def test_prepare_precomputes_timestamps(self):
+        """Prepared scores carry _ts_ns and aggregate to the same result."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1w", "return_weights": True})
+        scores = [self._score(0.5, 1), self._score(-0.2, 30), self._score(0.1)]
+
+        expected = aggregator.aggregate([dict(s) for s in scores], "AAPL", current_time=self.NOW)
+        prepared = aggregator.prepare(scores)
+
+        assert "_ts_ns" in prepared[0] and "_ts_ns" in prepared[1]
+        assert "_ts_ns" not in prepared[2]
+        assert prepared[0]["_ts_ns"] == int((self.NOW - timedelta(hours=1)).timestamp()) * 10**9
+
+        result = aggregator.aggregate(prepared, "AAPL", current_time=self.NOW)
+        assert abs(result["aggregated_sentiment"] - expected["aggregated_sentiment"]) < 1e-12
+        assert np.allclose(result["weights_applied"], expected["weights_applied"])
+
+    def test_integer_timestamps(self):
+        """processed_at_ts is used instead of parsing processed_at."""
+        aggregator = TimeWeightedAggregator(config={"time_horizon": "1d", "return_weights": True})
+        ts_ns = int((self.NOW - timedelta(hours=24)).timestamp()) * 10**9
+        # The ISO string disagrees on purpose: the integer must win
+        score = {"sentiment_score": 0.5, "processed_at": "2020-01-01T00:00:00Z", "processed_at_ts": ts_ns}
+
+        for scores in ([score], [score, score], [score] * 100):
+            result = aggregator.aggregate(scores, "AAPL", current_time=self.NOW)
+            assert np.allclose(result["weights_applied"], 0.5)
+
+        assert "_ts_ns" not in aggregator.prepare([dict(score)])[0]
+
+    def test_loop_and_vectorized_paths_agree(self):
+        """Small and large inputs use different paths with the same results."""
+        rng = np.random.default_rng(0)
+        scores = [
+            self._score(float(s), float(h) if h < 150 else None, float(c))
+            for s, h, c in zip(
+                rng.uniform(-1, 1, 200), rng.uniform(-2, 200, 200), rng.uniform(0, 1, 200)
+            )
+        ]
+
+        for decay_type in ("exponential", "linear"):
+            aggregator = TimeWeightedAggregator(config={"decay_type": decay_type, "time_horizon": "1w"})
+            loop = aggregator._weighted_average_loop(scores, self.NOW)
+            vectorized = aggregator._weighted_average_vectorized(scores, self.NOW)
+
+            assert np.allclose(loop[0], vectorized[0])
+            assert np.allclose(loop[1], vectorized[1])
+            assert np.allclose(loop[2], vectorized[2])
+            assert np.allclose(loop[3], vectorized[3])
+
+
+class TestStreamingTimeWeightedAggregator:
+    """
+    Test suite for StreamingTimeWeightedAggregator.
+    """
+
+    def test_matches_batch_aggregation(self):
+        """Incremental sums equal a batch aggregate at the latest article's time."""
+        rng = np.random.default_rng(0)
+        now = TestTimeWeightedAggregator.NOW
+        hours_ago = rng.uniform(0, 60, 100)
+        sentiments = rng.uniform(-1, 1, 100)
+        confidences = rng.uniform(0, 1, 100)
+
+        config = {"time_horizon": "1d"}
+        stream = StreamingTimeWeightedAggregator(config=config)
+        scores = []
+        # Random order: many articles arrive after newer ones
+        for h, s, c in zip(hours_ago, sentiments, confidences):
+            ts_ns = int((now - timedelta(hours=float(h))).timestamp()) * 10**9
+            stream.add(float(s), ts_ns, confidence=float(c))
+            scores.append({"sentiment_score": float(s), "confidence": float(c), "_ts_ns": ts_ns})
+
+        latest = datetime.fromtimestamp(max(s["_ts_ns"] for s in scores) / 10**9, tz=timezone.utc)
+        expected = TimeWeightedAggregator(config=config).aggregate(scores, "AAPL", current_time=latest)
+
+        assert stream.news_count == 100
+        assert abs(stream.value - expected["aggregated_sentiment"]) < 1e-9
+        assert abs(stream.confidence - expected["confidence"]) < 1e-9
+        assert abs(stream.total_weight - expected["total_weight"]) < 1e-9
+
+    def test_empty_and_reset(self):
+        """An empty stream reports zeros; reset clears accumulated articles."""
+        stream = StreamingTimeWeightedAggregator()
+        assert stream.value == 0.0 and stream.confidence == 0.0
+
+        stream.add(0.5, 0)
+        assert stream.value == 0.5
+        stream.reset()
+        assert stream.news_count == 0 and stream.total_weight == 0.0
+
+
+class TestSentimentAggregatorFiltering:
+    """
+    Test suite for confidence filtering in SentimentAggregator.process.
+    """
+
+    @staticmethod
+    def _scores(confidences):
+        now = "2024-01-08T12:00:00Z"
+        return [
+            {"sentiment_score": 0.5, "confidence": c, "published_at": now}
+            for c in confidences
+        ]
+
+    def test_all_scores_pass_threshold(self):
+        """No article is dropped when every confidence meets the threshold."""
+        agent = SentimentAggregator(config={"use_time_weighting": False})
+        agent.initialize()
+
+        result = agent.process("AAPL", {"sentiment_scores": self._scores([0.9, 0.8, 0.7])})
+
+        assert result["news_count"] == 3
+
+    def test_low_confidence_scores_filtered(self):
+        """Articles below the horizon's confidence threshold are dropped."""
+        agent = SentimentAggregator(config={"use_time_weighting": False})
+        agent.initialize()
+
+        result = agent.process(
+            "AAPL",
+            {"sentiment_scores": self._scores([0.9, 0.1, 0.8, 0.2]), "time_horizon": "1d"}
+        )
+
+        assert result["news_count"] == 2
+
+    def test_error_response_shape(self):
+        """Error responses carry the success keys plus a message."""
+        agent = SentimentAggregator(config={"use_time_weighting": False})
+        agent.initialize()
+
+        success = agent.process("AAPL", {"sentiment_scores": self._scores([0.9])})
+        error = agent.process("AAPL", {"sentiment_scores": [], "time_horizon": "1w"})
+
+        assert error["status"] == "error"
+        assert error["time_horizon"] == "1w"
+        assert list(error) == list(success) + ["message"]
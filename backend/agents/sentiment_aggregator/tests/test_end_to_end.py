@@ -137,13 +137,13 @@ def test_time_weighting():
             "article_id": "recent",
             "sentiment_score": 0.80,
             "confidence": 0.90,
-            "processed_at": (now - timedelta(hours=1)).isoformat() + "Z"  # Recent
+            "processed_at_ts": int((now - timedelta(hours=1)).timestamp() * 1e9)  # Recent
         },
         {
             "article_id": "old",
             "sentiment_score": 0.60,
             "confidence": 0.80,
-            "processed_at": (now - timedelta(hours=48)).isoformat() + "Z"  # Old
+            "processed_at_ts": int((now - timedelta(hours=48)).timestamp() * 1e9)  # Old
         }
     ]
     
@@ -5,6 +5,7 @@ Tests the complete pipeline for all three Developer 1 agents.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -35,25 +36,34 @@ def test_full_pipeline():
     # Test with multiple tickers
     test_tickers = ["AAPL", "MSFT"]
     
+    def fetch_and_analyze(ticker):
+        """Steps 1-2 for one ticker (waits on the news/LLM clients)."""
+        news_result = news_agent.process(ticker, params={"limit": 5, "min_relevance": 0.3})
+        articles = news_result.get("articles", [])
+        if not articles:
+            return articles, []
+        sentiment_result = sentiment_agent.process(ticker, params={"articles": articles})
+        return articles, sentiment_result.get("sentiment_scores", [])
+    
+    # Steps 1-2 run for all tickers at once: each LLM call waits on the
+    # client, so tickers overlap instead of queueing behind each other
+    print(f"\n[STEP 1-2] Fetching news and analyzing sentiment for {len(test_tickers)} tickers...")
+    with ThreadPoolExecutor(max_workers=len(test_tickers)) as pool:
+        analyzed = dict(zip(test_tickers, pool.map(fetch_and_analyze, test_tickers)))
+    
     for ticker in test_tickers:
+        articles, sentiment_scores = analyzed[ticker]
+        
         print(f"\n{'='*70}")
         print(f"PROCESSING: {ticker}")
         print(f"{'='*70}")
         
-        # Step 1: Fetch news
-        print(f"\n[STEP 1] Fetching news for {ticker}...")
-        news_result = news_agent.process(ticker, params={"limit": 5, "min_relevance": 0.3})
-        articles = news_result.get("articles", [])
         print(f"[OK] Fetched {len(articles)} articles")
         
         if not articles:
             print(f"[SKIP] No articles for {ticker}, skipping...")
             continue
         
-        # Step 2: Analyze sentiment
-        print(f"\n[STEP 2] Analyzing sentiment for {ticker}...")
-        sentiment_result = sentiment_agent.process(ticker, params={"articles": articles})
-        sentiment_scores = sentiment_result.get("sentiment_scores", [])
         print(f"[OK] Analyzed {len(sentiment_scores)} articles")
         
         if sentiment_scores:
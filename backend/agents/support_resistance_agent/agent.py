@@ -8,17 +8,152 @@ Optimized for efficient processing of 1-100 tickers with:
 - Real-time capable
 """
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import multiprocessing
+import os
+import pickle
+import time
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+
+import pandas as pd
 from core.interfaces.base_agent import BaseAgent
 
 # Import our components
 from .detection import ExtremaDetector, DBSCANClusterer, LevelValidator, VolumeProfileAnalyzer
 from .scoring import StrengthCalculator, LevelProjector
-from .utils import DataLoader, get_logger
+from .utils import DataLoader, TTLCache, get_logger, ohlcv_arrays
 
 logger = get_logger(__name__)
 
+# Default lookback period (days of history) per timeframe
+_TIMEFRAME_LOOKBACK_DAYS = MappingProxyType({
+    '1m': 30,    # 30 days for 1-minute data
+    '5m': 30,
+    '15m': 30,
+    '30m': 30,
+    '1h': 90,    # 90 days for 1-hour data
+    '4h': 90,
+    '1d': 730,   # 2 years for daily data
+    '1w': 1095,  # 3 years for weekly data
+    '1mo': 1825, # 5 years for monthly data
+    '1y': 3650   # 10 years for yearly data
+})
+
+# Length of one bar in days per timeframe (converts projection periods to days)
+_TIMEFRAME_BAR_DAYS = MappingProxyType({
+    '1m': 1/1440, '5m': 5/1440, '15m': 15/1440, '30m': 30/1440,
+    '1h': 1/24, '4h': 4/24,
+    '1d': 1, '1w': 7, '1mo': 30, '1y': 365
+})
+
+# Human-readable labels for the data sources reported in metadata
+_DATA_SOURCE_LABELS = MappingProxyType({
+    "data_agent": "Data Agent (Internal)",
+    "yfinance": "Yahoo Finance (Real-time)",
+    "mock_data": "Mock Data (Test)"
+})
+
+# Per-process agent for detect_levels_batch(use_processes=True); built once per
+# worker so components are not re-created for every ticker
+_batch_worker_agent: Optional["SupportResistanceAgent"] = None
+
+
+def _init_batch_worker(config: Dict[str, Any]) -> None:
+    """Build and initialize this worker process's agent."""
+    global _batch_worker_agent
+    _batch_worker_agent = SupportResistanceAgent(config)
+    _batch_worker_agent.initialize()
+
+
+def _process_in_batch_worker(symbol: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run process() for one ticker in a worker process."""
+    return _batch_worker_agent.process(symbol, params)
+
+
+@lru_cache(maxsize=1)
+def _build_components() -> Tuple[Any, ...]:
+    """
+    Build the parameter-only detection and scoring components, shared across
+    agent instances.
+    
+    These components hold nothing but their fixed parameters, so every agent
+    reuses one set instead of re-creating them per instance. The level
+    projector is not shared: it loads a (retrainable) ML model, so each agent
+    builds its own in initialize().
+    
+    Returns:
+        (extrema_detector, clusterer, validator, strength_calculator,
+         volume_analyzer)
+    """
+    # Initialize detection components with optimized parameters
+    extrema_detector = ExtremaDetector(
+        window_size=5,  # Balanced: not too sensitive, not too strict
+        min_distance=10  # Minimum distance between extrema
+    )
+    
+    clusterer = DBSCANClusterer(
+        eps=0.02,  # 2% price tolerance for clustering
+        min_samples=2  # At least 2 touches for a level (reduced for better detection)
+    )
+    
+    validator = LevelValidator(
+        tolerance=0.005,  # 0.5% tolerance for touches
+        lookforward_bars=5  # Check 5 bars ahead for reactions
+    )
+    
+    # Initialize strength calculator
+    strength_calculator = StrengthCalculator(
+        touch_weight=0.4,  # 40% weight on touch count
+        time_weight=0.3,   # 30% weight on time relevance
+        reaction_weight=0.3  # 30% weight on price reactions
+    )
+    
+    # Initialize volume profile analyzer
+    volume_analyzer = VolumeProfileAnalyzer(
+        num_bins=50,  # 50 price bins for volume histogram
+        min_volume_threshold=0.6,  # Top 40% volume nodes
+        min_touches=2  # Minimum touches for volume levels
+    )
+    
+    return (
+        extrema_detector,
+        clusterer,
+        validator,
+        strength_calculator,
+        volume_analyzer
+    )
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_iso(timestamp: pd.Timestamp, tz: Any) -> str:
+    """
+    ISO string for a pandas Timestamp, memoized.
+    
+    Touch timestamps repeat across responses (cached levels, batch re-runs), so
+    each distinct value is formatted once. tz is part of the key because
+    Timestamps for the same instant in different zones compare equal.
+    """
+    timestamp = timestamp.to_pydatetime()
+    return timestamp.isoformat() + "Z" if timestamp.tzinfo else timestamp.isoformat()
+
+
+def _touch_iso(value: Any) -> Optional[str]:
+    """Convert a first_touch/last_touch value to an ISO string (None stays None)."""
+    if value is None or isinstance(value, str):
+        return value
+    if type(value) is pd.Timestamp:
+        return _timestamp_iso(value, value.tz)
+    
+    # Other datetime-likes
+    if hasattr(value, 'to_pydatetime'):
+        value = value.to_pydatetime()
+    if isinstance(value, datetime):
+        return value.isoformat() + "Z" if value.tzinfo else value.isoformat()
+    return str(value)
+
 
 class SupportResistanceAgent(BaseAgent):
     """
@@ -47,6 +182,10 @@ class SupportResistanceAgent(BaseAgent):
         self.min_strength = self.config.get("min_strength", 50)
         
         # Initialize components (lazy loading for performance)
+        # The detectors, validator, strength calculator and volume analyzer are
+        # shared by every agent in the process (see _build_components): treat
+        # them as read-only and assign a new instance to change parameters.
+        # The data loader and level projector (with its ML model) are per agent.
         self.data_loader: Optional[DataLoader] = None
         self.extrema_detector: Optional[ExtremaDetector] = None
         self.clusterer: Optional[DBSCANClusterer] = None
@@ -56,9 +195,9 @@ class SupportResistanceAgent(BaseAgent):
         self.level_projector: Optional[LevelProjector] = None
         
         # Cache for results (in-memory, can be replaced with Redis for production)
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_timestamps: Dict[str, datetime] = {}
-        self._cache_ttl = timedelta(hours=1)  # Cache expires after 1 hour
+        # Entries expire after 1 hour, sooner as the cache fills; when full, the
+        # cheapest results to recompute are evicted first
+        self._cache = TTLCache(ttl_seconds=3600, max_entries=100)
         
         logger.info("SupportResistanceAgent initialized")
     
@@ -75,37 +214,18 @@ class SupportResistanceAgent(BaseAgent):
                 data_agent=self.config.get("data_agent")
             )
             
-            # Initialize detection components with optimized parameters
-            self.extrema_detector = ExtremaDetector(
-                window_size=5,  # Balanced: not too sensitive, not too strict
-                min_distance=10  # Minimum distance between extrema
-            )
-            
-            self.clusterer = DBSCANClusterer(
-                eps=0.02,  # 2% price tolerance for clustering
-                min_samples=2  # At least 2 touches for a level (reduced for better detection)
-            )
-            
-            self.validator = LevelValidator(
-                tolerance=0.005,  # 0.5% tolerance for touches
-                lookforward_bars=5  # Check 5 bars ahead for reactions
-            )
-            
-            # Initialize strength calculator
-            self.strength_calculator = StrengthCalculator(
-                touch_weight=0.4,  # 40% weight on touch count
-                time_weight=0.3,   # 30% weight on time relevance
-                reaction_weight=0.3  # 30% weight on price reactions
-            )
-            
-            # Initialize volume profile analyzer
-            self.volume_analyzer = VolumeProfileAnalyzer(
-                num_bins=50,  # 50 price bins for volume histogram
-                min_volume_threshold=0.6,  # Top 40% volume nodes
-                min_touches=2  # Minimum touches for volume levels
-            )
+            # Parameter-only detection and scoring components are shared by all
+            # agents (built once per process)
+            (
+                self.extrema_detector,
+                self.clusterer,
+                self.validator,
+                self.strength_calculator,
+                self.volume_analyzer
+            ) = _build_components()
             
-            # Initialize level projector (with optional ML model)
+            # Initialize level projector (with optional ML model); built per agent
+            # so a retrained model at ml_model_path is loaded on initialize()
             ml_model_path = self.config.get("ml_model_path")
             use_ml = self.config.get("use_ml_predictions", True)  # Enable ML by default
             self.level_projector = LevelProjector(use_ml=use_ml, ml_model_path=ml_model_path)
@@ -138,6 +258,7 @@ class SupportResistanceAgent(BaseAgent):
                 - timeframe: Data timeframe ("1m", "1h", "1d", "1w", "1mo", "1y") (default: "1d")
                 - project_future: Predict future levels (default: False)
                 - projection_periods: Number of periods to project ahead (default: 20)
+                - include_summary: Add the key_price_levels summary (default: True)
             
         Returns:
             Dictionary with support/resistance levels
@@ -157,20 +278,24 @@ class SupportResistanceAgent(BaseAgent):
         project_future = params.get("project_future", False)
         projection_periods = params.get("projection_periods", 20)
         lookback_days = params.get("lookback_days")  # Optional custom lookback
+        include_summary = params.get("include_summary", True)
         
         # Check cache first (performance optimization)
-        # Include lookback_days in cache key if provided
-        cache_key_parts = [symbol, str(min_strength), str(max_levels), timeframe, str(project_future)]
-        if lookback_days:
-            cache_key_parts.append(str(lookback_days))
-        cache_key = "_".join(cache_key_parts)
+        cache_key = self._result_cache_key(
+            symbol, min_strength, max_levels, timeframe, project_future, lookback_days,
+            include_summary
+        )
         
-        if use_cache and self._is_cached(cache_key):
+        cached = self._get_cached(cache_key) if use_cache else None
+        if cached is not None:
             logger.info(f"Returning cached results for {symbol}")
-            return self._get_cached(cache_key)
+            return cached
         
         # Detect levels
-        result = self.detect_levels(symbol, min_strength, max_levels, timeframe, project_future, projection_periods, lookback_days)
+        result = self.detect_levels(
+            symbol, min_strength, max_levels, timeframe, project_future, projection_periods, lookback_days,
+            use_cache=use_cache, include_summary=include_summary
+        )
         
         # Cache result
         if use_cache:
@@ -186,7 +311,9 @@ class SupportResistanceAgent(BaseAgent):
         timeframe: str = "1d",
         project_future: bool = False,
         projection_periods: int = 20,
-        lookback_days: Optional[int] = None
+        lookback_days: Optional[int] = None,
+        use_cache: bool = False,
+        include_summary: bool = True
     ) -> Dict[str, Any]:
         """
         Detect support and resistance levels.
@@ -206,227 +333,41 @@ class SupportResistanceAgent(BaseAgent):
             timeframe: Data timeframe ("1m", "1h", "1d", "1w", "1mo", "1y") (default: "1d")
             project_future: Whether to predict future levels (default: False)
             projection_periods: Number of periods ahead to project (default: 20)
+            lookback_days: Custom lookback period in days (default: by timeframe)
+            use_cache: Reuse cached pre-filter levels for this symbol/timeframe/lookback
+                      (default: False)
+            include_summary: Add the key_price_levels summary (default: True)
             
         Returns:
             Dictionary with detected levels
         """
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()  # Monotonic: immune to wall-clock jumps
         
         try:
-            # Step 1: Load data
-            logger.info(f"Loading data for {symbol}...")
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
-            
-            # Determine lookback period: use custom if provided, otherwise use default based on timeframe
-            if lookback_days is not None:
-                # Use custom lookback period
-                actual_lookback_days = lookback_days
-                logger.info(f"Using custom lookback period: {lookback_days} days")
-            else:
-                # Use default lookback period based on timeframe
-                timeframe_days_map = {
-                    '1m': 30,    # 30 days for 1-minute data
-                    '5m': 30,
-                    '15m': 30,
-                    '30m': 30,
-                    '1h': 90,    # 90 days for 1-hour data
-                    '4h': 90,
-                    '1d': 730,   # 2 years for daily data
-                    '1w': 1095,  # 3 years for weekly data
-                    '1mo': 1825, # 5 years for monthly data
-                    '1y': 3650   # 10 years for yearly data
-                }
-                actual_lookback_days = timeframe_days_map.get(timeframe, 730)
-                logger.info(f"Using default lookback period for {timeframe}: {actual_lookback_days} days")
-            
-            df, data_source = self.data_loader.load_ohlcv_data(
-                symbol=symbol,
-                start_date=now - timedelta(days=actual_lookback_days),
-                end_date=now,
-                timeframe=timeframe
+            # Steps 1-5: Load data, then detect, validate and score all levels.
+            # None of this depends on min_strength/max_levels, so with use_cache the
+            # pre-filter levels are cached and reused by requests that only change
+            # the final filter and limit.
+            levels_key = self._levels_cache_key(
+                symbol, timeframe, project_future, projection_periods, lookback_days
             )
-            
-            if df.empty:
-                actual_lookback_days = lookback_days if lookback_days is not None else 730
-                return {
-                    "symbol": symbol,
-                    "status": "error",
-                    "message": f"No data available for {symbol} with the requested parameters (timeframe: {timeframe}, lookback: {actual_lookback_days} days). Try reducing the lookback period or using a different timeframe."
-                }
-            
-            # Check minimum data requirement
-            # For daily data: ~60% of lookback days (accounts for weekends/holidays)
-            # For other timeframes: at least 50 data points or lookback period, whichever is lower
-            if timeframe == "1d":
-                # Daily data: expect ~60% trading days (weekends + holidays reduce available days)
-                min_required = max(50, int(actual_lookback_days * 0.6))
-            else:
-                # For intraday data, use a more lenient requirement
-                min_required = max(30, min(50, actual_lookback_days))
-            
-            if len(df) < min_required:
-                actual_lookback_days = lookback_days if lookback_days is not None else 730
-                logger.warning(f"Only {len(df)} data points available for {symbol}. Minimum {min_required} recommended for reliable detection.")
-                return {
-                    "symbol": symbol,
-                    "status": "error",
-                    "message": f"Insufficient data for {symbol}: Only {len(df)} data points available. Need at least {min_required} data points for {actual_lookback_days} days lookback. Try reducing the lookback period or using a different timeframe."
-                }
-            
-            current_price = float(df.iloc[-1]['close'])
-            
-            # Step 2: Detect extrema
-            logger.debug(f"Detecting extrema for {symbol}...")
-            peaks, valleys = self.extrema_detector.detect_all_extrema(df)
-            
-            # Filter noise (less aggressive for better results)
-            # min_price_change=0.005 means 0.5% change (less strict)
-            peaks = self.extrema_detector.filter_noise(peaks, min_price_change=0.005)
-            valleys = self.extrema_detector.filter_noise(valleys, min_price_change=0.005)
-            
-            # Performance optimization: Limit extrema if too many (prevents slow clustering)
-            max_extrema = 500  # Reasonable limit for fast processing
-            if len(peaks) > max_extrema:
-                logger.warning(f"Too many peaks ({len(peaks)}), limiting to {max_extrema} strongest")
-                # Sort by price (keep most significant) and limit
-                peaks = sorted(peaks, key=lambda x: x['price'], reverse=True)[:max_extrema]
-            if len(valleys) > max_extrema:
-                logger.warning(f"Too many valleys ({len(valleys)}), limiting to {max_extrema} strongest")
-                # Sort by price (keep most significant) and limit
-                valleys = sorted(valleys, key=lambda x: x['price'])[:max_extrema]
-            
-            # Step 3: Cluster extrema into levels
-            logger.debug(f"Clustering extrema for {symbol}...")
-            resistance_levels = self.clusterer.cluster_levels(peaks)
-            support_levels = self.clusterer.cluster_levels(valleys)
-            
-            # Filter weak clusters (allow single touches for now, will be filtered by strength later)
-            resistance_levels = self.clusterer.filter_clusters(resistance_levels, min_touches=1)
-            support_levels = self.clusterer.filter_clusters(support_levels, min_touches=1)
-            
-            # Step 4: Validate levels (optimized for large datasets)
-            logger.info(f"Validating levels for {symbol} ({len(resistance_levels)} resistance, {len(support_levels)} support)...")
-            
-            # Performance optimization: Skip validation for very large datasets or limit validation
-            data_size = len(df)
-            skip_validation = data_size > 200  # Skip validation if more than 200 data points (too slow for real-time)
-            
-            if skip_validation:
-                logger.warning(f"Large dataset ({data_size} points) - skipping validation for performance")
-                # Set default validation values
-                for level in resistance_levels + support_levels:
-                    level['validated'] = False
-                    level['validation_rate'] = 0.5  # Assume moderate validation
-                    level['reaction_count'] = level.get('touches', 0) // 2
-                    level['touch_count'] = level.get('touches', 0)
+            analysis = self._get_cached(levels_key) if use_cache else None
+            if analysis is not None:
+                logger.info(f"Reusing cached levels for {symbol}")
             else:
-                # Limit validation to top levels only (performance optimization)
-                # For smaller datasets, only validate top 10 levels total
-                max_levels_to_validate = min(10, len(resistance_levels) + len(support_levels))
-                resistance_to_validate = sorted(resistance_levels, key=lambda x: x.get('touches', 0), reverse=True)[:max_levels_to_validate // 2]
-                support_to_validate = sorted(support_levels, key=lambda x: x.get('touches', 0), reverse=True)[:max_levels_to_validate // 2]
-                
-                # Validate only the top levels
-                validated_resistance = self.validator.validate_levels(resistance_to_validate, df)
-                validated_support = self.validator.validate_levels(support_to_validate, df)
-                
-                # Merge validated results back with unvalidated (set default validation for unvalidated)
-                validated_dict = {l['price']: l for l in validated_resistance}
-                resistance_levels = [
-                    validated_dict.get(l['price'], {**l, 'validated': False, 'validation_rate': 0.0, 'reaction_count': 0, 'touch_count': l.get('touches', 0)})
-                    for l in resistance_levels
-                ]
-                validated_dict = {l['price']: l for l in validated_support}
-                support_levels = [
-                    validated_dict.get(l['price'], {**l, 'validated': False, 'validation_rate': 0.0, 'reaction_count': 0, 'touch_count': l.get('touches', 0)})
-                    for l in support_levels
-                ]
-            
-            # Step 5: Calculate strength scores
-            logger.debug(f"Calculating strength scores for {symbol}...")
-            from datetime import timezone
-            current_date = datetime.now(timezone.utc)
-            resistance_levels = self.strength_calculator.calculate_strengths(resistance_levels, current_date)
-            support_levels = self.strength_calculator.calculate_strengths(support_levels, current_date)
-            
-            # Step 5.5: Detect volume-based levels and merge
-            logger.debug(f"Analyzing volume profile for {symbol}...")
-            volume_levels = self.volume_analyzer.detect_volume_levels(df)
-            
-            # Calculate strength for volume levels (they may not have all required fields)
-            volume_resistance = [v for v in volume_levels if v.get('type') == 'resistance']
-            volume_support = [v for v in volume_levels if v.get('type') == 'support']
-            
-            # Add default values for volume levels to enable strength calculation
-            for level in volume_resistance + volume_support:
-                if 'validation_rate' not in level:
-                    level['validation_rate'] = 0.5  # Default moderate validation
-                if 'touches' not in level:
-                    level['touches'] = level.get('touch_count', 2)
-            
-            # Calculate strength for volume levels
-            if volume_resistance:
-                volume_resistance = self.strength_calculator.calculate_strengths(volume_resistance, current_date)
-            if volume_support:
-                volume_support = self.strength_calculator.calculate_strengths(volume_support, current_date)
-            
-            # Merge close levels (volume + price)
-            resistance_levels = self.volume_analyzer.merge_with_price_levels(
-                resistance_levels,
-                volume_resistance,
-                merge_tolerance=0.02
-            )
-            support_levels = self.volume_analyzer.merge_with_price_levels(
-                support_levels,
-                volume_support,
-                merge_tolerance=0.02
-            )
-            
-            # Ensure all levels have strength (recalculate if needed after merge)
-            for level in resistance_levels:
-                if 'strength' not in level or level.get('strength', 0) == 0:
-                    level['strength'] = self.strength_calculator.calculate_strength(level, current_date)
-            for level in support_levels:
-                if 'strength' not in level or level.get('strength', 0) == 0:
-                    level['strength'] = self.strength_calculator.calculate_strength(level, current_date)
-            
-            # Step 5.6: Calculate breakout probabilities
-            logger.debug(f"Calculating breakout probabilities for {symbol}...")
-            resistance_levels = self.strength_calculator.calculate_breakout_probabilities(
-                resistance_levels, current_price
-            )
-            support_levels = self.strength_calculator.calculate_breakout_probabilities(
-                support_levels, current_price
-            )
-            
-            # Step 5.7: Project levels forward in time (if requested)
-            predicted_future_levels = []
-            if project_future:
-                logger.debug(f"Predicting future levels for {symbol}...")
-                
-                # Predict new future levels based on patterns
-                predicted_future_levels = self.level_projector.predict_future_levels(
-                    df, current_price, timeframe, projection_periods
+                analysis = self._analyze_levels(
+                    symbol, timeframe, project_future, projection_periods, lookback_days
                 )
-                
-                # Project existing levels forward (add validity projections)
-                # Convert projection_periods to days based on timeframe
-                timeframe_days_map = {
-                    '1m': 1/1440, '5m': 5/1440, '15m': 15/1440, '30m': 30/1440,
-                    '1h': 1/24, '4h': 4/24,
-                    '1d': 1, '1w': 7, '1mo': 30, '1y': 365
-                }
-                projection_days = int(projection_periods * timeframe_days_map.get(timeframe, 1))
-                
-                all_levels = resistance_levels + support_levels
-                for level in all_levels:
-                    projection = self.level_projector.project_level_validity(level, projection_days)
-                    level['projected_valid_until'] = projection.get('valid_until')
-                    level['projected_validity_probability'] = projection.get('validity_probability')
-                    level['projected_strength'] = projection.get('projected_strength')
-                    level['timeframe'] = timeframe
-                    level['projection_periods'] = projection_periods
+                if analysis.get("status") == "error":
+                    return analysis
+                if use_cache:
+                    analysis_time = (time.monotonic_ns() - start_ns) * 1e-9
+                    self._cache_result(levels_key, analysis, cost_seconds=analysis_time)
+            
+            current_price = analysis["current_price"]
+            resistance_levels = analysis["resistance_levels"]
+            support_levels = analysis["support_levels"]
+            predicted_future_levels = analysis["predicted_future_levels"]
             
             # Step 6: Filter by strength and side relative to current price, then limit count.
             # Resistance must sit ABOVE current price, support BELOW — otherwise the level is
@@ -442,6 +383,8 @@ class SupportResistanceAgent(BaseAgent):
 
             # Sort by proximity to current price (closest first), tie-break by strength.
             # Closer levels are more actionable than stronger-but-distant ones.
+            # Lists here are a few dozen levels at most; a plain sort beats NumPy
+            # partitioning (array building dominates) until several hundred.
             resistance_levels = sorted(
                 resistance_levels,
                 key=lambda x: (abs(x['price'] - current_price), -x['strength']),
@@ -453,7 +396,7 @@ class SupportResistanceAgent(BaseAgent):
             )[:max_levels]
             
             # Format response
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = (time.monotonic_ns() - start_ns) * 1e-9
 
             # Format levels
             formatted_support = self._format_levels(support_levels)
@@ -465,13 +408,6 @@ class SupportResistanceAgent(BaseAgent):
             # increments and $500 ticker gets $50 increments.
             psychological_levels = self._compute_psychological_levels(current_price)
             
-            # Create key price levels summary (Price + Strength + Direction format)
-            key_levels_summary = self._create_key_levels_summary(
-                formatted_support, 
-                formatted_resistance, 
-                current_price
-            )
-            
             result = {
                 "symbol": symbol,
                 "timestamp": datetime.utcnow().isoformat() + "Z",
@@ -480,25 +416,33 @@ class SupportResistanceAgent(BaseAgent):
                 "support_levels": formatted_support,
                 "resistance_levels": formatted_resistance,
                 "psychological_levels": psychological_levels,
-                "key_price_levels": key_levels_summary,  # New: Formatted summary
                 "total_levels": len(support_levels) + len(resistance_levels),
                 "nearest_support": support_levels[0]['price'] if support_levels else None,
                 "nearest_resistance": resistance_levels[0]['price'] if resistance_levels else None,
                 "processing_time_seconds": round(processing_time, 3),
                 "metadata": {
-                    "peaks_detected": len(peaks),
-                    "valleys_detected": len(valleys),
-                    "data_points": len(df),
-                    "lookback_days": actual_lookback_days,
+                    "peaks_detected": analysis["peaks_detected"],
+                    "valleys_detected": analysis["valleys_detected"],
+                    "data_points": analysis["data_points"],
+                    "lookback_days": analysis["lookback_days"],
                     "lookback_days_source": "custom" if lookback_days is not None else "default",
                     "default_lookback_days": self._get_default_lookback_days(timeframe),
                     "timeframe": timeframe,
                     "custom_lookback": lookback_days is not None,
-                    "data_source": data_source,
-                    "data_source_label": self._get_data_source_label(data_source)
+                    "data_source": analysis["data_source"],
+                    "data_source_label": self._get_data_source_label(analysis["data_source"])
                 }
             }
             
+            # Add key price levels summary (Price + Strength + Direction format)
+            # unless the caller only consumes the level lists (batch detection)
+            if include_summary:
+                result["key_price_levels"] = self._create_key_levels_summary(
+                    formatted_support,
+                    formatted_resistance,
+                    current_price
+                )
+            
             # Add predicted future levels if requested
             if project_future and predicted_future_levels:
                 result["predicted_future_levels"] = self._format_predicted_levels(predicted_future_levels)
@@ -521,12 +465,207 @@ class SupportResistanceAgent(BaseAgent):
                 "message": str(e)
             }
     
+    def _analyze_levels(
+        self,
+        symbol: str,
+        timeframe: str,
+        project_future: bool,
+        projection_periods: int,
+        lookback_days: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        Run the detection pipeline up to (not including) filtering and ranking.
+        
+        Returns all scored levels plus the context detect_levels needs to build
+        its response, or an error dictionary if the data is unusable.
+        """
+        # Step 1: Load data
+        logger.info(f"Loading data for {symbol}...")
+        now = datetime.now(timezone.utc)
+        
+        # Determine lookback period: use custom if provided, otherwise use default based on timeframe
+        if lookback_days is not None:
+            # Use custom lookback period
+            actual_lookback_days = lookback_days
+            logger.info(f"Using custom lookback period: {lookback_days} days")
+        else:
+            # Use default lookback period based on timeframe
+            actual_lookback_days = _TIMEFRAME_LOOKBACK_DAYS.get(timeframe, 730)
+            logger.info(f"Using default lookback period for {timeframe}: {actual_lookback_days} days")
+        
+        df, data_source = self.data_loader.load_ohlcv_data(
+            symbol=symbol,
+            start_date=now - timedelta(days=actual_lookback_days),
+            end_date=now,
+            timeframe=timeframe
+        )
+        
+        if df.empty:
+            actual_lookback_days = lookback_days if lookback_days is not None else 730
+            return {
+                "symbol": symbol,
+                "status": "error",
+                "message": f"No data available for {symbol} with the requested parameters (timeframe: {timeframe}, lookback: {actual_lookback_days} days). Try reducing the lookback period or using a different timeframe."
+            }
+        
+        # Check minimum data requirement
+        # For daily data: ~60% of lookback days (accounts for weekends/holidays)
+        # For other timeframes: at least 50 data points or lookback period, whichever is lower
+        if timeframe == "1d":
+            # Daily data: expect ~60% trading days (weekends + holidays reduce available days)
+            min_required = max(50, int(actual_lookback_days * 0.6))
+        else:
+            # For intraday data, use a more lenient requirement
+            min_required = max(30, min(50, actual_lookback_days))
+        
+        if len(df) < min_required:
+            actual_lookback_days = lookback_days if lookback_days is not None else 730
+            logger.warning(f"Only {len(df)} data points available for {symbol}. Minimum {min_required} recommended for reliable detection.")
+            return {
+                "symbol": symbol,
+                "status": "error",
+                "message": f"Insufficient data for {symbol}: Only {len(df)} data points available. Need at least {min_required} data points for {actual_lookback_days} days lookback. Try reducing the lookback period or using a different timeframe."
+            }
+        
+        # Column arrays shared by the validation and volume stages
+        ohlcv = ohlcv_arrays(df)
+        current_price = float(ohlcv['close'][-1])
+        
+        # Step 2: Detect extrema
+        logger.debug(f"Detecting extrema for {symbol}...")
+        peaks, valleys = self.extrema_detector.detect_all_extrema(df)
+        
+        # Filter noise (less aggressive for better results)
+        # min_price_change=0.005 means 0.5% change (less strict)
+        peaks = self.extrema_detector.filter_noise(peaks, min_price_change=0.005)
+        valleys = self.extrema_detector.filter_noise(valleys, min_price_change=0.005)
+        
+        # Performance optimization: Limit extrema if too many (prevents slow clustering)
+        max_extrema = 500  # Reasonable limit for fast processing
+        if len(peaks) > max_extrema:
+            logger.warning(f"Too many peaks ({len(peaks)}), limiting to {max_extrema} strongest")
+            # Sort by price (keep most significant) and limit
+            peaks = sorted(peaks, key=lambda x: x['price'], reverse=True)[:max_extrema]
+        if len(valleys) > max_extrema:
+            logger.warning(f"Too many valleys ({len(valleys)}), limiting to {max_extrema} strongest")
+            # Sort by price (keep most significant) and limit
+            valleys = sorted(valleys, key=lambda x: x['price'])[:max_extrema]
+        
+        # Step 3: Cluster extrema into levels
+        logger.debug(f"Clustering extrema for {symbol}...")
+        # Weak clusters are filtered while clustering (allow single touches for
+        # now, will be filtered by strength later)
+        resistance_levels = self.clusterer.cluster_levels(peaks, min_touches=1)
+        support_levels = self.clusterer.cluster_levels(valleys, min_touches=1)
+        
+        # Step 4: Validate levels (optimized for large datasets)
+        logger.info(f"Validating levels for {symbol} ({len(resistance_levels)} resistance, {len(support_levels)} support)...")
+        
+        # Limit validation to top levels only (performance optimization)
+        # Validation is batched across levels, so it runs on the full history
+        # regardless of dataset size; only the top 10 levels are validated
+        max_levels_to_validate = min(10, len(resistance_levels) + len(support_levels))
+        resistance_to_validate = sorted(resistance_levels, key=lambda x: x.get('touches', 0), reverse=True)[:max_levels_to_validate // 2]
+        support_to_validate = sorted(support_levels, key=lambda x: x.get('touches', 0), reverse=True)[:max_levels_to_validate // 2]
+        
+        # Validate only the top levels
+        self.validator.validate_levels(resistance_to_validate, df, ohlcv)
+        self.validator.validate_levels(support_to_validate, df, ohlcv)
+        
+        # Validation updates the level dicts in place; give the unvalidated
+        # levels default validation values the same way (no dict copies)
+        for level in resistance_levels + support_levels:
+            if 'validated' not in level:
+                level['validated'] = False
+                level['validation_rate'] = 0.0
+                level['reaction_count'] = 0
+                level['touch_count'] = level.get('touches', 0)
+        
+        # Step 5: Detect volume-based levels and merge
+        logger.debug(f"Analyzing volume profile for {symbol}...")
+        volume_levels = self.volume_analyzer.detect_volume_levels(df, ohlcv)
+        
+        # Split volume levels by type in one pass, adding default values to
+        # enable strength calculation (they may not have all required fields)
+        volume_by_type = {'resistance': [], 'support': []}
+        for level in volume_levels:
+            group = volume_by_type.get(level.get('type'))
+            if group is None:
+                continue
+            if 'validation_rate' not in level:
+                level['validation_rate'] = 0.5  # Default moderate validation
+            if 'touches' not in level:
+                level['touches'] = level.get('touch_count', 2)
+            group.append(level)
+        volume_resistance = volume_by_type['resistance']
+        volume_support = volume_by_type['support']
+        
+        # Merge close levels (volume + price)
+        resistance_levels = self.volume_analyzer.merge_with_price_levels(
+            resistance_levels,
+            volume_resistance,
+            merge_tolerance=0.02
+        )
+        support_levels = self.volume_analyzer.merge_with_price_levels(
+            support_levels,
+            volume_support,
+            merge_tolerance=0.02
+        )
+        
+        # Step 5.5: Calculate strength scores and breakout probabilities in one
+        # vectorized pass over the merged levels (merging does not read strength)
+        # Levels are aged against the same clock reading used to load the data
+        logger.debug(f"Calculating strength scores and breakout probabilities for {symbol}...")
+        resistance_levels = self.strength_calculator.compute_all(
+            resistance_levels, current_price, now
+        )
+        support_levels = self.strength_calculator.compute_all(
+            support_levels, current_price, now
+        )
+        
+        # Step 5.6: Project levels forward in time (if requested)
+        predicted_future_levels = []
+        if project_future:
+            logger.debug(f"Predicting future levels for {symbol}...")
+            
+            # Predict new future levels based on patterns
+            predicted_future_levels = self.level_projector.predict_future_levels(
+                df, current_price, timeframe, projection_periods
+            )
+            
+            # Project existing levels forward (add validity projections)
+            # Convert projection_periods to days based on timeframe
+            projection_days = int(projection_periods * _TIMEFRAME_BAR_DAYS.get(timeframe, 1))
+            
+            all_levels = resistance_levels + support_levels
+            projections = self.level_projector.project_level_validity_batch(all_levels, projection_days)
+            for level, projection in zip(all_levels, projections):
+                level['projected_valid_until'] = projection.get('valid_until')
+                level['projected_validity_probability'] = projection.get('validity_probability')
+                level['projected_strength'] = projection.get('projected_strength')
+                level['timeframe'] = timeframe
+                level['projection_periods'] = projection_periods
+        
+        return {
+            "current_price": current_price,
+            "resistance_levels": resistance_levels,
+            "support_levels": support_levels,
+            "predicted_future_levels": predicted_future_levels,
+            "peaks_detected": len(peaks),
+            "valleys_detected": len(valleys),
+            "data_points": len(df),
+            "lookback_days": actual_lookback_days,
+            "data_source": data_source
+        }
+    
     def detect_levels_batch(
         self,
         symbols: List[str],
         min_strength: int = 50,
         max_levels: int = 5,
-        use_parallel: bool = False
+        use_parallel: bool = False,
+        use_processes: bool = False,
+        include_summary: bool = False
     ) -> Dict[str, Dict[str, Any]]:
         """
         Detect levels for multiple tickers efficiently.
@@ -544,33 +683,86 @@ class SupportResistanceAgent(BaseAgent):
             use_parallel: Use parallel processing (default: False)
                         - True: Faster for 10+ tickers
                         - False: Simpler, works for any number
+            use_processes: With use_parallel, run tickers in worker processes instead
+                          of threads (default: False)
+                        - True: Detection runs on all cores (CPU-bound pipeline)
+                        - False: Threads, better when data loading dominates
+                        Falls back to threads if the agent config cannot be
+                        sent to worker processes (e.g. a live data_agent)
+            include_summary: Add the key_price_levels summary to each result
+                            (default: False - batch callers read the level lists)
         
         Returns:
             Dictionary mapping symbol to results
         """
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         results = {}
+        params = {
+            "min_strength": min_strength,
+            "max_levels": max_levels,
+            "use_cache": True,
+            "include_summary": include_summary
+        }
         
         logger.info(f"Starting batch detection for {len(symbols)} tickers...")
         
+        if use_processes and use_parallel and len(symbols) > 5:
+            try:
+                pickle.dumps(self.config)
+            except Exception as e:
+                logger.warning(f"Agent config cannot be sent to worker processes ({e}), using threads")
+                use_processes = False
+        
         if use_parallel and len(symbols) > 5:
             # Parallel processing for large batches
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
             
-            with ThreadPoolExecutor(max_workers=min(10, len(symbols))) as executor:
-                future_to_symbol = {
-                    executor.submit(self.process, symbol, {
-                        "min_strength": min_strength,
-                        "max_levels": max_levels,
-                        "use_cache": True
-                    }): symbol
+            if use_processes:
+                # Serve cache hits here; workers only run the detection pipeline
+                result_keys = {
+                    symbol: self._result_cache_key(
+                        symbol, min_strength, max_levels, "1d", False, None, include_summary
+                    )
                     for symbol in symbols
                 }
+                pending = []
+                for symbol in symbols:
+                    cached = self._get_cached(result_keys[symbol])
+                    if cached is not None:
+                        results[symbol] = cached
+                    else:
+                        pending.append(symbol)
+                
+                worker_params = {**params, "use_cache": False}
+                # Spawn fresh interpreters: forking a process that already has
+                # network/HTTP client threads (yfinance) can crash the workers
+                executor = ProcessPoolExecutor(
+                    max_workers=max(1, min(os.cpu_count() or 1, len(pending))),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker,
+                    initargs=(self.config,)
+                )
+                run, run_params = _process_in_batch_worker, worker_params
+            else:
+                pending = list(symbols)
+                executor = ThreadPoolExecutor(max_workers=min(10, len(symbols)))
+                run, run_params = self.process, params
+            
+            with executor:
+                future_to_symbol = {
+                    executor.submit(run, symbol, run_params): symbol
+                    for symbol in pending
+                }
                 
                 for future in as_completed(future_to_symbol):
                     symbol = future_to_symbol[future]
                     try:
                         results[symbol] = future.result()
+                        if use_processes:
+                            self._cache_result(
+                                result_keys[symbol],
+                                results[symbol]
+                            )
                     except Exception as e:
                         logger.error(f"Error processing {symbol}: {e}")
                         results[symbol] = {
@@ -582,13 +774,9 @@ class SupportResistanceAgent(BaseAgent):
             # Sequential processing (simpler, more reliable)
             for i, symbol in enumerate(symbols, 1):
                 logger.info(f"Processing {symbol} ({i}/{len(symbols)})...")
-                results[symbol] = self.process(symbol, {
-                    "min_strength": min_strength,
-                    "max_levels": max_levels,
-                    "use_cache": True
-                })
+                results[symbol] = self.process(symbol, params)
         
-        total_time = (datetime.utcnow() - start_time).total_seconds()
+        total_time = (time.monotonic_ns() - start_ns) * 1e-9
         avg_time = total_time / len(symbols) if symbols else 0
         
         logger.info(
@@ -642,63 +830,46 @@ class SupportResistanceAgent(BaseAgent):
 
     def _format_levels(self, levels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Format levels for response."""
-        formatted = []
-        for level in levels:
+        return [self._format_level(level) for level in levels]
+    
+    def _format_level(self, level: Dict[str, Any]) -> Dict[str, Any]:
+        """Format one level for response."""
+        get = level.get  # Bound once; read for every field below
+        
+        formatted_level = {
+            "price": level['price'],
+            "strength": level['strength'],
+            "type": get('type', 'unknown'),
+            "touches": get('touches', get('touch_count', 0)),
+            "validated": get('validated', False),
+            "validation_rate": get('validation_rate', 0.0),
+            "breakout_probability": round(get('breakout_probability', 0.0), 1),  # Add breakout probability
             # Convert datetime objects to ISO format strings for JSON serialization
-            first_touch = level.get('first_touch')
-            last_touch = level.get('last_touch')
-            
-            # Handle pandas Timestamp objects
-            if first_touch is not None:
-                if hasattr(first_touch, 'to_pydatetime'):
-                    first_touch = first_touch.to_pydatetime()
-                if isinstance(first_touch, datetime):
-                    first_touch = first_touch.isoformat() + "Z" if first_touch.tzinfo else first_touch.isoformat()
-                elif not isinstance(first_touch, str):
-                    first_touch = str(first_touch)
-            
-            if last_touch is not None:
-                if hasattr(last_touch, 'to_pydatetime'):
-                    last_touch = last_touch.to_pydatetime()
-                if isinstance(last_touch, datetime):
-                    last_touch = last_touch.isoformat() + "Z" if last_touch.tzinfo else last_touch.isoformat()
-                elif not isinstance(last_touch, str):
-                    last_touch = str(last_touch)
-            
-            formatted_level = {
-                "price": level['price'],
-                "strength": level['strength'],
-                "type": level.get('type', 'unknown'),
-                "touches": level.get('touches', level.get('touch_count', 0)),
-                "validated": level.get('validated', False),
-                "validation_rate": level.get('validation_rate', 0.0),
-                "breakout_probability": round(level.get('breakout_probability', 0.0), 1),  # Add breakout probability
-                "first_touch": first_touch,
-                "last_touch": last_touch
-            }
-            
-            # Add volume information if available
-            if 'volume' in level:
-                formatted_level['volume'] = level.get('volume', 0)
-                formatted_level['volume_percentile'] = round(level.get('volume_percentile', 0.0), 1)
-                formatted_level['has_volume_confirmation'] = level.get('has_volume_confirmation', False)
-            
-            formatted.append(formatted_level)
-        return formatted
+            "first_touch": _touch_iso(get('first_touch')),
+            "last_touch": _touch_iso(get('last_touch'))
+        }
+        
+        # Add volume information if available
+        if 'volume' in level:
+            formatted_level['volume'] = get('volume', 0)
+            formatted_level['volume_percentile'] = round(get('volume_percentile', 0.0), 1)
+            formatted_level['has_volume_confirmation'] = get('has_volume_confirmation', False)
+        
+        return formatted_level
     
     def _format_predicted_levels(self, predicted_levels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Format predicted future levels for response."""
-        formatted = []
-        for level in predicted_levels:
-            formatted.append({
+        return [
+            {
                 "price": level['price'],
                 "type": level.get('type', 'unknown'),
                 "source": level.get('source', 'pattern'),
                 "confidence": round(level.get('confidence', 0), 1),
                 "projected_timeframe": level.get('projected_timeframe', 20),
                 "is_predicted": True
-            })
-        return formatted
+            }
+            for level in predicted_levels
+        ]
     
     def _create_key_levels_summary(
         self, 
@@ -720,109 +891,112 @@ class SupportResistanceAgent(BaseAgent):
         Returns:
             List of key levels with formatted summary
         """
-        key_levels = []
-        
-        # Combine all levels and sort by price
-        all_levels = []
-        for level in support_levels:
-            all_levels.append({
-                **level,
-                "direction": "SUPPORT"  # Direction: price bounces UP from support
-            })
-        for level in resistance_levels:
-            all_levels.append({
-                **level,
-                "direction": "RESISTANCE"  # Direction: price bounces DOWN from resistance
-            })
+        # Build the summary entries for both sides in one pass
+        # (direction: price bounces UP from support, DOWN from resistance)
+        key_levels = [
+            self._build_key_level(level, current_price, "SUPPORT") for level in support_levels
+        ] + [
+            self._build_key_level(level, current_price, "RESISTANCE") for level in resistance_levels
+        ]
         
         # Sort by strength (highest first) to get key levels
-        all_levels.sort(key=lambda x: x.get('strength', 0), reverse=True)
-        
-        # Create formatted summary for each key level
-        for level in all_levels:
-            price = level.get('price', 0)
-            strength = level.get('strength', 0)
-            breakout_prob = level.get('breakout_probability', 0.0)
-            direction = level.get('direction', 'UNKNOWN')
-            level_type = level.get('type', 'unknown')
-            
-            # Determine relative position to current price
-            if price < current_price:
-                position = "BELOW"
-            elif price > current_price:
-                position = "ABOVE"
-            else:
-                position = "AT"
-            
-            # Create formatted string: Price + Strength + Direction
-            formatted_string = f"${price:.2f} | Strength: {strength}/100 | {direction} | Breakout: {breakout_prob}%"
-            
-            key_levels.append({
-                "price": round(price, 2),
-                "strength": strength,
-                "strength_score": f"{strength}/100",  # Formatted strength score
-                "breakout_probability": round(breakout_prob, 1),
-                "breakout_probability_percent": f"{breakout_prob}%",  # Formatted percentage
-                "direction": direction,
-                "type": level_type,
-                "position": position,  # Relative to current price
-                "formatted": formatted_string,  # Complete formatted string: Price + Strength + Direction
-                "touches": level.get('touches', 0),
-                "validated": level.get('validated', False)
-            })
+        key_levels.sort(key=itemgetter('strength'), reverse=True)
         
         return key_levels
     
+    def _build_key_level(
+        self,
+        level: Dict[str, Any],
+        current_price: float,
+        direction: str
+    ) -> Dict[str, Any]:
+        """Build one key level summary entry: Price + Strength + Direction."""
+        get = level.get  # Bound once; read for every field below
+        price = get('price', 0)
+        strength = get('strength', 0)
+        breakout_prob = get('breakout_probability', 0.0)
+        
+        # Determine relative position to current price
+        if price < current_price:
+            position = "BELOW"
+        elif price > current_price:
+            position = "ABOVE"
+        else:
+            position = "AT"
+        
+        # Format each number once; the complete string reuses the pieces
+        strength_score = f"{strength}/100"
+        breakout_percent = f"{breakout_prob}%"
+        
+        return {
+            "price": round(price, 2),
+            "strength": strength,
+            "strength_score": strength_score,  # Formatted strength score
+            "breakout_probability": round(breakout_prob, 1),
+            "breakout_probability_percent": breakout_percent,  # Formatted percentage
+            "direction": direction,
+            "type": get('type', 'unknown'),
+            "position": position,  # Relative to current price
+            # Complete formatted string: Price + Strength + Direction
+            "formatted": f"${price:.2f} | Strength: {strength_score} | {direction} | Breakout: {breakout_percent}",
+            "touches": get('touches', 0),
+            "validated": get('validated', False)
+        }
+    
     def _get_data_source_label(self, data_source: str) -> str:
         """Get human-readable label for data source."""
-        labels = {
-            "data_agent": "Data Agent (Internal)",
-            "yfinance": "Yahoo Finance (Real-time)",
-            "mock_data": "Mock Data (Test)"
-        }
-        return labels.get(data_source, data_source)
+        return _DATA_SOURCE_LABELS.get(data_source, data_source)
     
     def _get_default_lookback_days(self, timeframe: str) -> int:
         """Get default lookback days for a given timeframe."""
-        timeframe_days_map = {
-            '1m': 30,    # 30 days for 1-minute data
-            '5m': 30,
-            '15m': 30,
-            '30m': 30,
-            '1h': 90,    # 90 days for 1-hour data
-            '4h': 90,
-            '1d': 730,   # 2 years for daily data
-            '1w': 1095,  # 3 years for weekly data
-            '1mo': 1825, # 5 years for monthly data
-            '1y': 3650   # 10 years for yearly data
-        }
-        return timeframe_days_map.get(timeframe, 730)
+        return _TIMEFRAME_LOOKBACK_DAYS.get(timeframe, 730)
     
-    def _is_cached(self, cache_key: str) -> bool:
-        """Check if result is cached and not expired."""
-        if cache_key not in self._cache:
-            return False
-        
-        if cache_key not in self._cache_timestamps:
-            return False
-        
-        age = datetime.utcnow() - self._cache_timestamps[cache_key]
-        return age < self._cache_ttl
+    def _result_cache_key(
+        self,
+        symbol: str,
+        min_strength: int,
+        max_levels: int,
+        timeframe: str,
+        project_future: bool,
+        lookback_days: Optional[int],
+        include_summary: bool = True
+    ) -> str:
+        """Cache key for a process() response."""
+        # Include lookback_days in cache key if provided
+        cache_key_parts = [symbol, str(min_strength), str(max_levels), timeframe, str(project_future)]
+        if lookback_days:
+            cache_key_parts.append(str(lookback_days))
+        # Responses without the key_price_levels summary are cached separately
+        if not include_summary:
+            cache_key_parts.append("nosummary")
+        return "_".join(cache_key_parts)
+    
+    def _levels_cache_key(
+        self,
+        symbol: str,
+        timeframe: str,
+        project_future: bool,
+        projection_periods: int,
+        lookback_days: Optional[int]
+    ) -> str:
+        """Cache key for pre-filter levels (independent of min_strength/max_levels)."""
+        return "_".join([symbol, "levels", timeframe, str(project_future), str(projection_periods), str(lookback_days)])
     
-    def _get_cached(self, cache_key: str) -> Dict[str, Any]:
-        """Get cached result."""
-        return self._cache[cache_key].copy()
+    def _get_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get cached result (None if missing or expired)."""
+        cached = self._cache.get(cache_key)
+        return cached.copy() if cached is not None else None
     
-    def _cache_result(self, cache_key: str, result: Dict[str, Any]) -> None:
-        """Cache a result."""
-        self._cache[cache_key] = result
-        self._cache_timestamps[cache_key] = datetime.utcnow()
-        
-        # Limit cache size (keep last 100 entries)
-        if len(self._cache) > 100:
-            oldest_key = min(self._cache_timestamps.keys(), key=lambda k: self._cache_timestamps[k])
-            del self._cache[oldest_key]
-            del self._cache_timestamps[oldest_key]
+    def _cache_result(
+        self,
+        cache_key: str,
+        result: Dict[str, Any],
+        cost_seconds: Optional[float] = None
+    ) -> None:
+        """Cache a result, recording how long it took to compute."""
+        if cost_seconds is None:
+            cost_seconds = result.get("processing_time_seconds", 0.0)
+        self._cache.set(cache_key, result, cost_seconds)
     
     def clear_cache(self, symbol: Optional[str] = None) -> None:
         """
@@ -832,14 +1006,15 @@ class SupportResistanceAgent(BaseAgent):
             symbol: Symbol to clear (None = clear all)
         """
         if symbol:
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{symbol}_")]
+            # The cache holds at most max_entries keys and evicts them itself,
+            # so a prefix scan stays cheap and no per-symbol index can go stale
+            prefix = f"{symbol}_"
+            keys_to_remove = [k for k in self._cache.keys() if k.startswith(prefix)]
             for key in keys_to_remove:
                 del self._cache[key]
-                del self._cache_timestamps[key]
             logger.info(f"Cleared cache for {symbol}")
         else:
             self._cache.clear()
-            self._cache_timestamps.clear()
             logger.info("Cleared all cache")
     
     def validate_levels(
@@ -865,7 +1040,6 @@ class SupportResistanceAgent(BaseAgent):
             }
         
         # Load data
-        from datetime import timezone
         now = datetime.now(timezone.utc)
         df, _ = self.data_loader.load_ohlcv_data(
             symbol=symbol,
@@ -14,6 +14,9 @@ How it works:
 1. Takes extrema points (peaks/valleys)
 2. Groups points that are close together (within eps distance)
 3. Each cluster center becomes a support/resistance level
+
+Prices are 1-D, so DBSCAN runs on sorted prices with binary searches
+(_dbscan_1d) instead of pairwise distances; sklearn is optional.
 """
 
 import numpy as np
@@ -30,48 +33,98 @@ except ImportError:
 logger = get_logger(__name__)
 
 
-def _simple_cluster(prices: np.ndarray, eps: float, min_samples: int) -> np.ndarray:
+def _median(values: np.ndarray) -> float:
+    """
+    Median via np.partition, equal to np.median for 1-D input.
+    
+    np.median goes through its general n-d machinery, which costs more than
+    the selection itself for the few dozen extrema clustered per call.
     """
-    Simple distance-based clustering fallback when sklearn is not available.
+    n = len(values)
+    if n == 0 or np.isnan(values).any():
+        return float(np.median(values))
+    
+    k = n // 2
+    if n % 2:
+        return float(np.partition(values, k)[k])
+    # Even count: mean of the two middle values, as np.median computes it
+    part = np.partition(values, (k - 1, k))
+    return float((part[k - 1] + part[k]) / 2)
 
-    Groups points within eps distance of each other.
 
+def _dbscan_1d(prices: np.ndarray, eps: float, min_samples: int) -> np.ndarray:
+    """
+    Exact DBSCAN for 1-D points using a sort and binary searches.
+    
+    On a line, neighborhoods are contiguous ranges of the sorted prices, so
+    neighbor counts come from two searchsorted calls and clusters are runs of
+    core points whose gaps are at most eps. Labels match sklearn's DBSCAN:
+    clusters are numbered by their lowest-index core point and a border point
+    reachable from two clusters joins the lower-numbered one.
+    O(n log n) instead of pairwise distances.
+    
     Args:
         prices: 1-D array of price values
         eps: Maximum distance between points in same cluster
-        min_samples: Minimum number of points to form a cluster
-
+        min_samples: Minimum number of points (including itself) for a core point
+    
     Returns:
         Array of cluster labels (-1 for noise)
     """
     n = len(prices)
-    labels = np.full(n, -1, dtype=int)  # -1 means noise
-    cluster_id = 0
-
-    visited = np.zeros(n, dtype=bool)
-
-    for i in range(n):
-        if visited[i]:
-            continue
-
-        # Find all points within eps distance
-        neighbors = []
-        for j in range(n):
-            if abs(prices[i] - prices[j]) <= eps:
-                neighbors.append(j)
-
-        # If enough neighbors, form a cluster
-        if len(neighbors) >= min_samples:
-            # Mark all neighbors as part of this cluster
-            for j in neighbors:
-                if labels[j] == -1:  # Only assign if not already in a cluster
-                    labels[j] = cluster_id
-                    visited[j] = True
-
-            cluster_id += 1
-        else:
-            visited[i] = True
-
+    labels = np.full(n, -1, dtype=np.intp)
+    if n == 0:
+        return labels
+    
+    order = np.argsort(prices, kind="stable")
+    sorted_prices = prices[order]
+    
+    # Neighbors of each point are sorted_prices[lo:hi] (distance <= eps)
+    lo = np.searchsorted(sorted_prices, sorted_prices - eps, side="left")
+    hi = np.searchsorted(sorted_prices, sorted_prices + eps, side="right")
+    is_core = hi - lo >= min_samples
+    core_pos = np.flatnonzero(is_core)
+    if core_pos.size == 0:
+        return labels
+    
+    # Consecutive core points within eps are density-connected
+    core_prices = sorted_prices[core_pos]
+    component = np.concatenate(([0], np.cumsum(np.diff(core_prices) > eps)))
+    n_components = int(component[-1]) + 1
+    
+    # Number clusters by their lowest original index (sklearn's scan order)
+    first_index = np.full(n_components, n, dtype=np.intp)
+    np.minimum.at(first_index, component, order[core_pos])
+    rank = np.empty(n_components, dtype=np.intp)
+    rank[np.argsort(first_index)] = np.arange(n_components)
+    
+    sorted_labels = np.full(n, -1, dtype=np.intp)
+    sorted_labels[core_pos] = rank[component]
+    
+    # Border points join the nearest core cluster on either side within eps
+    border = np.flatnonzero(~is_core)
+    if border.size:
+        right = np.searchsorted(core_pos, border)
+        left = right - 1
+        border_prices = sorted_prices[border]
+        border_labels = np.full(border.size, n, dtype=np.intp)
+        
+        has_left = left >= 0
+        near_left = has_left.copy()
+        near_left[has_left] = border_prices[has_left] - core_prices[left[has_left]] <= eps
+        border_labels[near_left] = rank[component[left[near_left]]]
+        
+        has_right = right < core_pos.size
+        near_right = has_right.copy()
+        near_right[has_right] = core_prices[right[has_right]] - border_prices[has_right] <= eps
+        border_labels[near_right] = np.minimum(
+            border_labels[near_right], rank[component[right[near_right]]]
+        )
+        
+        border_labels[border_labels == n] = -1
+        sorted_labels[border] = border_labels
+    
+    labels[order] = sorted_labels
     return labels
 
 
@@ -84,7 +137,7 @@ class DBSCANClusterer:
     - min_samples: Minimum number of points to form a cluster
     """
     
-    def __init__(self, eps: float = 0.02, min_samples: int = 3):
+    def __init__(self, eps: float = 0.02, min_samples: int = 3, backend: str = "sorted"):
         """
         Initialize the DBSCAN clusterer.
         
@@ -98,12 +151,21 @@ class DBSCANClusterer:
                         - A level needs at least 3 touches to be significant
                         - Fewer = more clusters (including weak ones)
                         - More = fewer clusters (only strong levels)
+            backend: Clustering implementation (default: "sorted")
+                    - "sorted": exact 1-D DBSCAN via sort + binary search
+                    - "sklearn": sklearn.cluster.DBSCAN (same labels, slower;
+                      falls back to "sorted" if sklearn is not installed)
         """
         self.eps = eps
         self.min_samples = min_samples
-        logger.debug(f"DBSCANClusterer initialized: eps={eps}, min_samples={min_samples}")
+        self.backend = backend
+        logger.debug(f"DBSCANClusterer initialized: eps={eps}, min_samples={min_samples}, backend={backend}")
     
-    def cluster_levels(self, extrema: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def cluster_levels(
+        self,
+        extrema: List[Dict[str, Any]],
+        min_touches: int = 1
+    ) -> List[Dict[str, Any]]:
         """
         Cluster extrema points into support/resistance levels.
         
@@ -111,11 +173,15 @@ class DBSCANClusterer:
         1. Extract prices from extrema points
         2. Reshape for DBSCAN (needs 2D array)
         3. Run DBSCAN clustering
-        4. Calculate cluster centers (average price of cluster)
-        5. Count touches (points in each cluster)
+        4. Drop clusters with fewer than min_touches points
+        5. Calculate cluster centers (average price of cluster)
+        6. Count touches (points in each cluster)
         
         Args:
             extrema: List of extrema dictionaries with 'price' key
+            min_touches: Minimum points per cluster (default: 1 = keep all).
+                        Same as filter_clusters, but applied before any level
+                        dictionary is built
         
         Returns:
             List of level dictionaries with:
@@ -128,85 +194,84 @@ class DBSCANClusterer:
             logger.warning("No extrema points provided for clustering")
             return []
         
-        # Extract prices
-        prices = np.array([ext['price'] for ext in extrema])
-        
-        # DBSCAN needs 2D array, so reshape
-        # Shape: (n_points, 1) - one feature (price)
-        prices_2d = prices.reshape(-1, 1)
+        # Extract the extrema fields once (struct of arrays); the per-cluster
+        # work below indexes these instead of re-reading the extrema dicts
+        prices = np.fromiter((ext['price'] for ext in extrema), dtype=np.float64, count=len(extrema))
+        timestamps = [ext.get('timestamp') for ext in extrema]
+        types = [ext.get('type', 'unknown') for ext in extrema]
         
         # Run DBSCAN
         # eps is in absolute price units, so we need to scale it
         # For a $100 stock, eps=0.02 means $2 difference
         # We'll use percentage-based eps: eps * median_price
-        median_price = np.median(prices)
+        median_price = _median(prices)
         scaled_eps = self.eps * median_price
         
         logger.debug(f"Running clustering: {len(prices)} points, scaled_eps={scaled_eps:.2f}")
 
-        if SKLEARN_AVAILABLE:
-            clustering = DBSCAN(eps=scaled_eps, min_samples=self.min_samples).fit(prices_2d)
+        if self.backend == "sklearn" and SKLEARN_AVAILABLE:
+            # DBSCAN needs 2D array: (n_points, 1) - one feature (price)
+            clustering = DBSCAN(eps=scaled_eps, min_samples=self.min_samples).fit(prices.reshape(-1, 1))
             labels = clustering.labels_
         else:
-            logger.info("sklearn not available, using simple clustering fallback")
-            labels = _simple_cluster(prices, scaled_eps, self.min_samples)
+            labels = _dbscan_1d(prices, scaled_eps, self.min_samples)
         
-        # Group points by cluster (keep track of indices for timestamp access)
-        clusters = {}
-        cluster_indices = {}  # Track which extrema indices belong to each cluster
-        for i, label in enumerate(labels):
-            if label == -1:
-                # -1 means noise/outlier (not in any cluster)
-                continue
-            
-            if label not in clusters:
-                clusters[label] = []
-                cluster_indices[label] = []
-            clusters[label].append(prices[i])
-            cluster_indices[label].append(i)  # Store index to access extrema data
+        # Group extrema indices by cluster (-1 means noise/outlier, not in
+        # any cluster): a stable sort keeps each cluster's points in order
+        clustered = np.flatnonzero(labels >= 0)
+        if clustered.size == 0:
+            logger.info(f"Clustered {len(extrema)} extrema into 0 levels")
+            return []
+        by_label = clustered[np.argsort(labels[clustered], kind="stable")]
+        
+        # Each cluster is a contiguous [start, end) run of the grouped arrays,
+        # so per-cluster prices are slices rather than gathers
+        grouped_prices = prices[by_label]
+        grouped_labels = labels[by_label]
+        grouped_indices = by_label.tolist()
+        grouped_points = grouped_prices.tolist()
+        boundaries = (np.flatnonzero(np.diff(grouped_labels)) + 1).tolist()
+        runs = [
+            (start, end)
+            for start, end in zip([0] + boundaries, boundaries + [len(grouped_indices)])
+            if end - start >= min_touches
+        ]
+        if not runs:
+            logger.info(f"Clustered {len(extrema)} extrema into 0 levels")
+            return []
+        # Emit clusters in order of their first point
+        runs.sort(key=lambda run: grouped_indices[run[0]])
+        
+        # Cluster center = average price
+        centers = np.array([grouped_prices[start:end].mean() for start, end in runs])
+        
+        # Find the closest actual extrema point to every center at once
+        # (clusters x extrema); ties go to the lowest index, as with argmin per cluster
+        closest = np.argmin(np.abs(prices - centers[:, np.newaxis]), axis=1).tolist()
         
-        # Calculate cluster centers and create level dictionaries
+        # Create level dictionaries
         levels = []
-        for cluster_id, cluster_prices in clusters.items():
-            # Cluster center = average price
-            center_price = np.mean(cluster_prices)
-            
-            # Find the closest actual extrema point to the center
-            closest_idx = np.argmin(np.abs(prices - center_price))
-            closest_extrema = extrema[closest_idx]
-            
-            # Get all extrema points in this cluster to find first and last touch
-            cluster_extrema_indices = cluster_indices[cluster_id]
-            cluster_extrema_points = [extrema[idx] for idx in cluster_extrema_indices]
-            
-            # Extract timestamps from all extrema points in cluster
-            timestamps = []
-            for extrema_point in cluster_extrema_points:
-                timestamp = extrema_point.get('timestamp')
-                if timestamp is not None:
-                    timestamps.append(timestamp)
-            
-            # Calculate first_touch (earliest) and last_touch (latest)
-            first_touch = None
-            last_touch = None
-            if timestamps:
-                # Sort timestamps to find earliest and latest
-                sorted_timestamps = sorted(timestamps)
-                first_touch = sorted_timestamps[0]  # Earliest
-                last_touch = sorted_timestamps[-1]  # Latest
+        for (start, end), center_price, closest_idx in zip(runs, centers.tolist(), closest):
+            # Timestamps of the extrema points in this cluster
+            cluster_timestamps = [
+                timestamps[idx] for idx in grouped_indices[start:end]
+                if timestamps[idx] is not None
+            ]
             
-            # If no timestamps found, try to get from closest extrema as fallback
-            if first_touch is None:
-                first_touch = closest_extrema.get('timestamp')
-            if last_touch is None:
-                last_touch = closest_extrema.get('timestamp')
+            # Calculate first_touch (earliest) and last_touch (latest);
+            # if no timestamps found, fall back to the closest extrema
+            if cluster_timestamps:
+                first_touch = min(cluster_timestamps)  # Earliest
+                last_touch = max(cluster_timestamps)  # Latest
+            else:
+                first_touch = last_touch = timestamps[closest_idx]
             
             level = {
-                'price': float(center_price),
-                'touches': len(cluster_prices),
-                'cluster_id': int(cluster_id),
-                'points': [float(p) for p in cluster_prices],
-                'type': closest_extrema.get('type', 'unknown'),
+                'price': center_price,
+                'touches': end - start,
+                'cluster_id': int(grouped_labels[start]),
+                'points': grouped_points[start:end],
+                'type': types[closest_idx],
                 'first_touch': first_touch,
                 'last_touch': last_touch,
             }
@@ -13,8 +13,10 @@ Why we need this:
 - We need to find these points before we can cluster them into levels
 
 Implementation:
-- Uses scipy.signal.argrelextrema for rolling window extrema detection
-- Matches system specification requirements
+- Rolling window extrema detection with the semantics of
+  scipy.signal.argrelextrema (matches system specification requirements)
+- _relative_extrema computes the same indices from sliding-window max/min
+  arrays; scipy's argrelextrema is kept as an optional backend
 """
 
 import pandas as pd
@@ -32,33 +34,51 @@ except ImportError:
 logger = get_logger(__name__)
 
 
-def _numpy_argrelextrema(data: np.ndarray, comparator, order: int = 1):
+def _relative_extrema(data: np.ndarray, order: int, find_max: bool) -> np.ndarray:
     """
-    Fallback implementation of argrelextrema when scipy is not available.
-
-    Finds indices of relative extrema (local max/min) in 1-D data.
-
+    Indices of strict relative extrema, equal to argrelextrema(mode='clip').
+    
+    argrelextrema makes 2*order shifted comparisons over the whole array.
+    Here the max (or min) of the `order` neighbors on each side comes from one
+    sliding-window reduction built by doubling (about log2(order) passes), so
+    each point is compared once per side. Windows are truncated at the array
+    edges like scipy's clip mode; the first and last points are never extrema.
+    
     Args:
-        data: 1-D numpy array of values
-        comparator: np.greater for maxima, np.less for minima
-        order: Number of points on each side to use for comparison
-
+        data: 1-D array of prices
+        order: Number of points on each side to compare (>= 1)
+        find_max: True for peaks (np.greater), False for valleys (np.less)
+    
     Returns:
-        Tuple containing array of indices of extrema
+        Array of extrema indices in ascending order
     """
-    indices = []
+    if order < 1:
+        raise ValueError("Order must be an int >= 1")
     n = len(data)
-
-    for i in range(order, n - order):
-        is_extrema = True
-        for j in range(1, order + 1):
-            if not comparator(data[i], data[i - j]) or not comparator(data[i], data[i + j]):
-                is_extrema = False
-                break
-        if is_extrema:
-            indices.append(i)
-
-    return (np.array(indices),)
+    if n < 3:
+        return np.empty(0, dtype=np.intp)
+    
+    reduce = np.maximum if find_max else np.minimum
+    compare = np.greater if find_max else np.less
+    
+    # Pad so windows past either edge only see the real neighbors
+    pad = np.full(order, -np.inf if find_max else np.inf)
+    window = np.concatenate((pad, data, pad))
+    
+    # window[k] becomes the max/min of the padded values [k, k + order)
+    width = 1
+    while width * 2 <= order:
+        window = reduce(window[:-width], window[width:])
+        width *= 2
+    if width < order:
+        window = reduce(window[:width - order], window[order - width:])
+    
+    # Left neighbors of data[i] are padded[i:i + order], right neighbors
+    # padded[i + order + 1:i + 2 * order + 1]
+    is_extremum = compare(data, window[:n])
+    is_extremum &= compare(data, window[order + 1:order + 1 + n])
+    is_extremum[0] = is_extremum[-1] = False
+    return np.flatnonzero(is_extremum)
 
 
 class ExtremaDetector:
@@ -72,7 +92,7 @@ class ExtremaDetector:
     4. Filters out noise (small fluctuations)
     """
     
-    def __init__(self, window_size: int = 5, min_distance: int = 10):
+    def __init__(self, window_size: int = 5, min_distance: int = 10, backend: str = "sliding"):
         """
         Initialize the extrema detector.
         
@@ -82,20 +102,60 @@ class ExtremaDetector:
                         - Smaller = more but potentially noisy extrema
             min_distance: Minimum distance between extrema points (default: 10)
                          - Prevents detecting extrema too close together
+            backend: Extrema implementation (default: "sliding")
+                    - "sliding": sliding-window max/min scan (_relative_extrema)
+                    - "scipy": scipy.signal.argrelextrema (same indices, slower;
+                      falls back to "sliding" if scipy is not installed)
         """
         self.window_size = window_size
         self.min_distance = min_distance
-        logger.debug(f"ExtremaDetector initialized: window_size={window_size}, min_distance={min_distance}")
+        self.backend = backend
+        logger.debug(
+            f"ExtremaDetector initialized: window_size={window_size}, "
+            f"min_distance={min_distance}, backend={backend}"
+        )
+    
+    def _find_extrema(self, values: np.ndarray, find_max: bool) -> np.ndarray:
+        """
+        Find extrema indices and apply the min_distance filter.
+        
+        Args:
+            values: Price array (highs for peaks, lows for valleys)
+            find_max: True for peaks, False for valleys
+        
+        Returns:
+            Array of extrema indices
+        """
+        # order parameter = window_size (number of points on each side to compare)
+        # This matches the specification requirement
+        if self.backend == "scipy" and SCIPY_AVAILABLE:
+            comparator = np.greater if find_max else np.less
+            indices = argrelextrema(values, comparator, order=self.window_size)[0]
+        else:
+            indices = _relative_extrema(values, self.window_size, find_max)
+        
+        # Apply min_distance filter to avoid extrema too close together
+        if len(indices) > 0 and self.min_distance > 0:
+            filtered_indices = []
+            last = None
+            for idx in indices.tolist():
+                # Always include the first; then only if far enough from the previous one
+                if last is None or idx - last >= self.min_distance:
+                    filtered_indices.append(idx)
+                    last = idx
+            indices = np.array(filtered_indices, dtype=np.intp)
+        
+        return indices
     
     def detect_peaks(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
-        Detect peaks (resistance candidates) in price data using scipy.signal.argrelextrema.
+        Detect peaks (resistance candidates) in price data.
         
         A peak is a point where:
         - High price is greater than N neighbors on both sides
         - Used to identify potential resistance levels
         
-        Implementation uses scipy.signal.argrelextrema for rolling window detection
+        Rolling window detection with scipy.signal.argrelextrema semantics
         (matches system specification).
         
         Args:
@@ -112,45 +172,35 @@ class ExtremaDetector:
         
         highs = df['high'].values
         
-        # Use scipy.signal.argrelextrema for peak detection (or fallback if not available)
-        # order parameter = window_size (number of points on each side to compare)
-        # This matches the specification requirement
-        if SCIPY_AVAILABLE:
-            peak_indices = argrelextrema(highs, np.greater, order=self.window_size)[0]
-        else:
-            peak_indices = _numpy_argrelextrema(highs, np.greater, order=self.window_size)[0]
-        
-        # Apply min_distance filter to avoid peaks too close together
-        if len(peak_indices) > 0 and self.min_distance > 0:
-            filtered_indices = [peak_indices[0]]  # Always include first peak
-            for idx in peak_indices[1:]:
-                # Only add if far enough from previous peak
-                if idx - filtered_indices[-1] >= self.min_distance:
-                    filtered_indices.append(idx)
-            peak_indices = np.array(filtered_indices)
-        
-        # Convert to list of dictionaries
-        peaks = []
-        for idx in peak_indices:
-            peaks.append({
-                'timestamp': df.iloc[idx]['timestamp'],
-                'price': float(highs[idx]),
+        peak_indices = self._find_extrema(highs, find_max=True)
+        
+        # Convert to list of dictionaries (gather columns once rather than
+        # building a row Series per extremum with df.iloc; taking from the
+        # column's array also skips building an intermediate Series)
+        timestamps = df['timestamp'].array.take(peak_indices).tolist()
+        prices = highs[peak_indices].tolist()
+        peaks = [
+            {
+                'timestamp': timestamp,
+                'price': float(price),
                 'index': int(idx),
                 'type': 'resistance'
-            })
+            }
+            for idx, timestamp, price in zip(peak_indices.tolist(), timestamps, prices)
+        ]
         
-        logger.info(f"Detected {len(peaks)} peaks (resistance candidates) using scipy.signal.argrelextrema")
+        logger.info(f"Detected {len(peaks)} peaks (resistance candidates)")
         return peaks
     
     def detect_valleys(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
-        Detect valleys (support candidates) in price data using scipy.signal.argrelextrema.
+        Detect valleys (support candidates) in price data.
         
         A valley is a point where:
         - Low price is lower than N neighbors on both sides
         - Used to identify potential support levels
         
-        Implementation uses scipy.signal.argrelextrema for rolling window detection
+        Rolling window detection with scipy.signal.argrelextrema semantics
         (matches system specification).
         
         Args:
@@ -167,34 +217,24 @@ class ExtremaDetector:
         
         lows = df['low'].values
         
-        # Use scipy.signal.argrelextrema for valley detection (or fallback if not available)
-        # order parameter = window_size (number of points on each side to compare)
-        # This matches the specification requirement
-        if SCIPY_AVAILABLE:
-            valley_indices = argrelextrema(lows, np.less, order=self.window_size)[0]
-        else:
-            valley_indices = _numpy_argrelextrema(lows, np.less, order=self.window_size)[0]
-        
-        # Apply min_distance filter to avoid valleys too close together
-        if len(valley_indices) > 0 and self.min_distance > 0:
-            filtered_indices = [valley_indices[0]]  # Always include first valley
-            for idx in valley_indices[1:]:
-                # Only add if far enough from previous valley
-                if idx - filtered_indices[-1] >= self.min_distance:
-                    filtered_indices.append(idx)
-            valley_indices = np.array(filtered_indices)
-        
-        # Convert to list of dictionaries
-        valleys = []
-        for idx in valley_indices:
-            valleys.append({
-                'timestamp': df.iloc[idx]['timestamp'],
-                'price': float(lows[idx]),
+        valley_indices = self._find_extrema(lows, find_max=False)
+        
+        # Convert to list of dictionaries (gather columns once rather than
+        # building a row Series per extremum with df.iloc; taking from the
+        # column's array also skips building an intermediate Series)
+        timestamps = df['timestamp'].array.take(valley_indices).tolist()
+        prices = lows[valley_indices].tolist()
+        valleys = [
+            {
+                'timestamp': timestamp,
+                'price': float(price),
                 'index': int(idx),
                 'type': 'support'
-            })
+            }
+            for idx, timestamp, price in zip(valley_indices.tolist(), timestamps, prices)
+        ]
         
-        logger.info(f"Detected {len(valleys)} valleys (support candidates) using scipy.signal.argrelextrema")
+        logger.info(f"Detected {len(valleys)} valleys (support candidates)")
         return valleys
     
     def detect_all_extrema(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -240,24 +280,19 @@ class ExtremaDetector:
         if not extrema:
             return []
         
-        # Sort by price
-        sorted_extrema = sorted(extrema, key=lambda x: x['price'])
-        filtered = []
-        
-        for i, ext in enumerate(sorted_extrema):
-            # For first and last, always include
-            if i == 0 or i == len(sorted_extrema) - 1:
-                filtered.append(ext)
-                continue
-            
-            # Calculate price change from previous extrema
-            prev_price = sorted_extrema[i - 1]['price']
-            current_price = ext['price']
-            price_change = abs(current_price - prev_price) / prev_price
-            
-            # Only include if price change is significant
-            if price_change >= min_price_change:
-                filtered.append(ext)
+        # Sort by price (stable, like sorted())
+        prices = np.array([ext['price'] for ext in extrema], dtype=np.float64)
+        order = np.argsort(prices, kind="stable")
+        sorted_prices = prices[order]
+        
+        # Price change from the previous extremum in price order; first and
+        # last are always included
+        keep = np.ones(len(order), dtype=bool)
+        if len(order) > 2:
+            price_change = np.abs(np.diff(sorted_prices[:-1])) / sorted_prices[:-2]
+            keep[1:-1] = price_change >= min_price_change
+        
+        filtered = [extrema[i] for i in order[keep].tolist()]
         
         logger.info(f"Filtered {len(extrema)} extrema to {len(filtered)} significant points")
         return filtered
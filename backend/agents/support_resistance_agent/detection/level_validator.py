@@ -17,7 +17,8 @@ What is validation?
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from ..utils.data_loader import ohlcv_arrays
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,7 +54,8 @@ class LevelValidator:
     def validate_level(
         self,
         level: Dict[str, Any],
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        ohlcv: Optional[Dict[str, np.ndarray]] = None
     ) -> Dict[str, Any]:
         """
         Validate a single level against historical price data.
@@ -67,6 +69,7 @@ class LevelValidator:
         Args:
             level: Level dictionary with 'price' and 'type' keys
             df: DataFrame with OHLCV data
+            ohlcv: Precomputed column arrays from ohlcv_arrays(df) (optional)
         
         Returns:
             Updated level dictionary with validation info:
@@ -75,87 +78,35 @@ class LevelValidator:
             - touch_count: Total number of touches
             - validation_rate: Percentage of successful reactions
         """
-        level_price = level['price']
-        level_type = level.get('type', 'unknown')
-        
-        # Find touches (when price came within tolerance of level)
-        touches = self._find_touches(level_price, df, self.tolerance)
-        
-        if not touches:
-            # No touches found - can't validate
-            level['validated'] = False
-            level['reaction_count'] = 0
-            level['touch_count'] = 0
-            level['validation_rate'] = 0.0
-            return level
-        
-        # Performance optimization: For large datasets, sample touches
-        # This prevents checking every single touch when there are hundreds
-        max_touches_to_check = 50  # Reasonable limit for fast validation
-        if len(touches) > max_touches_to_check:
-            # Sample touches evenly across the dataset
-            step = len(touches) // max_touches_to_check
-            touches_to_check = touches[::step][:max_touches_to_check]
-        else:
-            touches_to_check = touches
-        
-        # Check reactions for sampled touches
-        reactions = []
-        for touch_idx in touches_to_check:
-            reaction = self._check_reaction(
-                touch_idx,
-                level_price,
-                level_type,
-                df
-            )
-            reactions.append(reaction)
-        
-        # Calculate validation metrics (scale up for sampled touches)
-        sampled_touches = len(touches_to_check)
-        reaction_count = sum(reactions)
-        touch_count = len(touches)  # Actual total
-        # Scale reaction count estimate
-        if sampled_touches > 0:
-            scaled_reaction_count = int(reaction_count * (touch_count / sampled_touches))
-        else:
-            scaled_reaction_count = 0
-        validation_rate = reaction_count / sampled_touches if sampled_touches > 0 else 0.0
-        
-        # Level is validated if >50% of touches showed reaction
-        validated = validation_rate > 0.5
-        
-        level['validated'] = validated
-        level['reaction_count'] = scaled_reaction_count  # Use scaled estimate
-        level['touch_count'] = touch_count
-        level['validation_rate'] = validation_rate
-        
-        logger.debug(
-            f"Level {level_price:.2f} ({level_type}): "
-            f"{reaction_count}/{touch_count} reactions ({validation_rate:.1%})"
-        )
-        
-        return level
+        if ohlcv is None:
+            ohlcv = ohlcv_arrays(df)
+        return self._validate_batch([level], ohlcv)[0]
     
     def validate_levels(
         self,
         levels: List[Dict[str, Any]],
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        ohlcv: Optional[Dict[str, np.ndarray]] = None
     ) -> List[Dict[str, Any]]:
         """
         Validate multiple levels.
         
+        All levels are validated in one batch: touches for every level come
+        from a single levels x bars comparison, and the reaction of every bar
+        is computed once and shared by all levels.
+        
         Args:
             levels: List of level dictionaries
             df: DataFrame with OHLCV data
+            ohlcv: Precomputed column arrays from ohlcv_arrays(df) (optional)
         
         Returns:
             List of validated level dictionaries
         """
-        validated_levels = []
+        if ohlcv is None:
+            ohlcv = ohlcv_arrays(df)
         
-        for level in levels:
-            validated_level = self.validate_level(level, df)
-            validated_levels.append(validated_level)
+        validated_levels = self._validate_batch(levels, ohlcv)
         
         # Calculate overall validation rate
         total_levels = len(validated_levels)
@@ -169,94 +120,157 @@ class LevelValidator:
         
         return validated_levels
     
+    def _validate_batch(
+        self,
+        levels: List[Dict[str, Any]],
+        ohlcv: Dict[str, np.ndarray]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate levels in place and return them.
+        
+        Args:
+            levels: List of level dictionaries with 'price' and 'type' keys
+            ohlcv: Column arrays from ohlcv_arrays(df)
+        
+        Returns:
+            The same level dictionaries with validation info added
+        """
+        if not levels:
+            return levels
+        
+        lows = ohlcv['low']
+        highs = ohlcv['high']
+        level_prices = np.array([level['price'] for level in levels], dtype=np.float64)
+        
+        # Find touches for all levels at once (levels x bars)
+        touch_matrix = self._find_touches(level_prices, lows, highs, self.tolerance)
+        
+        # Whether price reacted after each bar, per level type
+        reactions_by_type = self._reactions_after(lows, highs)
+        no_reactions = np.zeros(len(lows), dtype=bool)
+        
+        # Performance optimization: For large datasets, sample touches
+        # This prevents checking every single touch when there are hundreds
+        max_touches_to_check = 50  # Reasonable limit for fast validation
+        
+        for level, touched in zip(levels, touch_matrix):
+            level_price = level['price']
+            level_type = level.get('type', 'unknown')
+            touches = np.flatnonzero(touched)
+            
+            if touches.size == 0:
+                # No touches found - can't validate
+                level['validated'] = False
+                level['reaction_count'] = 0
+                level['touch_count'] = 0
+                level['validation_rate'] = 0.0
+                continue
+            
+            if len(touches) > max_touches_to_check:
+                # Sample touches evenly across the dataset
+                step = len(touches) // max_touches_to_check
+                touches_to_check = touches[::step][:max_touches_to_check]
+            else:
+                touches_to_check = touches
+            
+            # Unknown type - can't validate, so no reactions
+            reacted = reactions_by_type.get(level_type, no_reactions)
+            
+            # Calculate validation metrics (scale up for sampled touches)
+            sampled_touches = len(touches_to_check)
+            reaction_count = int(np.count_nonzero(reacted[touches_to_check]))
+            touch_count = len(touches)  # Actual total
+            # Scale reaction count estimate
+            scaled_reaction_count = int(reaction_count * (touch_count / sampled_touches))
+            validation_rate = reaction_count / sampled_touches
+            
+            # Level is validated if >50% of touches showed reaction
+            validated = validation_rate > 0.5
+            
+            level['validated'] = validated
+            level['reaction_count'] = scaled_reaction_count  # Use scaled estimate
+            level['touch_count'] = touch_count
+            level['validation_rate'] = validation_rate
+            
+            logger.debug(
+                f"Level {level_price:.2f} ({level_type}): "
+                f"{reaction_count}/{touch_count} reactions ({validation_rate:.1%})"
+            )
+        
+        return levels
+    
     def _find_touches(
         self,
-        level_price: float,
-        df: pd.DataFrame,
+        level_prices: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
         tolerance: float
-    ) -> List[int]:
+    ) -> np.ndarray:
         """
-        Find all indices where price touched the level.
+        Find where price touched each level.
         
         A "touch" means:
         - For support: low price came within tolerance
         - For resistance: high price came within tolerance
         
         Args:
-            level_price: The level price to check
-            df: DataFrame with OHLCV data
+            level_prices: Level prices to check
+            lows: Low prices
+            highs: High prices
             tolerance: Price tolerance (percentage)
         
         Returns:
-            List of row indices where price touched the level
+            Boolean array of shape (levels, bars), True where price touched the level
         """
-        tolerance_amount = level_price * tolerance
+        level_prices = level_prices[:, np.newaxis]
+        tolerance_amount = level_prices * tolerance
         
-        # Vectorized operation (much faster than loop)
+        # Broadcast every level against every bar in one operation
         # Check if low or high came within tolerance of level
-        low_touched = (df['low'] - level_price).abs() <= tolerance_amount
-        high_touched = (df['high'] - level_price).abs() <= tolerance_amount
-        
-        # Get indices where either low or high touched
-        touches = df[low_touched | high_touched].index.tolist()
+        low_touched = np.abs(lows - level_prices) <= tolerance_amount
+        high_touched = np.abs(highs - level_prices) <= tolerance_amount
         
-        return touches
+        return low_touched | high_touched
     
-    def _check_reaction(
+    def _reactions_after(
         self,
-        touch_idx: int,
-        level_price: float,
-        level_type: str,
-        df: pd.DataFrame
-    ) -> bool:
+        lows: np.ndarray,
+        highs: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """
-        Check if price reacted after touching the level.
+        Check, for every bar, whether price reacted in the following bars.
         
         Reaction means:
-        - Support: Price bounces UP (low touches level, then price goes up)
-        - Resistance: Price bounces DOWN (high touches level, then price goes down)
+        - Support: Price bounces UP (high rises 1% above the bar's low)
+        - Resistance: Price bounces DOWN (low falls 1% below the bar's high)
         
-        Optimized: Uses vectorized operations for faster checking.
+        A touch only depends on the bar it happened at, so this is computed
+        once per price series and looked up for every level's touches.
         
         Args:
-            touch_idx: Index where price touched level
-            level_price: The level price
-            level_type: 'support' or 'resistance'
-            df: DataFrame with OHLCV data
+            lows: Low prices
+            highs: High prices
         
         Returns:
-            True if price reacted, False otherwise
+            Dictionary mapping 'support' and 'resistance' to boolean arrays
+            (one entry per bar; False when fewer than lookforward_bars follow)
         """
-        # Don't check if we're too close to the end
-        if touch_idx + self.lookforward_bars >= len(df):
-            return False
-        
-        # Get future rows using vectorized slicing (faster than iloc)
-        end_idx = min(touch_idx + self.lookforward_bars + 1, len(df))
-        future_rows = df.iloc[touch_idx + 1:end_idx]
-        
-        if len(future_rows) == 0:
-            return False
-        
-        # Vectorized operations (much faster)
-        if level_type == 'support':
-            # Support: price should bounce UP
-            touch_price = df.iloc[touch_idx]['low']  # Support touched at low
-            future_highs = future_rows['high'].values
+        n = len(lows)
+        support = np.zeros(n, dtype=bool)
+        resistance = np.zeros(n, dtype=bool)
+        
+        # Don't check bars too close to the end
+        checkable = n - self.lookforward_bars
+        if checkable > 0 and self.lookforward_bars > 0:
+            # Extremes over the next lookforward_bars bars (fmax/fmin skip NaN like
+            # the elementwise comparisons they replace)
+            window = np.lib.stride_tricks.sliding_window_view
+            future_highs = np.fmax.reduce(window(highs[1:], self.lookforward_bars), axis=1)
+            future_lows = np.fmin.reduce(window(lows[1:], self.lookforward_bars), axis=1)
             
             # Reaction if price goes up (future high > touch price * 1.01)
-            reaction = np.any(future_highs > touch_price * 1.01)  # At least 1% bounce
-            
-        elif level_type == 'resistance':
-            # Resistance: price should bounce DOWN
-            touch_price = df.iloc[touch_idx]['high']  # Resistance touched at high
-            future_lows = future_rows['low'].values
-            
+            support[:checkable] = future_highs > lows[:checkable] * 1.01  # At least 1% bounce
             # Reaction if price goes down (future low < touch price * 0.99)
-            reaction = np.any(future_lows < touch_price * 0.99)  # At least 1% rejection
-            
-        else:
-            # Unknown type - can't validate
-            reaction = False
+            resistance[:checkable] = future_lows < highs[:checkable] * 0.99  # At least 1% rejection
         
-        return reaction
+        return {'support': support, 'resistance': resistance}
@@ -20,6 +20,7 @@ How it works:
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional
+from ..utils.data_loader import ohlcv_arrays
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -62,7 +63,8 @@ class VolumeProfileAnalyzer:
     
     def analyze_volume_profile(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        ohlcv: Optional[Dict[str, np.ndarray]] = None
     ) -> Dict[str, Any]:
         """
         Analyze volume distribution to create volume profile.
@@ -75,6 +77,7 @@ class VolumeProfileAnalyzer:
         
         Args:
             df: DataFrame with OHLCV data (must have 'high', 'low', 'volume', 'close' columns)
+            ohlcv: Precomputed column arrays from ohlcv_arrays(df) (optional)
         
         Returns:
             Dictionary with:
@@ -85,9 +88,15 @@ class VolumeProfileAnalyzer:
         if 'high' not in df.columns or 'low' not in df.columns or 'volume' not in df.columns:
             raise ValueError("DataFrame must have 'high', 'low', and 'volume' columns")
         
-        # Get price range
-        min_price = float(df['low'].min())
-        max_price = float(df['high'].max())
+        if ohlcv is None:
+            ohlcv = ohlcv_arrays(df)
+        lows = ohlcv['low']
+        highs = ohlcv['high']
+        volumes = ohlcv['volume']
+        
+        # Get price range (NaN-skipping, like the pandas reductions)
+        min_price = float(np.nanmin(lows))
+        max_price = float(np.nanmax(highs))
         price_range = max_price - min_price
         
         if price_range == 0:
@@ -106,11 +115,6 @@ class VolumeProfileAnalyzer:
         # Optimized: use vectorized operations where possible
         volume_profile = np.zeros(self.num_bins)
         
-        # Get arrays for faster access
-        lows = df['low'].values
-        highs = df['high'].values
-        volumes = df['volume'].values
-        
         # Vectorized calculation for each bin
         for i in range(self.num_bins):
             bin_low = bin_edges[i]
@@ -166,7 +170,8 @@ class VolumeProfileAnalyzer:
     
     def detect_volume_levels(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        ohlcv: Optional[Dict[str, np.ndarray]] = None
     ) -> List[Dict[str, Any]]:
         """
         Detect support/resistance levels based on volume profile.
@@ -179,6 +184,7 @@ class VolumeProfileAnalyzer:
         
         Args:
             df: DataFrame with OHLCV data
+            ohlcv: Precomputed column arrays from ohlcv_arrays(df) (optional)
         
         Returns:
             List of level dictionaries with:
@@ -188,8 +194,11 @@ class VolumeProfileAnalyzer:
             - volume_percentile: Volume percentile (0-100)
             - touches: Number of times price touched this level
         """
+        if ohlcv is None:
+            ohlcv = ohlcv_arrays(df)
+        
         # Analyze volume profile
-        profile_result = self.analyze_volume_profile(df)
+        profile_result = self.analyze_volume_profile(df, ohlcv)
         high_volume_nodes = profile_result['high_volume_nodes']
         
         if not high_volume_nodes:
@@ -198,18 +207,20 @@ class VolumeProfileAnalyzer:
         
         # Determine support/resistance for each node
         levels = []
-        current_price = float(df.iloc[-1]['close'])
+        current_price = float(ohlcv['close'][-1])
         
-        for node in high_volume_nodes:
-            node_price = node['price']
-            
-            # Count touches (how many times price came within tolerance)
-            tolerance = node_price * 0.01  # 1% tolerance
-            touches = self._count_touches(df, node_price, tolerance)
-            
+        # Count touches for all nodes at once (how many times price came within
+        # tolerance), reading node prices as one array instead of per dict
+        node_prices = np.array([node['price'] for node in high_volume_nodes], dtype=np.float64)
+        tolerances = node_prices * 0.01  # 1% tolerance
+        touch_counts = self._count_touches(ohlcv['low'], ohlcv['high'], node_prices, tolerances)
+        
+        for node, touches in zip(high_volume_nodes, touch_counts.tolist()):
             if touches < self.min_touches:
                 continue  # Skip nodes with too few touches
             
+            node_price = node['price']
+            
             # Determine type: support if below current price, resistance if above
             if node_price < current_price:
                 level_type = 'support'
@@ -233,25 +244,29 @@ class VolumeProfileAnalyzer:
     
     def _count_touches(
         self,
-        df: pd.DataFrame,
-        level_price: float,
-        tolerance: float
-    ) -> int:
+        lows: np.ndarray,
+        highs: np.ndarray,
+        level_prices: np.ndarray,
+        tolerances: np.ndarray
+    ) -> np.ndarray:
         """
-        Count how many times price touched a level (within tolerance).
+        Count how many times price touched each level (within tolerance).
         
         Args:
-            df: DataFrame with OHLCV data
-            level_price: Level price to check
-            tolerance: Price tolerance
+            lows: Low prices
+            highs: High prices
+            level_prices: Level prices to check
+            tolerances: Price tolerance for each level
         
         Returns:
-            Number of touches
+            Number of touches per level
         """
-        # Vectorized operation (much faster than iterrows)
+        # Broadcast every level against every bar (levels x bars)
         # Check if level is within candle range (low - tolerance <= level <= high + tolerance)
-        touches = ((df['low'] - tolerance) <= level_price) & (level_price <= (df['high'] + tolerance))
-        return int(touches.sum())
+        level_prices = level_prices[:, np.newaxis]
+        tolerances = tolerances[:, np.newaxis]
+        touches = ((lows - tolerances) <= level_prices) & (level_prices <= (highs + tolerances))
+        return np.count_nonzero(touches, axis=1)
     
     def merge_with_price_levels(
         self,
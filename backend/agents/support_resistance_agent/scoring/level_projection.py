@@ -16,6 +16,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from ..utils.logger import get_logger
 import numpy as np
+import pandas as pd
 
 logger = get_logger(__name__)
 
@@ -153,6 +154,106 @@ class LevelProjector:
             'days_since_last_touch': days_since_touch
         }
     
+    def project_level_validity_batch(
+        self,
+        levels: List[Dict[str, Any]],
+        projection_days: int = 30
+    ) -> List[Dict[str, Any]]:
+        """
+        Project validity for many levels at once.
+        
+        Same rules and output as project_level_validity(), but the current date
+        is taken once, the lifespan/probability/decay arithmetic runs on arrays
+        for all levels, and valid_until strings are shared between levels with
+        the same remaining lifespan.
+        
+        Args:
+            levels: List of level dictionaries with strength, last_touch, etc.
+            projection_days: How many days ahead to project (default: 30)
+        
+        Returns:
+            List of projection dictionaries (same keys as project_level_validity),
+            one per level in the same order
+        """
+        from datetime import timezone
+        
+        if not levels:
+            return []
+        
+        current_date = datetime.now(timezone.utc)
+        now_us = pd.Timestamp(current_date).value // 1000
+        
+        # Gather strength and days since last touch
+        strengths = []
+        days_since = []
+        for level in levels:
+            strengths.append(level.get('strength', 50))
+            last_touch = level.get('last_touch')
+            if last_touch:
+                if isinstance(last_touch, str):
+                    from dateutil.parser import parse
+                    last_touch = parse(last_touch)
+                # Naive timestamps are UTC; whole days like timedelta.days
+                days_since.append((now_us - pd.Timestamp(last_touch).value // 1000) // 86_400_000_000)
+            else:
+                days_since.append(365)  # Assume old if no touch data
+        strength = np.array(strengths, dtype=np.float64)
+        days = np.array(days_since, dtype=np.int64)
+        
+        # Estimate level lifespan based on strength
+        base_lifespan_days = np.select([strength >= 80, strength >= 60], [120, 60], default=30)
+        
+        # Adjust for time since last touch
+        aged = base_lifespan_days - (days - 30)
+        remaining_lifespan = np.where(
+            days <= 30,
+            base_lifespan_days,
+            np.where(days <= 90, aged, np.maximum(7, aged))  # At least 7 days
+        )
+        
+        # Validity probability before clamping (clamped per level below so the
+        # floors keep their integer type, as in project_level_validity)
+        still_valid = projection_days <= remaining_lifespan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            valid_probability = 100 - (projection_days / remaining_lifespan * 50)
+        expired_probability = 50 - ((projection_days - remaining_lifespan) / 30 * 40)
+        
+        # Project strength decay
+        strength_decay_per_month = np.select([strength >= 80, strength >= 60], [5, 8], default=10)
+        months_projected = projection_days / 30
+        decayed_strength = strength - (strength_decay_per_month * months_projected)
+        
+        valid_until_by_lifespan = {}
+        projections = []
+        for remaining, days_since_touch, is_valid, valid_prob, expired_prob, decayed in zip(
+            remaining_lifespan.tolist(),
+            days.tolist(),
+            still_valid.tolist(),
+            valid_probability.tolist(),
+            expired_probability.tolist(),
+            decayed_strength.tolist()
+        ):
+            valid_until = valid_until_by_lifespan.get(remaining)
+            if valid_until is None:
+                valid_until = (current_date + timedelta(days=remaining)).isoformat() + "Z"
+                valid_until_by_lifespan[remaining] = valid_until
+            
+            if is_valid:
+                validity_probability = valid_prob if valid_prob > 50 else 50
+            else:
+                validity_probability = expired_prob if expired_prob > 10 else 10
+            projected_strength = decayed if decayed > 0 else 0
+            
+            projections.append({
+                'valid_until': valid_until,
+                'validity_probability': round(validity_probability, 1),
+                'projected_strength': round(projected_strength, 1),
+                'remaining_lifespan_days': remaining,
+                'days_since_last_touch': days_since_touch
+            })
+        
+        return projections
+    
     def predict_future_levels(
         self,
         df,
@@ -35,6 +35,10 @@ except ImportError:
     XGBOOST_AVAILABLE = False
     logger.warning("XGBoost not available. Will use LightGBM if available.")
 
+# Timeframe feature encoding (normalized)
+_TIMEFRAME_ENCODING = {'1m': 0.0, '5m': 0.1, '15m': 0.2, '30m': 0.3,
+                       '1h': 0.4, '4h': 0.5, '1d': 0.6, '1w': 0.7, '1mo': 0.8, '1y': 1.0}
+
 
 class MLLevelPredictor:
     """
@@ -122,97 +126,128 @@ class MLLevelPredictor:
         - Price trend (up/down)
         - Volume profile at predicted level
         - Historical level density near prediction
+        
+        Uses extract_features_batch, so training and scoring see the same features.
+        """
+        return self.extract_features_batch([predicted_level], df, current_price, timeframe)[0]
+    
+    def extract_features_batch(
+        self,
+        predicted_levels: List[Dict[str, Any]],
+        df: pd.DataFrame,
+        current_price: float,
+        timeframe: str
+    ) -> np.ndarray:
+        """
+        Extract features for several predicted levels at once.
+        
+        Features that only depend on the price history (volatility, trend,
+        recent range) are computed once, and the volume/density windows for
+        all levels come from one levels x bars comparison instead of
+        filtering the DataFrame per level.
+        
+        Args:
+            predicted_levels: List of predicted level dictionaries
+            df: Historical price data
+            current_price: Current market price
+            timeframe: Data timeframe
+        
+        Returns:
+            Feature matrix of shape (levels, 12), one row per level
         """
-        price = predicted_level['price']
-        source = predicted_level.get('source', 'unknown')
-        rule_confidence = predicted_level.get('confidence', 50)
+        n_bars = len(df)
+        prices = np.array([level['price'] for level in predicted_levels], dtype=np.float64)
+        sources = [level.get('source', 'unknown') for level in predicted_levels]
         
         # Feature 1: Normalized price distance from current
-        price_distance_pct = abs(price - current_price) / current_price if current_price > 0 else 0
+        if current_price > 0:
+            price_distance_pct = np.abs(prices - current_price) / current_price
+        else:
+            price_distance_pct = np.zeros(len(prices))
         
         # Feature 2: Source type encoding (one-hot like)
-        source_fibonacci = 1.0 if source == 'fibonacci' else 0.0
-        source_round = 1.0 if source == 'round_number' else 0.0
-        source_spacing = 1.0 if source == 'spacing_pattern' else 0.0
+        source_fibonacci = np.array([source == 'fibonacci' for source in sources], dtype=np.float64)
+        source_round = np.array([source == 'round_number' for source in sources], dtype=np.float64)
+        source_spacing = np.array([source == 'spacing_pattern' for source in sources], dtype=np.float64)
         
         # Feature 3: Rule-based confidence (normalized 0-1)
-        rule_confidence_norm = rule_confidence / 100.0
+        rule_confidence_norm = np.array(
+            [level.get('confidence', 50) for level in predicted_levels], dtype=np.float64
+        ) / 100.0
         
         # Feature 4: Recent volatility (20-period)
-        if len(df) >= 20:
+        if n_bars >= 20:
             returns = df['close'].pct_change().tail(20)
             volatility = returns.std() * np.sqrt(252) if len(returns) > 1 else 0.0  # Annualized
         else:
             volatility = 0.0
         
         # Feature 5: Price trend (1 = up, -1 = down, 0 = neutral)
-        if len(df) >= 10:
+        if n_bars >= 10:
             recent_prices = df['close'].tail(10).values
             price_trend = 1.0 if recent_prices[-1] > recent_prices[0] else -1.0
         else:
             price_trend = 0.0
         
+        if n_bars >= 20:
+            lows = df['low'].to_numpy(dtype=np.float64)[np.newaxis, :]
+            highs = df['high'].to_numpy(dtype=np.float64)[np.newaxis, :]
+            level_prices = prices[:, np.newaxis]
+        
         # Feature 6: Volume profile at predicted level (if available)
-        if 'volume' in df.columns and len(df) >= 20:
+        if 'volume' in df.columns and n_bars >= 20:
             # Find volume near predicted level (within 2%)
             price_window = current_price * 0.02
-            near_volume = df[
-                (df['low'] <= price + price_window) & 
-                (df['high'] >= price - price_window)
-            ]['volume'].sum() if len(df) > 0 else 0
-            volume_norm = near_volume / df['volume'].tail(100).sum() if df['volume'].sum() > 0 else 0.0
+            near = (lows <= level_prices + price_window) & (highs >= level_prices - price_window)
+            volumes = df['volume'].to_numpy(dtype=np.float64)
+            # NaN volumes are skipped, like the pandas sum
+            near_volume = np.nansum(np.where(near, volumes, 0.0), axis=1)
+            volume_norm = near_volume / df['volume'].tail(100).sum() if df['volume'].sum() > 0 else np.zeros(len(prices))
         else:
-            volume_norm = 0.0
+            volume_norm = np.zeros(len(prices))
         
         # Feature 7: Historical level density (how many levels near this price)
-        if len(df) >= 50:
+        if n_bars >= 50:
             # Count how many times price was near this level (within 1%)
             price_window = current_price * 0.01
-            historical_touches = len(df[
-                (df['low'] <= price + price_window) & 
-                (df['high'] >= price - price_window)
-            ])
-            density = historical_touches / len(df) if len(df) > 0 else 0.0
+            near = (lows <= level_prices + price_window) & (highs >= level_prices - price_window)
+            density = np.count_nonzero(near, axis=1) / n_bars
         else:
-            density = 0.0
+            density = np.zeros(len(prices))
         
         # Feature 8: Level type (1 = support, -1 = resistance)
-        level_type = 1.0 if predicted_level.get('type') == 'support' else -1.0
+        level_type = np.array(
+            [1.0 if level.get('type') == 'support' else -1.0 for level in predicted_levels]
+        )
         
         # Feature 9: Relative position in price range
-        if len(df) >= 20:
+        relative_position = np.full(len(prices), 0.5)
+        if n_bars >= 20:
             recent_high = df['high'].tail(50).max()
             recent_low = df['low'].tail(50).min()
             price_range = recent_high - recent_low
             if price_range > 0:
-                relative_position = (price - recent_low) / price_range
-            else:
-                relative_position = 0.5
-        else:
-            relative_position = 0.5
+                relative_position = (prices - recent_low) / price_range
         
         # Feature 10: Timeframe encoding (normalized)
-        timeframe_map = {'1m': 0.0, '5m': 0.1, '15m': 0.2, '30m': 0.3, 
-                        '1h': 0.4, '4h': 0.5, '1d': 0.6, '1w': 0.7, '1mo': 0.8, '1y': 1.0}
-        timeframe_encoded = timeframe_map.get(timeframe, 0.5)
+        timeframe_encoded = _TIMEFRAME_ENCODING.get(timeframe, 0.5)
         
-        # Combine all features into array
-        features = np.array([
+        # Combine all features into one row per level
+        n_levels = len(prices)
+        return np.column_stack([
             price_distance_pct,
             source_fibonacci,
             source_round,
             source_spacing,
             rule_confidence_norm,
-            volatility,
-            price_trend,
+            np.full(n_levels, volatility),
+            np.full(n_levels, price_trend),
             volume_norm,
             density,
             level_type,
             relative_position,
-            timeframe_encoded
+            np.full(n_levels, timeframe_encoded)
         ])
-        
-        return features
     
     def score_predictions(
         self,
@@ -242,11 +277,8 @@ class MLLevelPredictor:
             return []
         
         try:
-            # Extract features for all predictions
-            feature_matrix = np.array([
-                self.extract_features(level, df, current_price, timeframe)
-                for level in predicted_levels
-            ])
+            # Extract features for all predictions in one batch
+            feature_matrix = self.extract_features_batch(predicted_levels, df, current_price, timeframe)
             
             # Get ML predictions (probability that level will become valid)
             if LIGHTGBM_AVAILABLE and isinstance(self.model, lgb.Booster):
@@ -22,6 +22,8 @@ Breakout Probability:
 
 from typing import List, Dict, Any
 from datetime import datetime
+import numpy as np
+import pandas as pd
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -252,6 +254,123 @@ class StrengthCalculator:
         logger.info(f"Calculated breakout probabilities for {len(levels)} levels")
         return levels
     
+    def compute_all(
+        self,
+        levels: List[Dict[str, Any]],
+        current_price: float,
+        current_date: datetime = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate strength scores and breakout probabilities in one pass.
+        
+        Gives the same results as calculate_strengths() followed by
+        calculate_breakout_probabilities(), but gathers the level fields into
+        arrays once and scores every level with vectorized arithmetic instead
+        of walking the list twice with per-level calls.
+        
+        Args:
+            levels: List of level dictionaries
+            current_price: Current market price
+            current_date: Current date for time relevance (default: now)
+        
+        Returns:
+            List of levels with 'strength' and 'breakout_probability' keys added
+        """
+        if not levels:
+            return levels
+        
+        if current_date is None:
+            current_date = datetime.utcnow()
+        # Naive dates are treated as UTC, as in _time_relevance_score()
+        now_us = pd.Timestamp(current_date).value // 1000
+        
+        # Gather level fields into arrays (one pass over the dicts)
+        n = len(levels)
+        prices = np.empty(n, dtype=np.float64)
+        touches = np.empty(n, dtype=np.float64)
+        validation_rates = np.empty(n, dtype=np.float64)
+        days_ago = np.empty(n, dtype=np.float64)
+        level_types = []
+        for i, level in enumerate(levels):
+            prices[i] = level.get('price', 0)
+            touches[i] = level.get('touches', level.get('touch_count', 0))
+            validation_rates[i] = level.get('validation_rate', 0.0)
+            level_types.append(level.get('type', 'unknown'))
+            
+            last_touch = level.get('last_touch')
+            if not last_touch:
+                days_ago[i] = np.nan  # No touch info - assume old
+                continue
+            if isinstance(last_touch, str):
+                from dateutil.parser import parse
+                last_touch = parse(last_touch)
+            # Whole days since last touch, like timedelta.days
+            days_ago[i] = (now_us - pd.Timestamp(last_touch).value // 1000) // 86_400_000_000
+        level_types = np.array(level_types, dtype=object)
+        
+        # Touch count score (same table as _touch_count_score)
+        touch_score = np.select(
+            [touches == 0, touches == 1, touches == 2, touches == 3, touches == 4],
+            [0.0, 0.2, 0.4, 0.6, 0.75],
+            default=1.0
+        )
+        
+        # Time relevance score (same buckets as _time_relevance_score)
+        time_score = np.select(
+            [days_ago <= 30, days_ago <= 90, days_ago <= 180, days_ago <= 365],
+            [1.0, 0.8, 0.6, 0.4],
+            default=0.2
+        )
+        
+        # Price reaction score (same buckets as _price_reaction_score)
+        reaction_score = np.select(
+            [validation_rates >= 0.8, validation_rates >= 0.6, validation_rates >= 0.4, validation_rates >= 0.2],
+            [1.0, 0.8, 0.6, 0.4],
+            default=0.2
+        )
+        
+        strength = (
+            touch_score * self.touch_weight +
+            time_score * self.time_weight +
+            reaction_score * self.reaction_weight
+        ) * 100
+        # Round to integer (half to even, like round()) and clamp to 0-100
+        strength = np.clip(np.rint(strength), 0, 100)
+        
+        # Breakout probability (same factors as calculate_breakout_probability)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_distance = np.abs(current_price - prices) / prices
+        distance_factor = np.clip(1.0 - (price_distance * 10), 0.0, 1.0)
+        strength_factor = 1.0 - (strength / 100.0)
+        is_support = level_types == 'support'
+        is_resistance = level_types == 'resistance'
+        direction_factor = np.select(
+            [
+                is_support & (current_price < prices),
+                is_support,
+                is_resistance & (current_price > prices),
+                is_resistance,
+            ],
+            [1.0, 0.2, 1.0, 0.3],
+            default=0.5
+        )
+        breakout_prob = (
+            distance_factor * 0.4 +
+            strength_factor * 0.3 +
+            direction_factor * 0.3
+        ) * 100.0
+        breakout_prob = np.clip(breakout_prob, 0.0, 100.0)
+        breakout_prob[prices == 0] = 0.0
+        
+        for level, level_strength, level_breakout in zip(
+            levels, strength.astype(np.int64).tolist(), breakout_prob.tolist()
+        ):
+            level['strength'] = level_strength
+            level['breakout_probability'] = level_breakout
+        
+        logger.info(f"Calculated strength scores and breakout probabilities for {n} levels")
+        return levels
+    
     def _touch_count_score(self, touches: int) -> float:
         """
         Calculate score based on number of touches.
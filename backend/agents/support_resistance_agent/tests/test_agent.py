@@ -55,6 +55,18 @@ class TestSupportResistanceAgent:
         assert agent.validator is not None, "Validator should be initialized"
         assert agent.strength_calculator is not None, "Strength calculator should be initialized"
     
+    def test_components_shared_across_agents(self):
+        """Test that parameter-only components are shared and the projector is per agent."""
+        agent1 = SupportResistanceAgent(config={"use_mock_data": True, "use_ml_predictions": False})
+        agent2 = SupportResistanceAgent(config={"use_mock_data": True, "use_ml_predictions": False})
+        agent1.initialize()
+        agent2.initialize()
+        
+        assert agent1.clusterer is agent2.clusterer, "Components should be shared"
+        assert agent1.level_projector is not agent2.level_projector, \
+            "Projector (and its ML model) should be loaded per agent"
+        assert agent1.data_loader is not agent2.data_loader, "Data loaders stay per agent"
+    
     def test_process_single_ticker(self):
         """Test processing a single ticker."""
         agent = SupportResistanceAgent(config={"use_mock_data": True})
@@ -103,6 +115,21 @@ class TestSupportResistanceAgent:
         assert all('total_levels' in results[s] for s in symbols), \
             "All results should have total_levels"
     
+    def test_key_levels_summary_optional(self):
+        """Test that batch results skip the key levels summary unless requested."""
+        agent = SupportResistanceAgent(config={"use_mock_data": True, "enable_cache": True})
+        agent.initialize()
+        
+        assert 'key_price_levels' in agent.process("AAPL")
+        
+        batch = agent.detect_levels_batch(["AAPL"])
+        assert 'key_price_levels' not in batch["AAPL"]
+        assert batch["AAPL"]['support_levels'] == agent.process("AAPL")['support_levels']
+        
+        # Cached responses must not cross between the two forms
+        assert 'key_price_levels' in agent.process("AAPL")
+        assert 'key_price_levels' in agent.detect_levels_batch(["AAPL"], include_summary=True)["AAPL"]
+    
     def test_caching(self):
         """Test result caching."""
         agent = SupportResistanceAgent(config={"use_mock_data": True, "enable_cache": True})
@@ -118,6 +145,24 @@ class TestSupportResistanceAgent:
         assert result1['total_levels'] == result2['total_levels'], \
             "Cached result should match original"
     
+    def test_cached_levels_shared_across_filters(self):
+        """Test that requests differing only in min_strength/max_levels reuse detected levels."""
+        agent = SupportResistanceAgent(config={"use_mock_data": True, "enable_cache": True})
+        agent.initialize()
+        
+        result1 = agent.process("AAPL", {"min_strength": 0, "max_levels": 10})
+        with patch.object(agent.data_loader, "load_ohlcv_data") as load:
+            result2 = agent.process("AAPL", {"min_strength": 60, "max_levels": 2})
+        
+        load.assert_not_called()
+        expected = agent.detect_levels("AAPL", min_strength=60, max_levels=2)
+        assert result2['support_levels'] == expected['support_levels'], \
+            "Filtering cached levels should match a fresh detection"
+        assert result2['resistance_levels'] == expected['resistance_levels'], \
+            "Filtering cached levels should match a fresh detection"
+        assert result2['total_levels'] <= result1['total_levels'], \
+            "Stricter filter should not return more levels"
+    
     def test_clear_cache(self):
         """Test cache clearing."""
         agent = SupportResistanceAgent(config={"use_mock_data": True, "enable_cache": True})
@@ -169,3 +214,24 @@ class TestSupportResistanceAgent:
         
         assert len(results) == len(symbols), "Should process all symbols"
         assert all(s in results for s in symbols), "Should have results for all symbols"
+    
+    def test_detect_levels_batch_processes(self):
+        """Test batch processing in worker processes matches sequential results."""
+        symbols = ["AAPL", "TSLA", "MSFT", "GOOGL", "SPY", "INVALID_SYMBOL"]
+        
+        agent = SupportResistanceAgent(config={"use_mock_data": True, "use_ml_predictions": False})
+        agent.initialize()
+        results = agent.detect_levels_batch(symbols, use_parallel=True, use_processes=True)
+        
+        sequential_agent = SupportResistanceAgent(config={"use_mock_data": True, "use_ml_predictions": False})
+        sequential_agent.initialize()
+        expected = sequential_agent.detect_levels_batch(symbols)
+        
+        assert set(results) == set(symbols), "Should have results for all symbols"
+        for symbol in symbols:
+            assert results[symbol].get('status') == expected[symbol].get('status'), \
+                f"{symbol} status should match sequential processing"
+            assert results[symbol].get('support_levels') == expected[symbol].get('support_levels'), \
+                f"{symbol} levels should match sequential processing"
+        assert agent._result_cache_key("AAPL", 50, 5, "1d", False, None, False) in agent._cache, \
+            "Worker results should be cached in the parent"
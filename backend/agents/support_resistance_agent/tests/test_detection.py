@@ -21,6 +21,7 @@ from unittest.mock import Mock, patch
 
 # Import components to test
 from ..detection import ExtremaDetector, DBSCANClusterer, LevelValidator
+from ..utils import ohlcv_arrays
 
 
 class TestExtremaDetector:
@@ -89,6 +90,31 @@ class TestExtremaDetector:
         assert all('type' in v for v in valleys), "All valleys should have type"
         assert all(v['type'] == 'support' for v in valleys), "Valleys should be support type"
     
+    def test_sliding_backend_matches_scipy(self):
+        """Test that the sliding-window scan finds the same extrema as scipy."""
+        pytest.importorskip("scipy")
+        rng = np.random.default_rng(0)
+        
+        for window_size, min_distance in ((1, 0), (3, 5), (5, 10), (7, 1)):
+            # Rounded prices produce ties (not extrema); a NaN blocks its neighbors
+            highs = np.round(100 + rng.standard_normal(400).cumsum(), 1)
+            highs[150] = np.nan
+            df = pd.DataFrame({
+                'timestamp': pd.date_range('2022-01-01', periods=len(highs), freq='D', tz='UTC'),
+                'high': highs,
+                'low': highs - 1
+            })
+            
+            sliding = ExtremaDetector(window_size=window_size, min_distance=min_distance)
+            scipy_detector = ExtremaDetector(
+                window_size=window_size, min_distance=min_distance, backend="scipy"
+            )
+            
+            assert sliding.detect_peaks(df) == scipy_detector.detect_peaks(df), \
+                "Backends should produce identical peaks"
+            assert sliding.detect_valleys(df) == scipy_detector.detect_valleys(df), \
+                "Backends should produce identical valleys"
+    
     def test_filter_noise(self):
         """Test noise filtering removes insignificant extrema."""
         extrema = [
@@ -166,6 +192,27 @@ class TestDBSCANClusterer:
         assert all('touches' in l for l in levels), "All levels should have touches count"
         assert all('cluster_id' in l for l in levels), "All levels should have cluster_id"
     
+    def test_sorted_backend_matches_sklearn(self):
+        """Test that the sort-based 1-D DBSCAN gives the same levels as sklearn."""
+        pytest.importorskip("sklearn")
+        rng = np.random.default_rng(0)
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        for min_samples in (1, 2, 3):
+            # Rounded prices produce ties and points exactly eps apart
+            prices = np.round(rng.uniform(95, 105, 300), 1)
+            extrema = [
+                {'price': float(p), 'timestamp': base + timedelta(days=i), 'type': 'resistance'}
+                for i, p in enumerate(prices)
+            ]
+            
+            sorted_levels = DBSCANClusterer(eps=0.005, min_samples=min_samples).cluster_levels(extrema)
+            sklearn_levels = DBSCANClusterer(
+                eps=0.005, min_samples=min_samples, backend="sklearn"
+            ).cluster_levels(extrema)
+            
+            assert sorted_levels == sklearn_levels, "Backends should produce identical levels"
+    
     def test_filter_clusters(self):
         """Test filtering weak clusters."""
         levels = [
@@ -181,6 +228,23 @@ class TestDBSCANClusterer:
         assert len(filtered) == 2, "Should filter out level with 1 touch"
         assert all(l['touches'] >= 2 for l in filtered), "All filtered levels should have >= 2 touches"
     
+    def test_cluster_levels_min_touches(self):
+        """Test that filtering while clustering matches filter_clusters."""
+        rng = np.random.default_rng(1)
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        extrema = [
+            {'price': float(p), 'timestamp': base + timedelta(days=i), 'type': 'support'}
+            for i, p in enumerate(np.round(rng.uniform(95, 105, 200), 1))
+        ]
+        
+        clusterer = DBSCANClusterer(eps=0.003, min_samples=2)
+        all_levels = clusterer.cluster_levels(extrema)
+        for min_touches in (1, 3, 6):
+            expected = clusterer.filter_clusters(all_levels, min_touches=min_touches)
+            assert clusterer.cluster_levels(extrema, min_touches=min_touches) == expected, \
+                "Filtering during clustering should match filter_clusters"
+        assert clusterer.cluster_levels(extrema, min_touches=1000) == [], "Should drop every cluster"
+    
     def test_empty_extrema(self):
         """Test handling of empty extrema list."""
         clusterer = DBSCANClusterer()
@@ -301,6 +365,30 @@ class TestLevelValidator:
         assert all('validated' in l for l in validated), "All levels should have validated field"
         assert all('validation_rate' in l for l in validated), "All levels should have validation_rate"
     
+    def test_validate_levels_with_precomputed_arrays(self):
+        """Test that passing ohlcv_arrays(df) gives the same validation."""
+        rng = np.random.default_rng(0)
+        close = 100 + np.cumsum(rng.normal(0, 1, 120))
+        df = pd.DataFrame({
+            'timestamp': pd.date_range('2022-01-01', periods=120, freq='D', tz='UTC'),
+            'high': close + 1,
+            'low': close - 1,
+            'open': close,
+            'close': close,
+            'volume': [1000000] * 120
+        })
+        levels = [
+            {'price': float(p), 'type': t}
+            for p, t in zip(close[::15], ['support', 'resistance'] * 4)
+        ]
+        
+        validator = LevelValidator()
+        expected = validator.validate_levels([dict(l) for l in levels], df)
+        validated = validator.validate_levels([dict(l) for l in levels], df, ohlcv_arrays(df))
+        
+        assert validated == expected, "Precomputed arrays should not change results"
+        assert any(l['touch_count'] > 0 for l in validated), "Levels on the price path should be touched"
+    
     def test_empty_levels(self):
         """Test validation of empty levels list."""
         dates = pd.date_range('2022-01-01', periods=10, freq='D', tz='UTC')
@@ -3,6 +3,8 @@ Unit Tests for Scoring Module
 
 Tests for:
 - StrengthCalculator (0-100 strength scores)
+- LevelProjector (level validity projection)
+- MLLevelPredictor (feature extraction)
 
 Why unit tests?
 - Verify strength calculation formula works correctly
@@ -11,8 +13,10 @@ Why unit tests?
 """
 
 import pytest
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta, timezone
-from ..scoring import StrengthCalculator
+from ..scoring import StrengthCalculator, LevelProjector, MLLevelPredictor
 
 
 class TestStrengthCalculator:
@@ -158,3 +162,106 @@ class TestStrengthCalculator:
         strength = calculator.calculate_strength(level)
         
         assert 0 <= strength <= 100, "Should handle string timestamps"
+    
+    def test_compute_all_matches_separate_passes(self):
+        """Test that compute_all gives the same strengths and breakout probabilities."""
+        now = datetime.now(timezone.utc)
+        levels = [
+            {'price': 100.0, 'touches': 3, 'validation_rate': 0.7,
+             'last_touch': now - timedelta(days=30), 'type': 'support'},
+            {'price': 150.0, 'touch_count': 5, 'validation_rate': 0.2,
+             'last_touch': '2024-01-15T10:00:00Z', 'type': 'resistance'},
+            {'price': 120.0, 'touches': 1, 'validation_rate': 0.5,
+             'last_touch': now.replace(tzinfo=None) - timedelta(days=200), 'type': 'resistance'},
+            {'price': 90.0, 'touches': 2, 'type': 'support'},  # No last_touch
+            {'price': 0, 'touches': 4, 'validation_rate': 0.9, 'type': 'support'},
+        ]
+        
+        calculator = StrengthCalculator()
+        expected = calculator.calculate_breakout_probabilities(
+            calculator.calculate_strengths([dict(l) for l in levels], now), 110.0
+        )
+        scored = calculator.compute_all([dict(l) for l in levels], 110.0, now)
+        
+        assert scored == expected, "compute_all should match calculate_strengths + breakout probabilities"
+        assert all(isinstance(l['strength'], int) for l in scored), "Strengths should be integers"
+        assert calculator.compute_all([], 110.0, now) == [], "Empty levels should return empty list"
+
+
+class TestLevelProjector:
+    """
+    Test suite for LevelProjector.
+    
+    Tests:
+    - Batch validity projection
+    """
+    
+    def test_project_level_validity_batch_matches_single(self):
+        """Test that batch projection matches per-level projection."""
+        now = datetime.now(timezone.utc)
+        levels = [
+            {'strength': 85, 'last_touch': now - timedelta(days=10, hours=12)},
+            {'strength': 65, 'last_touch': now - timedelta(days=60, hours=12)},
+            {'strength': 40, 'last_touch': (now - timedelta(days=200, hours=12)).isoformat()},
+            {'strength': 55, 'last_touch': (now - timedelta(days=45, hours=12)).replace(tzinfo=None)},
+            {'strength': 90},  # No last_touch
+        ]
+        
+        projector = LevelProjector(use_ml=False)
+        for projection_days in (5, 30, 140):
+            expected = [projector.project_level_validity(l, projection_days) for l in levels]
+            projections = projector.project_level_validity_batch(levels, projection_days)
+            
+            assert len(projections) == len(levels), "Should project every level"
+            for projection, single in zip(projections, expected):
+                assert projection['valid_until'].endswith('Z'), "valid_until should be ISO with Z"
+                # valid_until depends on the exact current time of each call
+                projection.pop('valid_until')
+                single.pop('valid_until')
+                assert projection == single, "Batch projection should match per-level projection"
+        
+        assert projector.project_level_validity_batch([], 30) == [], "Empty levels should return empty list"
+
+
+class TestMLLevelPredictor:
+    """
+    Test suite for MLLevelPredictor.
+    
+    Tests:
+    - Batch feature extraction
+    """
+    
+    def test_extract_features_batch(self):
+        """Test that batch features match the per-level feature definitions."""
+        closes = 100 + np.sin(np.arange(60) / 5) * 5
+        df = pd.DataFrame({
+            'close': closes,
+            'high': closes + 1,
+            'low': closes - 1,
+            'volume': np.arange(60) + 1000
+        })
+        current_price = float(closes[-1])
+        levels = [
+            {'price': 95.0, 'source': 'fibonacci', 'confidence': 70, 'type': 'support'},
+            {'price': 104.0, 'source': 'round_number', 'type': 'resistance'},
+        ]
+        
+        predictor = MLLevelPredictor(use_model=False)
+        features = predictor.extract_features_batch(levels, df, current_price, '1d')
+        
+        assert features.shape == (2, 12), "Should return one row of 12 features per level"
+        for row, level in zip(features, levels):
+            price = level['price']
+            near_2pct = (df['low'] <= price + current_price * 0.02) & (df['high'] >= price - current_price * 0.02)
+            near_1pct = (df['low'] <= price + current_price * 0.01) & (df['high'] >= price - current_price * 0.01)
+            assert row[0] == pytest.approx(abs(price - current_price) / current_price)
+            assert row[4] == pytest.approx(level.get('confidence', 50) / 100)
+            assert row[5] == pytest.approx(df['close'].pct_change().tail(20).std() * np.sqrt(252))
+            assert row[7] == pytest.approx(df[near_2pct]['volume'].sum() / df['volume'].tail(100).sum())
+            assert row[8] == pytest.approx(near_1pct.sum() / len(df))
+            assert row[9] == (1.0 if level['type'] == 'support' else -1.0)
+        assert list(features[:, 1]) == [1.0, 0.0], "Fibonacci source should be one-hot encoded"
+        assert list(features[:, 2]) == [0.0, 1.0], "Round number source should be one-hot encoded"
+        
+        single = predictor.extract_features(levels[1], df, current_price, '1d')
+        assert np.array_equal(single, features[1]), "Single-level features should match the batch"
@@ -5,6 +5,7 @@ Tests for:
 - DataLoader (data loading)
 - Logger (logging)
 - Retry (retry logic)
+- TTLCache (result cache)
 """
 
 import pytest
@@ -14,7 +15,7 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
-from ..utils import DataLoader, get_logger, retry_with_backoff
+from ..utils import DataLoader, TTLCache, get_logger, retry_with_backoff
 
 
 class TestDataLoader:
@@ -168,3 +169,73 @@ class TestRetry:
             always_failing_func()
         
         assert call_count[0] == 3, "Should try max_retries + 1 times (initial + retries)"
+
+
+class TestTTLCache:
+    """
+    Test suite for TTLCache.
+    
+    Tests:
+    - Get/set and expiry
+    - TTL shrinking under pressure
+    - Cost-aware eviction
+    """
+    
+    def test_get_set(self):
+        """Test basic caching and missing keys."""
+        cache = TTLCache(ttl_seconds=60, max_entries=10)
+        cache.set("AAPL_50", {"total_levels": 3})
+        
+        assert cache.get("AAPL_50") == {"total_levels": 3}, "Should return cached value"
+        assert "AAPL_50" in cache, "Key should be cached"
+        assert cache.get("MSFT_50") is None, "Missing key should return None"
+        assert len(cache) == 1, "Should have one entry"
+    
+    def test_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl_seconds=60, max_entries=10)
+        with patch("time.monotonic", return_value=1000.0):
+            cache.set("AAPL_50", {"total_levels": 3})
+        
+        with patch("time.monotonic", return_value=1059.0):
+            assert cache.get("AAPL_50") is not None, "Entry should still be fresh"
+        with patch("time.monotonic", return_value=1061.0):
+            assert cache.get("AAPL_50") is None, "Entry should have expired"
+        assert len(cache) == 0, "Expired entry should be dropped"
+    
+    def test_ttl_shrinks_under_pressure(self):
+        """Test that the TTL shrinks once the cache is past its low watermark."""
+        cache = TTLCache(ttl_seconds=100, max_entries=10, low_watermark=0.5, min_ttl_fraction=0.25)
+        for i in range(5):
+            cache.set(f"key{i}", i)
+        assert cache.effective_ttl() == 100, "Below watermark should use full TTL"
+        
+        for i in range(5, 10):
+            cache.set(f"key{i}", i)
+        assert cache.effective_ttl() == 25, "At capacity should use min TTL fraction"
+    
+    def test_evicts_cheapest_first(self):
+        """Test that the cheapest entries are evicted when over capacity."""
+        cache = TTLCache(ttl_seconds=3600, max_entries=3)
+        cache.set("slow", 1, cost_seconds=2.0)
+        cache.set("fast", 2, cost_seconds=0.1)
+        cache.set("medium", 3, cost_seconds=0.5)
+        cache.set("new", 4, cost_seconds=1.0)
+        
+        assert len(cache) == 3, "Should stay within capacity"
+        assert "fast" not in cache, "Cheapest entry should be evicted"
+        assert all(k in cache for k in ("slow", "medium", "new")), "Costlier entries should remain"
+
+    
+    def test_reset_key_expires_from_new_insert_time(self):
+        """Test that re-caching a key restarts its TTL during eviction."""
+        cache = TTLCache(ttl_seconds=60, max_entries=2, min_ttl_fraction=1.0)
+        with patch("time.monotonic", return_value=1000.0):
+            cache.set("AAPL_50", 1)
+            cache.set("MSFT_50", 2, cost_seconds=10.0)  # Costly, kept unless expired
+        with patch("time.monotonic", return_value=1050.0):
+            cache.set("AAPL_50", 3)  # Refreshed
+        with patch("time.monotonic", return_value=1070.0):
+            cache.set("TSLA_50", 4)  # Over capacity: MSFT_50 has expired
+            assert cache.keys() == ["AAPL_50", "TSLA_50"], "Only the expired entry should be evicted"
+            assert cache.get("AAPL_50") == 3, "Refreshed entry should be kept"
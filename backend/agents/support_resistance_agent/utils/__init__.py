@@ -3,16 +3,21 @@ Utility functions for Support/Resistance Agent.
 
 This module contains:
 - Data loader (loads OHLCV data from mock or real sources)
+- OHLCV column arrays shared across detection stages
 - Logger (logging utility)
 - Retry (retry logic for API calls)
+- TTL cache (in-memory result cache with pressure-scaled TTL)
 """
 
-from .data_loader import DataLoader
+from .data_loader import DataLoader, ohlcv_arrays
 from .logger import get_logger
 from .retry import retry_with_backoff
+from .ttl_cache import TTLCache
 
 __all__ = [
     "DataLoader",
+    "ohlcv_arrays",
     "get_logger",
     "retry_with_backoff",
+    "TTLCache",
 ]
@@ -17,6 +17,7 @@ import os
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 # Import yfinance for fallback
@@ -26,6 +27,13 @@ try:
 except ImportError:
     YFINANCE_AVAILABLE = False
 
+# Optional C-accelerated JSON parser for the mock data file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +41,82 @@ logger = get_logger(__name__)
 if not YFINANCE_AVAILABLE:
     logger.warning("yfinance not available. Install with: pip install yfinance")
 
+# Parsed mock data files: path -> (mtime, data). The file is re-read only
+# when it changes on disk.
+_MOCK_DATA_CACHE: Dict[Path, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _read_mock_file(path: Path) -> Dict[str, Any]:
+    """Parse the mock OHLCV JSON file, reusing the last parse if unchanged."""
+    mtime = path.stat().st_mtime
+    cached = _MOCK_DATA_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    
+    _MOCK_DATA_CACHE[path] = (mtime, data)
+    return data
+
+
+# Columnar mock frames: (path, symbol) -> (mtime, DataFrame). Built once from
+# the parsed records with timestamps already converted and sorted, so each load
+# only slices the date range instead of rebuilding the frame row by row.
+_MOCK_FRAME_CACHE: Dict[Tuple[Path, str], Tuple[float, pd.DataFrame]] = {}
+
+
+def _mock_symbol_frame(path: Path, symbol: str) -> pd.DataFrame:
+    """
+    Get the full, timestamp-sorted mock DataFrame for a symbol.
+    
+    The returned frame is shared; callers must slice or copy it before
+    handing it out.
+    
+    Raises:
+        ValueError: If the symbol is not in the mock data file
+    """
+    mock_data = _read_mock_file(path)
+    mtime = _MOCK_DATA_CACHE[path][0]
+    cached = _MOCK_FRAME_CACHE.get((path, symbol))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    if symbol not in mock_data:
+        raise ValueError(f"Symbol {symbol} not found in mock data")
+    
+    df = pd.DataFrame(mock_data[symbol]['data'])
+    # Convert timestamp to datetime (handle timezone)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+    df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+    
+    _MOCK_FRAME_CACHE[(path, symbol)] = (mtime, df)
+    return df
+
+
+def ohlcv_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Extract OHLCV columns as contiguous float64 NumPy arrays.
+    
+    Detection stages take these once per symbol instead of each re-reading
+    DataFrame columns (and building intermediate Series) on every call.
+    
+    Args:
+        df: DataFrame with OHLCV data
+    
+    Returns:
+        Dictionary mapping each present column ('open', 'high', 'low',
+        'close', 'volume') to its values, in row order
+    """
+    return {
+        column: np.ascontiguousarray(df[column].to_numpy(dtype=np.float64))
+        for column in ('open', 'high', 'low', 'close', 'volume')
+        if column in df.columns
+    }
+
 
 class DataLoader:
     """
@@ -173,25 +257,13 @@ class DataLoader:
                 "Please create mock OHLCV data first."
             )
         
-        # Load JSON file
-        with open(self.mock_data_path, 'r') as f:
-            mock_data = json.load(f)
-        
-        # Get data for this symbol
-        if symbol not in mock_data:
-            raise ValueError(f"Symbol {symbol} not found in mock data")
-        
-        symbol_data = mock_data[symbol]
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(symbol_data['data'])
-        
-        # Convert timestamp to datetime (handle timezone)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+        # Full frame for this symbol (built once, cached until the file changes)
+        full_df = _mock_symbol_frame(self.mock_data_path, symbol)
+        df = full_df
         
-        # Get available data range
-        data_min_date = df['timestamp'].min()
-        data_max_date = df['timestamp'].max()
+        # Get available data range (the cached frame is sorted)
+        data_min_date = df['timestamp'].iloc[0]
+        data_max_date = df['timestamp'].iloc[-1]
         
         # Filter by date range if provided
         # Convert start_date and end_date to timezone-aware if needed
@@ -233,16 +305,14 @@ class DataLoader:
         if len(df) == 0:
             logger.warning(
                 f"No data in requested range for {symbol}. "
-                f"Using most recent {min(730, len(symbol_data['data']))} data points from available range: "
+                f"Using most recent {min(730, len(full_df))} data points from available range: "
                 f"{data_min_date.date()} to {data_max_date.date()}"
             )
             # Use most recent data points (up to 730 days worth)
-            df = pd.DataFrame(symbol_data['data'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
-            df = df.sort_values('timestamp', ascending=False).head(730).sort_values('timestamp').reset_index(drop=True)
+            df = full_df.tail(730)
         
-        # Sort by timestamp
-        df = df.sort_values('timestamp').reset_index(drop=True)
+        # Already sorted by timestamp; copy so callers never share the cached frame
+        df = df.reset_index(drop=True)
         
         # Validate data
         self._validate_data(df, symbol)
@@ -0,0 +1,152 @@
+"""
+In-memory TTL cache for Support/Resistance Agent results.
+
+Why a dedicated cache class?
+- Batch workloads (up to 100 tickers, several parameter sets each) add many entries
+- A flat TTL keeps stale entries around until the cap is hit
+- When the cache fills up, we want to keep the results that were expensive to compute
+
+How it works:
+- Each entry stores (value, inserted_at, cost_seconds), oldest insert first
+- The TTL shrinks linearly once the cache is past its low watermark
+  (pressure = (entries - low) / (max - low), clamped to 0-1)
+- When over capacity, expired entries go first, then the cheapest to recompute
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterator, List, Tuple
+
+
+class TTLCache:
+    """
+    Dictionary-like cache with a pressure-scaled TTL and cost-aware eviction.
+    
+    Effective TTL:
+        ttl * (1 - (1 - min_ttl_fraction) * pressure)
+    
+    - Below the low watermark: full TTL
+    - At capacity: ttl * min_ttl_fraction
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 100,
+        low_watermark: float = 0.5,
+        min_ttl_fraction: float = 0.25
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl_seconds: Base time-to-live in seconds (default: 1 hour)
+            max_entries: Maximum number of entries (default: 100)
+            low_watermark: Fill ratio where the TTL starts shrinking (default: 0.5)
+            min_ttl_fraction: Fraction of the TTL left at capacity (default: 0.25)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.low_watermark = low_watermark
+        self.min_ttl_fraction = min_ttl_fraction
+        
+        # key -> (value, inserted_at, cost_seconds), in insertion order so
+        # expired entries are always at the front
+        self._entries: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        # detect_levels_batch may read and write from several threads
+        self._lock = threading.Lock()
+    
+    def effective_ttl(self) -> float:
+        """Current TTL in seconds, scaled down by memory pressure."""
+        low = self.max_entries * self.low_watermark
+        if self.max_entries <= low:
+            pressure = 1.0 if len(self._entries) >= self.max_entries else 0.0
+        else:
+            pressure = (len(self._entries) - low) / (self.max_entries - low)
+            pressure = max(0.0, min(1.0, pressure))
+        return self.ttl_seconds * (1.0 - (1.0 - self.min_ttl_fraction) * pressure)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Returned if the key is missing or expired
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            
+            value, inserted_at, _ = entry
+            if time.monotonic() - inserted_at >= self.effective_ttl():
+                # Expired - drop it now rather than waiting for eviction
+                del self._entries[key]
+                return default
+            return value
+    
+    def set(self, key: str, value: Any, cost_seconds: float = 0.0) -> None:
+        """
+        Cache a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            cost_seconds: How long the value took to compute (higher = kept longer
+                         when evicting)
+        """
+        with self._lock:
+            self._entries[key] = (value, time.monotonic(), cost_seconds)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._evict()
+    
+    def _evict(self) -> None:
+        """Drop expired entries, then the cheapest entries until under capacity (lock held)."""
+        now = time.monotonic()
+        ttl = self.effective_ttl()
+        # Pop expired entries off the front; stop at the first fresh one
+        while self._entries:
+            _, inserted_at, _ = next(iter(self._entries.values()))
+            if now - inserted_at < ttl:
+                break
+            self._entries.popitem(last=False)
+        
+        excess = len(self._entries) - self.max_entries
+        if excess > 0:
+            # Cheapest to recompute first; oldest first among equal costs
+            # (usually one entry over, so a partial selection instead of a full sort)
+            by_cost = heapq.nsmallest(
+                excess, self._entries, key=lambda k: (self._entries[k][2], self._entries[k][1])
+            )
+            for key in by_cost:
+                del self._entries[key]
+    
+    def keys(self) -> List[str]:
+        """Snapshot of cached keys (including not-yet-evicted expired ones)."""
+        with self._lock:
+            return list(self._entries)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+    
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())